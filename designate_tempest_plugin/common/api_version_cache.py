@@ -0,0 +1,124 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from oslo_log import log as logging
+from oslo_serialization import jsonutils as json
+
+from designate_tempest_plugin.common import cassette
+
+LOG = logging.getLogger(__name__)
+
+_cache = {}
+_lock = threading.Lock()
+_cache_dir = None
+_ttl = 300
+
+
+def configure(cache_dir=None, ttl=300):
+    """Share the cached documents between processes through files.
+
+    :param cache_dir: The directory holding the cache files, or None to keep
+                      the cache in memory only.
+    :param ttl: How long, in seconds, a cache file stays valid.
+    """
+    global _cache_dir, _ttl
+    _cache_dir = cache_dir
+    _ttl = ttl
+
+
+def clear():
+    """Drop the documents cached in memory."""
+    with _lock:
+        _cache.clear()
+
+
+def get(key, fetch, endpoint=None):
+    """Return the API versions document of an endpoint.
+
+    The document is fetched at most once per process and key, and, if a
+    cache directory is configured, at most once per TTL across processes.
+    :param key: A string identifying the DNS API endpoint without resolving
+                it, such as the catalog filters used to look it up, which
+                keys the documents cached in memory.
+    :param fetch: A callable returning a tuple with the response and the raw
+                  body of the versions document, called on a cache miss.
+    :param endpoint: A callable returning the base URL of the endpoint,
+                     which keys the cache files along with key, so that the
+                     runs against other clouds do not share them. It is only
+                     called on a miss of the memory cache, and not at all
+                     while a cassette is replayed, which bypasses the cache
+                     files.
+    :return: A tuple with the response and the raw body.
+    """
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    with _lock:
+        cached = _cache.get(key)
+        if cached is None:
+            path = _file_path(key, endpoint)
+            cached = _read_file(path)
+            if cached is None:
+                cached = fetch()
+                _write_file(path, *cached)
+        _cache[key] = cached
+    return cached
+
+
+def _file_path(key, endpoint):
+    if not _cache_dir or endpoint is None:
+        return None
+    tape = cassette.active()
+    if tape is not None and tape.mode == cassette.REPLAY:
+        return None
+    name = hashlib.sha256(
+        ('%s|%s' % (key, endpoint())).encode('utf-8')).hexdigest()
+    return os.path.join(_cache_dir, 'designate-api-versions-%s.json' % name)
+
+
+def _read_file(path):
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            item = json.load(f)
+        if time.time() - item['time'] > _ttl:
+            return None
+        resp = cassette.Response(item['status'], item['headers'], path)
+        return resp, item['body'].encode('utf-8')
+    except (IOError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, or written in another format.
+        return None
+
+
+def _write_file(path, resp, body):
+    if path is None:
+        return
+    item = {'time': time.time(), 'status': resp.status,
+            'headers': {'content-type': resp.get('content-type')},
+            'body': body.decode('utf-8')}
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_cache_dir)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(item, f)
+        os.replace(tmp_path, path)
+    except (IOError, OSError) as e:
+        LOG.warning('Could not write the API versions cache: %s', e)
@@ -0,0 +1,201 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import atexit
+import base64
+import collections
+import gzip
+import threading
+import time
+
+from oslo_serialization import jsonutils as json
+
+from designate_tempest_plugin.common import exceptions
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+# Response headers that change on every call and are not worth recording.
+_SKIPPED_HEADERS = frozenset(('connection', 'content-length',
+                              'content-location', 'date', 'server', 'status',
+                              'x-openstack-request-id'))
+
+_active = None
+
+
+def use(cassette):
+    """Make the DNS service clients record to or replay from cassette.
+
+    :param cassette: A Cassette, or None to go back to live requests.
+    """
+    global _active
+    _active = cassette
+
+
+def active():
+    """Return the Cassette in use, if any."""
+    return _active
+
+
+class Response(dict):
+    """A replayed, or locally decoded, response mimicking the tempest http
+    response object.
+    """
+
+    def __init__(self, status, headers, url):
+        super(Response, self).__init__(headers)
+        self.status = status
+        self['status'] = str(status)
+        self.reason = None
+        self.version = 11
+        self['content-location'] = url
+
+
+class Cassette(object):
+    """Records DNS API interactions to a file or replays them from it.
+
+    A cassette is a JSON lines file, gzip compressed if its name ends with
+    '.gz', holding one interaction per line. In replay mode, interactions are
+    matched on the HTTP method and the relative URL and are served in the
+    recorded order; the last one of a given request is repeated once the
+    others have been consumed, so that status polling keeps working.
+    """
+
+    def __init__(self, path, mode, replay_latency=False):
+        """
+        :param path: The path of the cassette file.
+        :param mode: Either RECORD or REPLAY.
+        :param replay_latency: In replay mode, sleep for the recorded latency
+                               of each interaction before serving it.
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError('Unknown cassette mode %s' % mode)
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._file = None
+        self._interactions = {}
+
+        if mode == REPLAY:
+            self._load()
+
+    def _open(self, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode + 't', encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def _load(self):
+        interactions = collections.defaultdict(collections.deque)
+        with self._open('r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                if item.get('e') == 'b64':
+                    body = base64.b64decode(item['b'])
+                else:
+                    body = item['b'].encode('utf-8')
+                interactions[(item['m'], item['u'])].append(
+                    (item['s'], item['h'], body, item['l']))
+        self._interactions = dict(interactions)
+
+    def record(self, method, url, resp, resp_body, latency):
+        """Append an interaction to the cassette."""
+        headers = {k: v for k, v in resp.items()
+                   if k not in _SKIPPED_HEADERS}
+        item = {'m': method, 'u': url, 's': resp.status, 'h': headers,
+                'l': round(latency, 6)}
+        try:
+            item['b'] = (resp_body or b'').decode('utf-8')
+        except UnicodeDecodeError:
+            item['b'] = base64.b64encode(resp_body).decode('ascii')
+            item['e'] = 'b64'
+        line = json.dumps(item, separators=(',', ':')) + '\n'
+
+        with self._lock:
+            if self._file is None:
+                self._file = self._open('a')
+                atexit.register(self.close)
+            self._file.write(line)
+            self._file.flush()
+
+    def record_stream(self, method, url, resp, start):
+        """Record a streamed response once its body has been read.
+
+        :param resp: The streamed urllib3 response.
+        :param start: The time.monotonic() the request was sent at.
+        :return: A RecordingResponse to use in place of resp.
+        """
+        return RecordingResponse(self, method, url, resp, start)
+
+    def play(self, method, url):
+        """Serve the next recorded interaction for a request.
+
+        :return: A tuple with the response and the raw response body.
+        :raises CassetteMiss: If no interaction was recorded for the request.
+        """
+        with self._lock:
+            queue = self._interactions.get((method, url))
+            if not queue:
+                raise exceptions.CassetteMiss(method, url, self.path)
+            status, headers, body, latency = (
+                queue.popleft() if len(queue) > 1 else queue[0])
+
+        if self.replay_latency:
+            time.sleep(latency)
+        return Response(status, headers, url), body
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class RecordingResponse(object):
+    """A streamed response teeing its body to a cassette.
+
+    The chunks read with stream() are kept and the interaction is recorded
+    once the body is exhausted. Responses which are not read whole are not
+    recorded. The other attributes are those of the wrapped response, and
+    its headers are available as items.
+    """
+
+    def __init__(self, tape, method, url, resp, start):
+        self._tape = tape
+        self._method = method
+        self._url = url
+        self._resp = resp
+        self._start = start
+
+    def __getattr__(self, name):
+        return getattr(self._resp, name)
+
+    def __getitem__(self, name):
+        # Like the tempest responses, the headers are items.
+        return self._resp.headers[name]
+
+    def stream(self, amt=2 ** 16, decode_content=None):
+        chunks = []
+        for chunk in self._resp.stream(amt, decode_content=decode_content):
+            chunks.append(chunk)
+            yield chunk
+
+        resp = self._resp
+        # The recorded body is the decoded one.
+        headers = {str(k).lower(): v for k, v in resp.headers.items()
+                   if str(k).lower() != 'content-encoding'}
+        self._tape.record(self._method, self._url,
+                          Response(resp.status, headers, self._url),
+                          b''.join(chunks), time.monotonic() - self._start)
@@ -27,3 +27,32 @@ class InvalidStatusError(Exception):
             message = ("{0} with ID {1} returned unexpected status {2}".format(
                 entity, entity_id, status))
         super(InvalidStatusError, self).__init__(message)
+
+
+class CassetteMiss(Exception):
+    """
+    Exception raised when a replayed request was not recorded in a cassette.
+    """
+
+    def __init__(self, method, url, path):
+        message = ("No {0} {1} interaction recorded in cassette {2}".format(
+            method, url, path))
+        super(CassetteMiss, self).__init__(message)
+
+
+class BulkRequestError(Exception):
+    """
+    Exception raised when some of the requests of a bulk operation failed.
+
+    The results of the requests which succeeded are kept in its results
+    attribute, in payload order, so that e.g. the objects already created
+    can be cleaned up, and the exceptions raised by the others in its errors
+    attribute.
+    """
+
+    def __init__(self, results, errors):
+        message = ("{0} of the bulk requests failed, the first with: "
+                   "{1}".format(len(errors), errors[0]))
+        super(BulkRequestError, self).__init__(message)
+        self.results = results
+        self.errors = errors
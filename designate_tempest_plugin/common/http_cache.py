@@ -0,0 +1,154 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import collections
+import re
+import threading
+import time
+import weakref
+
+CacheEntry = collections.namedtuple(
+    'CacheEntry', ['resp', 'body', 'etag', 'last_modified', 'expires'])
+
+# Every ResponseCache, so that writes made through any client invalidate
+# the responses cached by the others.
+_caches = weakref.WeakSet()
+_caches_lock = threading.Lock()
+
+# The ID of the zone a relative URI belongs to, zones/tasks/... excluded.
+_ZONE_ID_RE = re.compile(r'(?:^|/)zones/(?!tasks(?:[/?]|$))([^/?:]+)')
+
+
+def invalidate_all(path):
+    """Drop the responses a write may have changed, from every cache.
+
+    Besides the resource written and its sub-resources, the responses of its
+    zone and of all the zone sub-resources are dropped, as writing e.g. a
+    recordset changes the serial and the status of its zone.
+    :param path: The relative URI of the resource written, without
+                 parameters.
+    """
+    with _caches_lock:
+        caches = list(_caches)
+    if not caches:
+        return
+
+    match = _ZONE_ID_RE.search(path)
+    for cache in caches:
+        cache.invalidate(path)
+        if match is not None:
+            cache.invalidate_segment(match.group(1))
+
+
+class ResponseCache(object):
+    """A thread-safe cache of GET responses, keyed by URI and headers.
+
+    Responses carrying an ETag or a Last-Modified validator are kept until
+    evicted and revalidated with a conditional request every time they are
+    used. The others are served as-is for ttl seconds.
+    """
+
+    def __init__(self, ttl=1.0, maxsize=1024):
+        """
+        :param ttl: How long, in seconds, responses without a validator are
+                    served without asking the server.
+        :param maxsize: The number of responses kept, least recently used
+                        ones are evicted first.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        with _caches_lock:
+            _caches.add(self)
+
+    @staticmethod
+    def make_key(uri, headers=None, extra_headers=False):
+        """Build the key of a request.
+
+        :param uri: The relative URI of the request.
+        :param headers (dict): The headers of the request.
+        :param extra_headers (bool): Whether the default headers are added.
+        :return: A hashable key.
+        """
+        return (uri, extra_headers,
+                tuple(sorted((k.lower(), str(v))
+                             for k, v in (headers or {}).items())))
+
+    def get(self, key):
+        """Return the CacheEntry of a request, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry):
+        """Whether an entry can be used without asking the server."""
+        return (entry.etag is None and entry.last_modified is None and
+                time.monotonic() < entry.expires)
+
+    def put(self, key, resp, body):
+        """Store a response.
+
+        :param key: The key of the request, see make_key.
+        :param resp: The server response.
+        :param body: The raw response body.
+        """
+        entry = CacheEntry(resp, body, resp.get('etag'),
+                           resp.get('last-modified'),
+                           time.monotonic() + self.ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """Drop the responses of a resource and of its sub-resources.
+
+        :param path: The relative URI of the resource, without parameters.
+        """
+        with self._lock:
+            for key in [k for k in self._entries
+                        if k[0] == path or
+                        k[0].startswith(path) and k[0][len(path)] in '/?']:
+                del self._entries[key]
+
+    def invalidate_segment(self, segment):
+        """Drop the responses of the URIs with a given path segment.
+
+        :param segment: A path segment, e.g. the ID of a zone.
+        """
+        with self._lock:
+            for key in [k for k in self._entries
+                        if segment in k[0].split('?', 1)[0].split('/')]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def conditional_headers(entry):
+    """Return the headers revalidating a cached response.
+
+    :param entry: A CacheEntry.
+    :return: A dict with If-None-Match and/or If-Modified-Since.
+    """
+    headers = {}
+    if entry.etag is not None:
+        headers['If-None-Match'] = entry.etag
+    if entry.last_modified is not None:
+        headers['If-Modified-Since'] = entry.last_modified
+    return headers
@@ -0,0 +1,288 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import threading
+import weakref
+
+from tempest.lib.common import http
+import urllib3
+from urllib3 import connectionpool
+
+_active = None
+
+
+def use(pools):
+    """Make the DNS service clients send their requests through pools.
+
+    Only the clients created after the call are affected.
+    :param pools: A ConnectionPools, or None to go back to the tempest
+                  default of one connection per request.
+    """
+    global _active
+    _active = pools
+
+
+def active():
+    """Return the ConnectionPools in use, if any."""
+    return _active
+
+
+class PoolStats(object):
+    """Thread-safe counters of the requests sent over a pool manager."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    @property
+    def reused_connections(self):
+        """The number of requests sent over an already open connection."""
+        return max(0, self.requests - self.new_connections)
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def count_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    def as_dict(self):
+        return {'requests': self.requests,
+                'new_connections': self.new_connections,
+                'reused_connections': self.reused_connections}
+
+
+class _CountingMixin(object):
+    stats = None
+
+    def _new_conn(self):
+        if self.stats is not None:
+            self.stats.count_new_connection()
+        return super(_CountingMixin, self)._new_conn()
+
+    def _make_request(self, *args, **kwargs):
+        if self.stats is not None:
+            self.stats.count_request()
+        return super(_CountingMixin, self)._make_request(*args, **kwargs)
+
+
+class _CountingHTTPConnectionPool(_CountingMixin,
+                                  connectionpool.HTTPConnectionPool):
+    pass
+
+
+class _CountingHTTPSConnectionPool(_CountingMixin,
+                                   connectionpool.HTTPSConnectionPool):
+    pass
+
+
+class _StatusRetriesMixin(object):
+    # Whether urllib3 retries the requests answered with a Retry-After
+    # header, see without_status_retries.
+    status_retries = True
+
+    def urlopen(self, method, url, redirect=True, **kw):
+        retries = kw.get('retries')
+        if not self.status_retries and isinstance(retries, urllib3.Retry):
+            kw['retries'] = retries.new(status_forcelist=None,
+                                        respect_retry_after_header=False)
+        return super(_StatusRetriesMixin, self).urlopen(
+            method, url, redirect=redirect, **kw)
+
+
+class ClosingHttp(_StatusRetriesMixin, http.ClosingHttp):
+    """tempest's ClosingHttp, optionally without status based retries."""
+
+    def __init__(self, disable_ssl_certificate_validation=False,
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 status_retries=True):
+        """
+        :param status_retries: Whether urllib3 retries the requests answered
+                               with a Retry-After header.
+        """
+        super(ClosingHttp, self).__init__(
+            disable_ssl_certificate_validation=(
+                disable_ssl_certificate_validation),
+            ca_certs=ca_certs, timeout=timeout,
+            follow_redirects=follow_redirects)
+        self.status_retries = status_retries
+
+
+def _settings(http_obj):
+    kw = http_obj.connection_pool_kw
+    return (kw.get('cert_reqs') == 'CERT_NONE', kw.get('ca_certs'),
+            kw.get('timeout'), http_obj.follow_redirects)
+
+
+def without_status_retries(http_obj):
+    """Return a pool manager like http_obj, leaving retries to the caller.
+
+    urllib3 retries the idempotent requests answered with a 413, 429 or 503
+    and a Retry-After header up to 10 times on its own, which hides them
+    from a common.retry.RetryPolicy and bypasses its limits.
+    :param http_obj: The pool manager of a client.
+    :return: A pool manager with the same settings which does not retry on
+             response statuses, or http_obj if it goes through a proxy.
+    """
+    if not getattr(http_obj, 'status_retries', True):
+        return http_obj
+    if not isinstance(http_obj, http.ClosingHttp):
+        return http_obj
+    disable_ssl, ca_certs, timeout, follow_redirects = _settings(http_obj)
+    return ClosingHttp(disable_ssl_certificate_validation=disable_ssl,
+                       ca_certs=ca_certs, timeout=timeout,
+                       follow_redirects=follow_redirects,
+                       status_retries=False)
+
+
+class KeepAliveHttp(_StatusRetriesMixin, urllib3.PoolManager):
+    """A drop-in replacement of tempest's ClosingHttp keeping connections.
+
+    tempest's ClosingHttp asks the server to close the connection after each
+    request and drops its pools, so every request pays for a TCP and, over
+    https, a TLS handshake. This pool manager keeps up to maxsize idle
+    connections per host instead, and counts how many requests reused one.
+    """
+
+    def __init__(self, disable_ssl_certificate_validation=False,
+                 ca_certs=None, timeout=None, follow_redirects=True,
+                 maxsize=10, block=False, num_pools=10,
+                 status_retries=True):
+        """
+        :param maxsize: The number of connections kept open per host.
+        :param block: Whether requests wait for a connection of the pool to
+                      be available rather than opening, and then discarding,
+                      an extra one when maxsize connections are in use.
+        :param num_pools: The number of hosts whose pools are kept.
+        :param status_retries: Whether urllib3 retries the requests answered
+                               with a Retry-After header.
+        """
+        self.follow_redirects = follow_redirects
+        self.status_retries = status_retries
+        self.stats = PoolStats()
+        kwargs = {'maxsize': maxsize, 'block': block}
+
+        if disable_ssl_certificate_validation:
+            urllib3.disable_warnings()
+            kwargs['cert_reqs'] = 'CERT_NONE'
+        elif ca_certs:
+            kwargs['cert_reqs'] = 'CERT_REQUIRED'
+            kwargs['ca_certs'] = ca_certs
+
+        if timeout:
+            kwargs['timeout'] = timeout
+
+        super(KeepAliveHttp, self).__init__(num_pools=num_pools, **kwargs)
+        self.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool}
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super(KeepAliveHttp, self)._new_pool(
+            scheme, host, port, request_context=request_context)
+        pool.stats = self.stats
+        return pool
+
+    def request(self, url, method, *args, **kwargs):
+
+        class Response(dict):
+            def __init__(self, info):
+                for key, value in info.getheaders().items():
+                    self[str(key).lower()] = value
+                self.status = info.status
+                self['status'] = str(self.status)
+                self.reason = info.reason
+                self.version = info.version
+                self['content-location'] = url
+
+        if self.follow_redirects:
+            # Follow up to 5 redirections. Don't raise an exception if
+            # it's exceeded but return the HTTP 3XX response instead.
+            retry = urllib3.util.Retry(raise_on_redirect=False, redirect=5)
+        else:
+            # Do not follow redirections. Don't raise an exception if
+            # a redirect is found, but return the HTTP 3XX response instead.
+            retry = urllib3.util.Retry(redirect=False)
+        r = super(KeepAliveHttp, self).request(method, url, retries=retry,
+                                               *args, **kwargs)
+
+        if not kwargs.get('preload_content', True):
+            # The caller streams the body and releases the connection.
+            return r, b''
+        else:
+            return Response(r), r.data
+
+
+class ConnectionPools(object):
+    """Keep-alive pool managers shared by the clients of a credential.
+
+    The clients built from the same credentials share their auth provider,
+    and so their pool manager, as long as they use the same TLS, timeout
+    and redirection settings.
+    """
+
+    def __init__(self, maxsize=10, block=False, num_pools=10):
+        """
+        :param maxsize: The number of connections kept open per host.
+        :param block: Whether requests wait for a free connection rather than
+                      opening an extra one.
+        :param num_pools: The number of hosts whose pools are kept.
+        """
+        self.maxsize = maxsize
+        self.block = block
+        self.num_pools = num_pools
+        self._lock = threading.Lock()
+        self._managers = weakref.WeakKeyDictionary()
+
+    def get(self, auth_provider, http_obj, status_retries=True):
+        """Return the pool manager to use in place of http_obj.
+
+        :param auth_provider: The auth provider of the client.
+        :param http_obj: The ClosingHttp created by the client, whose
+                         settings are carried over.
+        :param status_retries: Whether urllib3 retries the requests answered
+                               with a Retry-After header.
+        :return: A KeepAliveHttp, or http_obj if it goes through a proxy.
+        """
+        if not isinstance(http_obj, http.ClosingHttp):
+            return http_obj
+
+        key = _settings(http_obj) + (status_retries,)
+        with self._lock:
+            managers = self._managers.setdefault(auth_provider, {})
+            manager = managers.get(key)
+            if manager is None:
+                manager = managers[key] = KeepAliveHttp(
+                    disable_ssl_certificate_validation=key[0],
+                    ca_certs=key[1], timeout=key[2],
+                    follow_redirects=key[3], maxsize=self.maxsize,
+                    block=self.block, num_pools=self.num_pools,
+                    status_retries=status_retries)
+        return manager
+
+    def stats(self):
+        """Return the counters summed over every pool manager.
+
+        :return: A dict with the requests, new_connections and
+                 reused_connections counts.
+        """
+        total = PoolStats()
+        with self._lock:
+            managers = [m for ms in self._managers.values()
+                        for m in ms.values()]
+        for manager in managers:
+            total.requests += manager.stats.requests
+            total.new_connections += manager.stats.new_connections
+        return total.as_dict()
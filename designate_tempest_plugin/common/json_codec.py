@@ -0,0 +1,131 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from collections import abc
+
+from oslo_log import log as logging
+from oslo_serialization import jsonutils as json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+LOG = logging.getLogger(__name__)
+
+
+class OsloJsonCodec(object):
+    """The default codec, based on oslo.serialization."""
+
+    name = 'oslo'
+
+    def dumps(self, data):
+        return json.dumps(data)
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(object):
+    """A faster codec, based on the optional orjson library."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('The orjson JSON codec requires the orjson '
+                              'library to be installed')
+
+    def dumps(self, data):
+        return orjson.dumps(data, default=json.to_primitive).decode('utf-8')
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+CODECS = {
+    OsloJsonCodec.name: OsloJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+_active = OsloJsonCodec()
+
+
+def use(codec):
+    """Make codec the JSON codec of the DNS service clients.
+
+    :param codec: A codec instance, e.g. OrjsonCodec().
+    """
+    global _active
+    _active = codec
+
+
+def active():
+    """Return the JSON codec in use."""
+    return _active
+
+
+def get_codec(name):
+    """Return a codec instance by name.
+
+    The default codec is returned, with a warning, if the requested one
+    cannot be loaded.
+    """
+    try:
+        return CODECS[name]()
+    except (KeyError, ImportError) as e:
+        LOG.warning('Cannot use the %s JSON codec, falling back to %s: %s',
+                    name, OsloJsonCodec.name, e)
+        return OsloJsonCodec()
+
+
+class LazyBody(abc.Mapping):
+    """A JSON object body decoded on first access.
+
+    Bodies that are never read, e.g. the ones of list responses only checked
+    for their status code, are never decoded.
+    """
+
+    __slots__ = ('_codec', '_raw', '_data')
+
+    def __init__(self, codec, raw):
+        self._codec = codec
+        self._raw = raw
+        self._data = None
+
+    @property
+    def data(self):
+        """The decoded body."""
+        if self._data is None:
+            self._data = self._codec.loads(self._raw)
+            self._raw = None
+        return self._data
+
+    @property
+    def decoded(self):
+        """Whether the body was already decoded."""
+        return self._data is not None
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        if self._data is None:
+            return '<LazyBody (%d bytes, not decoded)>' % len(self._raw)
+        return repr(self._data)
@@ -0,0 +1,167 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import codecs
+import json
+import re
+
+_SPECIALS = re.compile(r'[\[\]{}"]')
+_STRING_SPECIALS = re.compile(r'["\\]')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_HEAD = 0
+_ITEMS = 1
+_TAIL = 2
+
+
+class ArrayStreamParser(object):
+    """Incrementally extracts the items of an array of a JSON document.
+
+    The parser is fed the raw bytes of a JSON object as they arrive and
+    decodes every item of its top-level ``key`` array as soon as the item is
+    complete, e.g. every recordset of a list response. Only the text of the
+    item being received is buffered, along with the rest of the document,
+    which is decoded on close() with an empty array in place of the items.
+    Items are decoded with the C scanner of the json module.
+    """
+
+    def __init__(self, key, loads=json.loads):
+        """
+        :param key: The top-level key of the array, e.g. 'recordsets'.
+        :param loads: The callable decoding the rest of the document.
+        """
+        self.key = key
+        self._key_re = re.compile(r'"%s"\s*:\s*$' % re.escape(key))
+        self._loads = loads
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._text = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._phase = _HEAD
+        self._head = None
+        self._scanned = 0
+        self._tail = []
+
+    def feed(self, data):
+        """Feed the next chunk of the document.
+
+        :param data: The next bytes of the document.
+        :return: A list of the items completed by this chunk.
+        """
+        text = self._decoder.decode(data)
+        if self._phase == _TAIL:
+            self._tail.append(text)
+            return []
+
+        self._text = self._text[self._pos:] + text
+        self._pos = 0
+        if self._phase == _HEAD:
+            self._scan_head()
+        if self._phase == _ITEMS:
+            return self._scan_items()
+        return []
+
+    def _scan_head(self):
+        # Look for the array, at depth 1, skipping over strings.
+        text = self._text
+        pos = self._scanned
+        end = len(text)
+        while pos < end:
+            if self._in_string:
+                match = _STRING_SPECIALS.search(text, pos)
+                if match is None:
+                    pos = end
+                    break
+                if match.group() == '\\':
+                    if match.end() >= end:
+                        # The escaped character has not arrived yet.
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = _SPECIALS.search(text, pos)
+            if match is None:
+                pos = end
+                break
+            char = match.group()
+            pos = match.end()
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                if (char == '[' and self._depth == 1 and
+                        self._key_re.search(text, 0, match.start())):
+                    self._head = text[:match.start()]
+                    self._text = text[pos:]
+                    self._phase = _ITEMS
+                    return
+                self._depth += 1
+            else:
+                self._depth -= 1
+        # The text is kept whole until the array is found.
+        self._scanned = pos
+
+    def _scan_items(self):
+        items = []
+        text = self._text
+        end = len(text)
+        pos = self._pos
+        while True:
+            pos = _WHITESPACE.match(text, pos).end()
+            if pos >= end:
+                break
+            if text[pos] == ']':
+                self._phase = _TAIL
+                self._tail.append(text[pos + 1:])
+                self._text = ''
+                self._pos = 0
+                return items
+            if text[pos] == ',':
+                pos += 1
+                continue
+            try:
+                item, item_end = self._raw_decode(text, pos)
+            except ValueError:
+                # The item has not fully arrived yet.
+                break
+            # A number could be cut short by the chunk boundary, only accept
+            # an item once the separator following it has arrived.
+            sep = _WHITESPACE.match(text, item_end).end()
+            if sep >= end:
+                break
+            if text[sep] not in ',]':
+                raise ValueError('Invalid JSON document, unexpected %r in '
+                                 'the %s array' % (text[sep], self.key))
+            items.append(item)
+            pos = sep
+        self._pos = pos
+        return items
+
+    def close(self):
+        """Decode the rest of the document once all of it was fed.
+
+        :return: The document, with an empty array in place of the items.
+        :raises ValueError: If the document is incomplete.
+        """
+        self._decoder.decode(b'', final=True)
+        if self._phase == _ITEMS:
+            raise ValueError('Truncated JSON document, the %s array is not '
+                             'terminated' % self.key)
+        if self._phase == _HEAD:
+            return self._loads(self._text)
+        return self._loads(self._head + '[]' + ''.join(self._tail))
@@ -0,0 +1,208 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import abc
+import atexit
+import collections
+import re
+import threading
+
+from oslo_serialization import jsonutils as json
+
+_UUID_RE = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+    r'[0-9a-fA-F]{12}')
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, float('inf'))
+
+# response_bytes is the size of the decoded body and wire_bytes the size
+# received over the network, when it differs (e.g. gzip encoded responses).
+RequestSample = collections.namedtuple(
+    'RequestSample', ['method', 'template', 'status', 'request_bytes',
+                      'response_bytes', 'latency', 'retries', 'queue_delay',
+                      'wire_bytes'],
+    defaults=(0, 0.0, None))
+
+_observers = []
+_observers_lock = threading.Lock()
+
+
+def resource_template(url):
+    """Normalize a request URL into a resource template.
+
+    The query string is dropped and every UUID is replaced with ``{id}``, so
+    that e.g. ``v2/zones/<uuid>/recordsets?limit=5`` becomes
+    ``v2/zones/{id}/recordsets``.
+    """
+    return _UUID_RE.sub('{id}', url.split('?', 1)[0])
+
+
+def add_observer(observer):
+    """Register an observer notified of every DNS API request."""
+    with _observers_lock:
+        _observers.append(observer)
+
+
+def remove_observer(observer):
+    """Unregister an observer registered with add_observer."""
+    with _observers_lock:
+        _observers.remove(observer)
+
+
+def add_jsonl_observer(path):
+    """Register a JsonLinesObserver for path, unless one already is.
+
+    The observer is closed, writing its buffered samples, when the process
+    exits.
+    """
+    with _observers_lock:
+        for observer in _observers:
+            if (isinstance(observer, JsonLinesObserver) and
+                    observer.path == path):
+                return observer
+        observer = JsonLinesObserver(path)
+        _observers.append(observer)
+        atexit.register(observer.close)
+        return observer
+
+
+def has_observers():
+    return bool(_observers)
+
+
+def notify(sample):
+    """Hand a RequestSample to every registered observer."""
+    for observer in list(_observers):
+        observer.observe(sample)
+
+
+class RequestObserver(object, metaclass=abc.ABCMeta):
+    """Base class of the request observers."""
+
+    @abc.abstractmethod
+    def observe(self, sample):
+        """Record a RequestSample."""
+
+
+class HistogramObserver(RequestObserver):
+    """Keeps an in-memory latency histogram per method and template."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def observe(self, sample):
+        key = (sample.method, sample.template)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = {
+                    'count': 0, 'sum': 0.0, 'min': None, 'max': 0.0,
+                    'bytes': 0, 'wire_bytes': 0, 'retries': 0,
+                    'queue_delay': 0.0,
+                    'statuses': collections.Counter(),
+                    'buckets': [0] * len(self.buckets)}
+            stats['count'] += 1
+            stats['sum'] += sample.latency
+            stats['max'] = max(stats['max'], sample.latency)
+            if stats['min'] is None or sample.latency < stats['min']:
+                stats['min'] = sample.latency
+            stats['bytes'] += sample.response_bytes
+            stats['wire_bytes'] += (sample.response_bytes
+                                    if sample.wire_bytes is None
+                                    else sample.wire_bytes)
+            stats['retries'] += sample.retries
+            stats['queue_delay'] += sample.queue_delay
+            stats['statuses'][sample.status] += 1
+            for i, bound in enumerate(self.buckets):
+                if sample.latency <= bound:
+                    stats['buckets'][i] += 1
+                    break
+
+    def percentile(self, method, template, percent):
+        """Estimate a latency percentile from the histogram buckets.
+
+        :return: The upper bound of the bucket holding the percentile, or
+                 None if nothing was recorded for the endpoint.
+        """
+        with self._lock:
+            stats = self._stats.get((method, template))
+            if not stats:
+                return None
+            rank = stats['count'] * percent / 100.0
+            seen = 0
+            for bound, count in zip(self.buckets, stats['buckets']):
+                seen += count
+                if seen >= rank:
+                    return min(bound, stats['max'])
+            return stats['max']
+
+    def summary(self):
+        """Return a copy of the statistics, keyed by (method, template)."""
+        with self._lock:
+            return {key: dict(stats, statuses=dict(stats['statuses']),
+                              buckets=list(stats['buckets']))
+                    for key, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class JsonLinesObserver(RequestObserver):
+    """Appends every sample as a JSON object line to a file.
+
+    The file is opened once and the lines are buffered, then appended
+    FLUSH_LINES at a time with a single write, so that the lines of the
+    processes sharing the file do not interleave. close() writes the lines
+    left in the buffer.
+    """
+
+    FLUSH_LINES = 100
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._lines = []
+        self._file = None
+
+    def observe(self, sample):
+        line = json.dumps(sample._asdict()) + '\n'
+        with self._lock:
+            self._lines.append(line)
+            if len(self._lines) >= self.FLUSH_LINES:
+                self._flush()
+
+    def flush(self):
+        """Append the buffered lines to the file."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        """Append the buffered lines to the file and close it."""
+        with self._lock:
+            self._flush()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _flush(self):
+        if not self._lines:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'ab', buffering=0)
+        self._file.write(''.join(self._lines).encode('utf-8'))
+        self._lines = []
@@ -13,10 +13,45 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from collections import abc
+import io
+import sys
+
+from designate_tempest_plugin.common import zonefile_parser
+
+# Marks the fields absent from the API object.
+_UNSET = object()
+
+
+def _text_writer(fileobj):
+    """Return a function writing strings to a text or binary file object.
+
+    The first string is written as is, and, if the file rejects it with a
+    TypeError, as UTF-8 encoded bytes, like every following one.
+    """
+    write = None
+
+    def writer(text):
+        nonlocal write
+        if write is None:
+            try:
+                fileobj.write(text)
+            except TypeError:
+                def write(data):
+                    fileobj.write(data.encode('utf-8'))
+            else:
+                write = fileobj.write
+                return
+        write(text)
+
+    return writer
 
 
 class ZoneFile(object):
 
+    # The number of records formatted at once by write_to.
+    WRITE_BATCH_SIZE = 1024
+
     def __init__(self, origin, ttl, records):
         self.origin = origin
         self.ttl = ttl
@@ -34,54 +69,127 @@ class ZoneFile(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def to_text(self):
+        """Return the zone file contents as a string."""
+        buf = io.StringIO()
+        self.write_to(buf)
+        return buf.getvalue()
+
+    def write_to(self, fileobj):
+        """Write the zone file contents to a file-like object.
+
+        The records are formatted and written in batches, so records
+        generated on the fly (e.g. from a generator) are never all held in
+        memory.
+        :param fileobj: A text or binary file-like object. Whether it takes
+                        strings or UTF-8 encoded bytes is found out on the
+                        first write.
+        :return: The number of records written.
+        """
+        write = _text_writer(fileobj)
+
+        header = ''
+        if self.origin:
+            header += '$ORIGIN %s\n' % self.origin
+        if self.ttl is not None:
+            header += '$TTL %s\n' % self.ttl
+        if header:
+            write(header)
+
+        count = 0
+        batch = []
+        for record in self.records:
+            batch.append('%s IN %s %s\n' % (
+                record.name, record.type, record.data))
+            if len(batch) == self.WRITE_BATCH_SIZE:
+                write(''.join(batch))
+                count += len(batch)
+                batch.clear()
+        if batch:
+            write(''.join(batch))
+            count += len(batch)
+        return count
+
     @classmethod
     def from_text(cls, text):
         """Return a ZoneFile from a string containing the zone file contents"""
-        # filter out empty lines and strip all leading/trailing whitespace.
-        # this assumes no multiline records
-        lines = [x.strip() for x in text.split('\n') if x.strip()]
-
-        assert lines[0].startswith('$ORIGIN')
-
-        # Handle zone files with and without $TTL directive
-        if lines[1].startswith('$TTL'):
-            # New format with $TTL directive
-            ttl = int(lines[1].split(' ')[1])
-            record_start = 2
-        else:
-            # Old format without $TTL directive
-            ttl = None
-            record_start = 1
-
-        return ZoneFile(
-            origin=lines[0].split(' ')[1],
-            ttl=ttl,
-            records=[ZoneFileRecord.from_text(x)
-                     for x in lines[record_start:]],
-        )
+        return cls.from_stream(text)
+
+    @classmethod
+    def from_stream(cls, source, **kwargs):
+        """Return a ZoneFile from a zone file source.
+
+        :param source: A string, bytes, a text or binary file-like object, an
+                       iterable of string or UTF-8 bytes chunks, or a
+                       common.zonefile_mmap.MappedZoneFile.
+        :param kwargs: See common.zonefile_parser.ZoneFileParser.
+        """
+        parser = zonefile_parser.ZoneFileParser(source, **kwargs)
+        records = [ZoneFileRecord(name=name, type=rtype, data=data)
+                   for name, _ttl, rtype, data in parser]
+        return cls(origin=parser.zone_origin, ttl=parser.zone_ttl,
+                   records=records)
+
+    @staticmethod
+    def iter_records(source, **kwargs):
+        """Lazily parse the records of a zone file source.
+
+        Unlike from_stream, the records are never held in memory together.
+        :param source: See from_stream.
+        :param kwargs: See common.zonefile_parser.ZoneFileParser.
+        :return: A generator of ZoneFileRecord.
+        """
+        for name, _ttl, rtype, data in zonefile_parser.ZoneFileParser(
+                source, **kwargs):
+            yield ZoneFileRecord(name=name, type=rtype, data=data)
 
 
 class ZoneFileRecord(object):
+    """An immutable record of a zone file.
+
+    Records are slotted, their name and type are interned, as both repeat
+    across records, and their hash is computed once, so that large sets of
+    records stay compact and fast to compare.
+    """
+
+    __slots__ = ('name', 'type', 'data', '_hash')
 
     def __init__(self, name, type, data):
-        self.name = str(name)
-        self.type = str(type)
-        self.data = str(data)
+        name = sys.intern(str(name))
+        type = sys.intern(str(type))
+        data = str(data)
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'type', type)
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, '_hash', hash((name, type, data)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('ZoneFileRecord objects are read-only')
+
+    def __delattr__(self, name):
+        raise AttributeError('ZoneFileRecord objects are read-only')
+
+    def __reduce__(self):
+        return type(self), (self.name, self.type, self.data)
 
     def __str__(self):
-        return str(self.__dict__)
+        return str({'name': self.name, 'type': self.type, 'data': self.data})
 
     def __repr__(self):
         return str(self)
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, ZoneFileRecord):
+            return NotImplemented
+        return (self._hash == other._hash and self.name == other.name and
+                self.type == other.type and self.data == other.data)
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return self._hash
 
     @classmethod
     def from_text(cls, text):
@@ -90,18 +198,105 @@ class ZoneFileRecord(object):
             mydomain.com. IN NS ns1.example.com.
             mydomain.com. 3600 IN NS ns1.example.com.
         """
-        parts = text.split(None, 4)
-
-        # Check if second field is numeric (inline TTL)
-        if len(parts) >= 5 and parts[1].isdigit():
-            name, _ttl, rclass, rtype, data = parts
-        elif len(parts) >= 4:
-            name = parts[0]
-            rclass = parts[1]
-            rtype = parts[2]
-            data = parts[3] if len(parts) == 4 else ' '.join(parts[3:])
-        else:
-            raise ValueError(f"Unexpected record format: {text}")
-
-        assert rclass == 'IN'
-        return cls(name=name, type=rtype, data=data)
+        for name, _ttl, rtype, data in zonefile_parser.ZoneFileParser(text):
+            return cls(name=name, type=rtype, data=data)
+        raise ValueError(f"Unexpected record format: {text}")
+
+
+class SlottedResource(abc.Mapping):
+    """A compact, read-only view of an API object.
+
+    The known fields are stored in slots rather than in a dict, the values
+    repeated across many objects (e.g. statuses and project IDs) are
+    interned and the 'links' self reference is dropped. Unknown fields are
+    kept in a side dict. Objects behave as read-only mappings and to_dict()
+    returns a plain, mutable dict.
+    """
+
+    __slots__ = ('_extra',)
+
+    # The names of the fields stored in slots.
+    FIELDS = ()
+    # The names of the fields whose string values are interned.
+    INTERNED = frozenset()
+    # The names of the fields dropped from the API object.
+    DROPPED = frozenset(['links'])
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an object from a decoded API object."""
+        obj = cls.__new__(cls)
+        extra = None
+        for key, value in data.items():
+            if key in cls.DROPPED:
+                continue
+            if key not in cls.FIELDS:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            if key in cls.INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            elif isinstance(value, list):
+                value = tuple(value)
+            object.__setattr__(obj, key, value)
+        for key in cls.FIELDS:
+            if not hasattr(obj, key):
+                object.__setattr__(obj, key, _UNSET)
+        object.__setattr__(obj, '_extra', extra)
+        return obj
+
+    def __setattr__(self, name, value):
+        raise AttributeError('%s objects are read-only' %
+                             type(self).__name__)
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not _UNSET:
+                return list(value) if isinstance(value, tuple) else value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.FIELDS:
+            if getattr(self, key) is not _UNSET:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.to_dict())
+
+    def to_dict(self):
+        """Return the object as a plain dict, without the 'links'."""
+        return {key: self[key] for key in self}
+
+
+class Zone(SlottedResource):
+    """A zone returned by the zones API, see SlottedResource."""
+
+    FIELDS = ('id', 'pool_id', 'project_id', 'name', 'email', 'description',
+              'ttl', 'serial', 'status', 'action', 'version', 'attributes',
+              'type', 'masters', 'created_at', 'updated_at',
+              'transferred_at', 'shared')
+    INTERNED = frozenset(['pool_id', 'project_id', 'status', 'action',
+                          'type'])
+
+    __slots__ = FIELDS
+
+
+class Recordset(SlottedResource):
+    """A recordset returned by the recordsets API, see SlottedResource."""
+
+    FIELDS = ('id', 'project_id', 'zone_id', 'zone_name', 'name', 'type',
+              'ttl', 'records', 'description', 'status', 'action', 'version',
+              'created_at', 'updated_at')
+    INTERNED = frozenset(['project_id', 'zone_id', 'zone_name', 'type',
+                          'status', 'action'])
+
+    __slots__ = FIELDS
@@ -0,0 +1,166 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import fnmatch
+import threading
+import time
+
+_active = None
+
+
+def use(limiter):
+    """Make the DNS service clients go through limiter before each request.
+
+    :param limiter: A RateLimiter, or None to disable rate limiting.
+    """
+    global _active
+    _active = limiter
+
+
+def active():
+    """Return the RateLimiter in use, if any."""
+    return _active
+
+
+class TokenBucket(object):
+    """A thread-safe token bucket.
+
+    Tokens are added at a constant rate up to the burst size, and every
+    request takes one, waiting for it if the bucket is empty. Waiting
+    requests reserve their token while holding the lock and sleep outside
+    of it, so they are served in order at exactly the configured rate.
+    """
+
+    def __init__(self, rate, burst=1):
+        """
+        :param rate: The number of tokens added per second.
+        :param burst: The maximum number of tokens held by the bucket.
+        """
+        if rate <= 0:
+            raise ValueError('The rate of a token bucket must be positive')
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self.requests = 0
+        self.delayed = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+
+    def acquire(self):
+        """Take a token, waiting for one if needed.
+
+        :return: The time spent waiting, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests += 1
+            if delay:
+                self.delayed += 1
+                self.total_delay += delay
+                self.max_delay = max(self.max_delay, delay)
+
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def stats(self):
+        """Return the queueing delay statistics of the bucket."""
+        with self._lock:
+            return {'rate': self.rate,
+                    'burst': self.burst,
+                    'requests': self.requests,
+                    'delayed': self.delayed,
+                    'total_delay': self.total_delay,
+                    'max_delay': self.max_delay,
+                    'mean_delay': (self.total_delay / self.requests
+                                   if self.requests else 0.0)}
+
+
+class RateLimiter(object):
+    """Applies token buckets to the DNS API requests.
+
+    A rule targets either a client class, by name, or resource templates (as
+    built by metrics.resource_template), by shell-style pattern. A request is
+    limited by the first rule it matches, through a bucket shared by every
+    client of the same credential, or by all clients if the rule is not per
+    credential.
+    """
+
+    def __init__(self):
+        self._rules = []
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def add_rule(self, rate, burst=1, client_class=None, template=None,
+                 per_credential=True):
+        """Add a rule, matched after the ones already added.
+
+        :param rate: The allowed number of requests per second.
+        :param burst: The number of requests allowed at once.
+        :param client_class: The name of the client class to limit,
+                             e.g. 'ZonesClient'.
+        :param template: A shell-style pattern of the resource templates to
+                         limit, e.g. 'v2/zones/{id}/recordsets*'.
+        :param per_credential: Whether each credential gets its own bucket.
+        """
+        if (client_class is None) == (template is None):
+            raise ValueError('A rate limit rule needs either a client class '
+                             'or a template')
+        self._rules.append((client_class, template, rate, burst,
+                            per_credential))
+
+    def acquire(self, client, template):
+        """Wait for the bucket of the first rule matching a request.
+
+        :param client: The client sending the request.
+        :param template: The resource template of the request.
+        :return: The time spent waiting, in seconds.
+        """
+        class_name = type(client).__name__
+        for index, rule in enumerate(self._rules):
+            client_class, pattern, rate, burst, per_credential = rule
+            if client_class is not None and client_class != class_name:
+                continue
+            if pattern is not None and not fnmatch.fnmatchcase(template,
+                                                               pattern):
+                continue
+            key = (index,
+                   id(client.auth_provider) if per_credential else None)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                with self._lock:
+                    bucket = self._buckets.setdefault(
+                        key, TokenBucket(rate, burst))
+            return bucket.acquire()
+        return 0.0
+
+    def stats(self):
+        """Return the queueing delay statistics of every bucket.
+
+        :return: A dict keyed by the client class or template of the rule,
+                 then by the id of the credential (None if shared).
+        """
+        result = {}
+        for (index, credential), bucket in list(self._buckets.items()):
+            client_class, pattern = self._rules[index][:2]
+            result.setdefault(client_class or pattern, {})[credential] = (
+                bucket.stats())
+        return result
@@ -0,0 +1,138 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+
+def _name_type_key(name, type_):
+    name = name.lower()
+    if not name.endswith('.'):
+        name += '.'
+    return name, type_.upper()
+
+
+class RecordsetIndex(object):
+    """An in-memory index of recordsets.
+
+    Recordsets, either dicts or common.models.Recordset objects, are looked
+    up in constant time by ID, by (name, type) and by zone ID. The index is
+    built from a listing and kept up to date with the bodies returned by
+    the create, update and delete calls, e.g.::
+
+        index = RecordsetIndex.from_listing(
+            recordset_client.iter_recordsets(zone_id))
+        _, body = recordset_client.create_recordset(zone_id, data)
+        index.apply(body)
+        index.find('www.example.org.', 'A')
+    """
+
+    def __init__(self):
+        self._by_id = {}
+        self._by_name_type = {}
+        self._by_zone = {}
+
+    @classmethod
+    def from_listing(cls, recordsets):
+        """Build an index from an iterable of recordsets.
+
+        :param recordsets: Recordsets, e.g. from RecordsetClient
+                           iter_recordsets or iter_zones_recordsets, whose
+                           pages are then indexed as they arrive.
+        :return: A RecordsetIndex.
+        """
+        index = cls()
+        for recordset in recordsets:
+            index.add(recordset)
+        return index
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, recordset_id):
+        return recordset_id in self._by_id
+
+    def add(self, recordset):
+        """Add a recordset, replacing the one with the same ID if any."""
+        recordset_id = recordset['id']
+        if recordset_id in self._by_id:
+            self.remove(recordset_id)
+
+        self._by_id[recordset_id] = recordset
+        self._by_name_type.setdefault(
+            _name_type_key(recordset['name'], recordset['type']),
+            {})[recordset_id] = recordset
+        self._by_zone.setdefault(
+            recordset.get('zone_id'), {})[recordset_id] = recordset
+
+    def remove(self, recordset_id):
+        """Remove a recordset.
+
+        :param recordset_id: The ID of the recordset.
+        :return: The removed recordset, or None if it was not indexed.
+        """
+        recordset = self._by_id.pop(recordset_id, None)
+        if recordset is None:
+            return None
+
+        for mapping, key in (
+                (self._by_name_type,
+                 _name_type_key(recordset['name'], recordset['type'])),
+                (self._by_zone, recordset.get('zone_id'))):
+            bucket = mapping[key]
+            del bucket[recordset_id]
+            if not bucket:
+                del mapping[key]
+        return recordset
+
+    def apply(self, recordset):
+        """Update the index from the body of a create, update or delete call.
+
+        Recordsets whose action is DELETE are removed, the others are added
+        or replaced.
+        :param recordset: The recordset returned by the API.
+        """
+        if recordset.get('action') == 'DELETE':
+            self.remove(recordset['id'])
+        else:
+            self.add(recordset)
+
+    def get(self, recordset_id):
+        """Return the recordset with the given ID, or None."""
+        return self._by_id.get(recordset_id)
+
+    def find(self, name, type_, zone_id=None):
+        """Return the recordset with the given name and type, or None.
+
+        :param name: The name of the recordset. The trailing dot is optional
+                     and the case is ignored.
+        :param type_: The type of the recordset, e.g. 'A'.
+        :param zone_id: The ID of the zone of the recordset, when the same
+                        name exists in several zones (e.g. of different
+                        projects).
+        """
+        bucket = self._by_name_type.get(_name_type_key(name, type_), {})
+        for recordset in bucket.values():
+            if zone_id is None or recordset.get('zone_id') == zone_id:
+                return recordset
+        return None
+
+    def find_all(self, name, type_):
+        """Return every recordset with the given name and type."""
+        return list(
+            self._by_name_type.get(_name_type_key(name, type_), {}).values())
+
+    def by_zone(self, zone_id):
+        """Return the recordsets of the given zone."""
+        return list(self._by_zone.get(zone_id, {}).values())
@@ -0,0 +1,111 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import email.utils
+import random
+import time
+
+IDEMPOTENT_METHODS = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+RETRY_STATUSES = frozenset((429, 503))
+
+_active = None
+
+
+def use(policy):
+    """Make policy the retry policy of the DNS service clients.
+
+    :param policy: A RetryPolicy, or None to disable retries. A client
+                   retry_policy attribute takes precedence over it.
+
+    urllib3 retries the requests answered with a Retry-After header on its
+    own, except for the clients created while a policy applies to them,
+    which leave every retry to the policy.
+    """
+    global _active
+    _active = policy
+
+
+def active():
+    """Return the RetryPolicy in use, if any."""
+    return _active
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header, given in seconds or as an HTTP date.
+
+    :return: The delay in seconds, or None if the value cannot be parsed.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryPolicy(object):
+    """Decides whether, and after how long, a response is retried.
+
+    Responses with a retryable status are retried after the delay given by
+    their Retry-After header if any, or else after an exponential backoff
+    with full jitter.
+    """
+
+    def __init__(self, max_retries=3, backoff=0.5, max_backoff=30.0,
+                 statuses=RETRY_STATUSES, methods=IDEMPOTENT_METHODS,
+                 jitter=True):
+        """
+        :param max_retries: The maximum number of retries of a request.
+        :param backoff: The base delay, in seconds, of the backoff.
+        :param max_backoff: The maximum delay, in seconds, between attempts.
+        :param statuses: The HTTP statuses that are retried.
+        :param methods: The HTTP methods that are retried. Only idempotent
+                        ones are retried by default.
+        :param jitter: Whether the backoff delay is randomized.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.jitter = jitter
+
+    def delay(self, method, resp, retries):
+        """Return the delay before retrying a request.
+
+        :param method: The HTTP method of the request.
+        :param resp: The response received for the request, either a tempest
+                     response, whose headers are items, or a streamed
+                     urllib3 response.
+        :param retries: The number of retries already done.
+        :return: The delay in seconds, or None if it is not to be retried.
+        """
+        if (retries >= self.max_retries or
+                method.upper() not in self.methods or
+                resp.status not in self.statuses):
+            return None
+
+        headers = getattr(resp, 'headers', resp)
+        retry_after = parse_retry_after(headers.get('retry-after'))
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        delay = min(self.backoff * 2 ** retries, self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
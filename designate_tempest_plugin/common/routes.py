@@ -0,0 +1,70 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import functools
+import re
+from urllib import parse as urllib_parse
+
+_UUID_RE = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+    r'[0-9a-fA-F]{12}')
+
+
+class Route(object):
+    """A pre-compiled relative URI of a REST resource."""
+
+    __slots__ = ('base',)
+
+    def __init__(self, prefix, resource):
+        """
+        :param prefix: The URI prefix of the API, e.g., 'v2'.
+        :param resource: The name of the REST resource, e.g., 'zones'.
+        """
+        self.base = '%s/%s' % (prefix, resource)
+
+    def build(self, uuid=None, params=None, uuid_prefix_char=None,
+              ids=()):
+        """Build the URI of the resource or of one of its objects.
+
+        See DnsClientBase.get_uri for the meaning of the parameters.
+        :param ids: The IDs substituted, in order, for the ``{}`` fields of
+                    a resource template, see split_ids.
+        :returns: Relative URI for the resource or object.
+        """
+        uri = self.base.format(*ids) if ids else self.base
+        if uuid:
+            uri += (uuid_prefix_char or '/') + '%s' % uuid
+        if params:
+            uri += '?' + urllib_parse.urlencode(params)
+        return uri
+
+
+def split_ids(resource):
+    """Split the UUIDs out of a resource name.
+
+    e.g. ``zones/<uuid>/recordsets`` is split into ``zones/{}/recordsets``
+    and ``(<uuid>,)``, so that the routes are cached per template rather
+    than per object.
+    :param resource: The name of the REST resource.
+    :returns: A tuple with the resource template and the tuple of its IDs.
+    """
+    ids = tuple(_UUID_RE.findall(resource))
+    if not ids:
+        return resource, ids
+    return _UUID_RE.sub('{}', resource), ids
+
+
+@functools.lru_cache(maxsize=1024)
+def get_route(prefix, resource):
+    """Return the cached Route of a resource or resource template."""
+    return Route(prefix, resource)
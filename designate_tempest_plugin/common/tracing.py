@@ -0,0 +1,123 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import contextlib
+import functools
+import os
+import threading
+import time
+
+from oslo_serialization import jsonutils as json
+
+_active = None
+
+
+def use(tracer):
+    """Make the DNS clients, waiters and query clients record to tracer.
+
+    :param tracer: A Tracer, or None to stop tracing.
+    """
+    global _active
+    _active = tracer
+
+
+def active():
+    """Return the Tracer in use, if any."""
+    return _active
+
+
+def traced(category, name=None):
+    """A decorator recording every call of a function as a trace event.
+
+    :param category: The category of the events, e.g. 'wait'.
+    :param name: The name of the events, the function name by default.
+    """
+
+    def decorator(f):
+        event_name = name or f.__name__
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            tracer = _active
+            if tracer is None:
+                return f(*args, **kwargs)
+            with tracer.span(event_name, category):
+                return f(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class Tracer(object):
+    """Records timed events in the Chrome trace event format.
+
+    Every event is a "complete" event on the track of the thread it ran on,
+    so that the file written by write() shows, on a timeline, the API calls,
+    waits and DNS queries of each thread. It can be loaded in chrome://tracing
+    or https://ui.perfetto.dev.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = []
+        self._threads = set()
+        self._pid = os.getpid()
+
+    def complete(self, name, category, start, end, args=None):
+        """Record an event.
+
+        :param name: The name of the event, e.g. 'GET v2/zones/{id}'.
+        :param category: The category of the event, e.g. 'api'.
+        :param start: The start of the event, from time.monotonic().
+        :param end: The end of the event, from time.monotonic().
+        :param args: A dict of details shown with the event.
+        """
+        thread = threading.current_thread()
+        event = {'name': name, 'cat': category, 'ph': 'X',
+                 'ts': start * 1e6, 'dur': (end - start) * 1e6,
+                 'pid': self._pid, 'tid': thread.ident}
+        if args:
+            event['args'] = args
+
+        with self._lock:
+            if thread.ident not in self._threads:
+                self._threads.add(thread.ident)
+                self._events.append({
+                    'name': 'thread_name', 'ph': 'M', 'pid': self._pid,
+                    'tid': thread.ident, 'args': {'name': thread.name}})
+            self._events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name, category, args=None):
+        """Record the time spent in a with block as an event."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, time.monotonic(), args)
+
+    def write(self, path):
+        """Write the recorded events to a JSON trace file.
+
+        :param path: The path of the file, created with its directory if
+                     needed.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            document = {'traceEvents': list(self._events),
+                        'displayTimeUnit': 'ms'}
+        with open(path, 'w') as f:
+            json.dump(document, f)
@@ -0,0 +1,97 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import zlib
+
+# The size of the chunks read from file-like and bytes-like sources.
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    """Split a request body source into bytes chunks.
+
+    :param source: A string, a bytes-like object, a text or binary file-like
+                   object, or an iterable of string or bytes chunks.
+    :param chunk_size: The size of the chunks read from file-like objects
+                       and sliced from bytes-like objects.
+    :return: A generator of bytes-like chunks, none of them empty.
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for pos in range(0, len(view), chunk_size):
+            yield view[pos:pos + chunk_size]
+        return
+
+    if hasattr(source, 'read'):
+        read = source.read
+        chunks = iter(lambda: read(chunk_size), read(0))
+    else:
+        chunks = source
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        if chunk:
+            yield chunk
+
+
+def gzip_chunks(chunks, level=6):
+    """Gzip a stream of chunks on the fly.
+
+    :param chunks: An iterable of bytes-like chunks.
+    :param level: The compression level, from 1 (fastest) to 9 (smallest).
+    :return: A generator of the chunks of the gzip stream, none of them
+             empty.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class StreamedBody(object):
+    """A request body sent with chunked transfer encoding.
+
+    The body is consumed as it is sent, so it is never held whole in memory
+    but cannot be sent twice. The number of bytes sent is counted in size.
+    """
+
+    def __init__(self, source, compress=False, chunk_size=CHUNK_SIZE):
+        """
+        :param source: See iter_chunks.
+        :param compress: Whether to gzip the body on the fly.
+        :param chunk_size: See iter_chunks.
+        """
+        self.source = source
+        self.compress = compress
+        self.chunk_size = chunk_size
+        self.size = 0
+        self._consumed = False
+
+    def __repr__(self):
+        return '<%s %r>' % (type(self).__name__, self.source)
+
+    def __iter__(self):
+        if self._consumed:
+            raise ValueError('Streamed request bodies cannot be sent twice')
+        self._consumed = True
+
+        chunks = iter_chunks(self.source, self.chunk_size)
+        if self.compress:
+            chunks = gzip_chunks(chunks)
+        for chunk in chunks:
+            self.size += len(chunk)
+            yield chunk
@@ -20,17 +20,28 @@ from tempest.lib import exceptions as lib_exc
 
 from designate_tempest_plugin.common import constants as const
 from designate_tempest_plugin.common import exceptions
+from designate_tempest_plugin.common import tracing
 
 LOG = logging.getLogger(__name__)
 
 
+def _sleep(seconds):
+    tracer = tracing.active()
+    if tracer is None:
+        time.sleep(seconds)
+    else:
+        with tracer.span('sleep', 'wait'):
+            time.sleep(seconds)
+
+
+@tracing.traced('wait')
 def wait_for_zone_404(client, zone_id):
     """Waits for a zone to 404."""
     LOG.info('Waiting for zone %s to 404', zone_id)
     start = int(time.time())
 
     while True:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
 
         try:
             zone = client.show_zone(zone_id)[1]
@@ -58,6 +69,7 @@ def wait_for_zone_404(client, zone_id):
             raise lib_exc.TimeoutException(message)
 
 
+@tracing.traced('wait')
 def wait_for_zone_status(client, zone_id, status, headers=None):
     """Waits for a zone to reach given status."""
     LOG.info('Waiting for zone %s to reach %s', zone_id, status)
@@ -66,7 +78,7 @@ def wait_for_zone_status(client, zone_id, status, headers=None):
     start = int(time.time())
 
     while zone['status'] != status:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
         zone = client.show_zone(zone_id, headers=headers)[1]
         status_curr = zone['status']
         if status_curr == status:
@@ -94,6 +106,7 @@ def wait_for_zone_status(client, zone_id, status, headers=None):
             raise lib_exc.TimeoutException(message)
 
 
+@tracing.traced('wait')
 def wait_for_zone_import_status(client, zone_import_id, status):
     """Waits for an imported zone to reach the given status."""
     LOG.info('Waiting for zone import %s to reach %s', zone_import_id, status)
@@ -102,7 +115,7 @@ def wait_for_zone_import_status(client, zone_import_id, status):
     start = int(time.time())
 
     while zone_import['status'] != status:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
         zone_import = client.show_zone_import(zone_import_id)[1]
         status_curr = zone_import['status']
         if status_curr == status:
@@ -131,6 +144,7 @@ def wait_for_zone_import_status(client, zone_import_id, status):
             raise lib_exc.TimeoutException(message)
 
 
+@tracing.traced('wait')
 def wait_for_zone_export_status(client, zone_export_id, status, headers=None):
     """Waits for an exported zone to reach the given status."""
     LOG.info('Waiting for zone export %s to reach %s', zone_export_id, status)
@@ -139,7 +153,7 @@ def wait_for_zone_export_status(client, zone_export_id, status, headers=None):
     start = int(time.time())
 
     while zone_export['status'] != status:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
         zone_export = client.show_zone_export(
             zone_export_id, headers=headers)[1]
         status_curr = zone_export['status']
@@ -169,6 +183,7 @@ def wait_for_zone_export_status(client, zone_export_id, status, headers=None):
             raise lib_exc.TimeoutException(message)
 
 
+@tracing.traced('wait')
 def wait_for_recordset_status(
         client, zone_id, recordset_id, status, headers=None):
     """Waits for a recordset to reach the given status."""
@@ -180,7 +195,7 @@ def wait_for_recordset_status(
     start = int(time.time())
 
     while recordset['status'] != status:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
         recordset = client.show_recordset(
             zone_id, recordset_id, headers=headers)[1]
         status_curr = recordset['status']
@@ -210,6 +225,7 @@ def wait_for_recordset_status(
             raise lib_exc.TimeoutException(message)
 
 
+@tracing.traced('wait')
 def wait_for_query(client, name, rdatatype, found=True):
     """Query nameservers until the record of the given name and type is found.
 
@@ -225,7 +241,7 @@ def wait_for_query(client, name, rdatatype, found=True):
     start = int(time.time())
 
     while True:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
 
         responses = client.query(name, rdatatype)
         if found:
@@ -255,6 +271,7 @@ def wait_for_query(client, name, rdatatype, found=True):
             raise lib_exc.TimeoutException(message)
 
 
+@tracing.traced('wait')
 def wait_for_ptr_status(client, fip_id, status):
     """Waits for a PTR associated with FIP to reach given status."""
     LOG.info('Waiting for PTR %s to reach %s', fip_id, status)
@@ -263,7 +280,7 @@ def wait_for_ptr_status(client, fip_id, status):
     start = int(time.time())
 
     while ptr['status'] != status:
-        time.sleep(client.build_interval)
+        _sleep(client.build_interval)
         ptr = client.show_ptr_record(fip_id)
         status_curr = ptr['status']
         if status_curr == status:
@@ -289,3 +306,92 @@ def wait_for_ptr_status(client, fip_id, status):
                 message = '(%s) %s' % (caller, message)
 
             raise lib_exc.TimeoutException(message)
+
+
+@tracing.traced('wait')
+def wait_for_zones_status(client, zone_ids, status, headers=None):
+    """Waits for a batch of zones to reach the given status.
+
+    Instead of polling every zone on its own, the zones are checked with one
+    paginated listing per build interval.
+    """
+    pending = set(zone_ids)
+    LOG.info('Waiting for %d zones to reach %s', len(pending), status)
+    start = int(time.time())
+
+    while pending:
+        for zone in client.iter_zones(headers=headers):
+            if zone['id'] not in pending:
+                continue
+            if zone['status'] == status:
+                pending.discard(zone['id'])
+            elif zone['status'] == const.ERROR:
+                raise exceptions.InvalidStatusError('Zone', zone['id'],
+                                                    zone['status'])
+
+        if not pending:
+            break
+
+        if int(time.time()) - start >= client.build_timeout:
+            message = ('Zones %(zone_ids)s failed to reach status=%(status)s '
+                       'within the required time (%(timeout)s s).' %
+                       {'zone_ids': sorted(pending),
+                        'status': status,
+                        'timeout': client.build_timeout})
+
+            caller = test_utils.find_test_caller()
+
+            if caller:
+                message = '(%s) %s' % (caller, message)
+
+            raise lib_exc.TimeoutException(message)
+
+        _sleep(client.build_interval)
+
+    LOG.info('All zones reached %s', status)
+
+
+@tracing.traced('wait')
+def wait_for_recordsets_status(client, zone_id, recordset_ids, status,
+                               headers=None):
+    """Waits for a batch of recordsets of a zone to reach the given status.
+
+    Instead of polling every recordset on its own, the recordsets are checked
+    with one paginated listing of the zone per build interval.
+    """
+    pending = set(recordset_ids)
+    LOG.info('Waiting for %d recordsets of zone %s to reach %s',
+             len(pending), zone_id, status)
+    start = int(time.time())
+
+    while pending:
+        for recordset in client.iter_recordsets(zone_id, headers=headers):
+            if recordset['id'] not in pending:
+                continue
+            if recordset['status'] == status:
+                pending.discard(recordset['id'])
+            elif recordset['status'] == const.ERROR:
+                raise exceptions.InvalidStatusError(
+                    'Recordset', recordset['id'], recordset['status'])
+
+        if not pending:
+            break
+
+        if int(time.time()) - start >= client.build_timeout:
+            message = ('Recordsets %(recordset_ids)s failed to reach '
+                       'status=%(status)s within the required time '
+                       '(%(timeout)s s).' %
+                       {'recordset_ids': sorted(pending),
+                        'status': status,
+                        'timeout': client.build_timeout})
+
+            caller = test_utils.find_test_caller()
+
+            if caller:
+                message = '(%s) %s' % (caller, message)
+
+            raise lib_exc.TimeoutException(message)
+
+        _sleep(client.build_interval)
+
+    LOG.info('All recordsets of zone %s reached %s', zone_id, status)
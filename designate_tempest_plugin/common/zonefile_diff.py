@@ -0,0 +1,136 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from collections import abc
+import ipaddress
+import re
+
+# Quoted strings are kept as-is, the rest is split on blanks.
+_RDATA_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|\S+')
+
+# The types whose data holds domain names only next to numbers, and so is
+# case insensitive.
+_CASE_INSENSITIVE_TYPES = frozenset(
+    ['CNAME', 'DNAME', 'MX', 'NS', 'PTR', 'SOA', 'SRV'])
+
+
+def normalize_name(name):
+    """Return a name lowercased and absolute."""
+    name = name.lower()
+    return name if name.endswith('.') else name + '.'
+
+
+def normalize_rdata(rtype, data):
+    """Return the canonical text of the data of a record.
+
+    Blanks are collapsed outside of quoted strings, IP addresses are
+    compressed and the names of case insensitive types are lowercased.
+    :param rtype: The type of the record, e.g. 'A'.
+    :param data: The data of the record, e.g. '192.0.2.1'.
+    """
+    rtype = rtype.upper()
+    if rtype == 'A':
+        # IPv4 addresses have a single text form.
+        return data.strip()
+    if rtype == 'AAAA':
+        try:
+            return str(ipaddress.ip_address(data.strip()))
+        except ValueError:
+            return data.strip()
+    data = ' '.join(_RDATA_TOKEN_RE.findall(data))
+    if rtype in _CASE_INSENSITIVE_TYPES:
+        data = data.lower()
+    return data
+
+
+def index_rrsets(source, ignore_types=()):
+    """Index records by (name, type).
+
+    :param source: A models.ZoneFile, or an iterable of zone file records
+                   (objects with name, type and data attributes) or of API
+                   recordsets (mappings with name, type and records keys),
+                   e.g. RecordsetClient.iter_recordsets().
+    :param ignore_types: The record types left out of the index.
+    :return: A dict of the normalized rdata sets of the records, keyed by
+             their normalized (name, type).
+    """
+    ignore_types = frozenset(t.upper() for t in ignore_types)
+    records = getattr(source, 'records', source)
+    index = {}
+    for record in records:
+        if isinstance(record, abc.Mapping):
+            name, rtype = record['name'], record['type'].upper()
+            datas = record['records']
+        else:
+            name, rtype = record.name, record.type.upper()
+            datas = (record.data,)
+        if rtype in ignore_types:
+            continue
+        rdatas = index.setdefault((normalize_name(name), rtype), set())
+        for data in datas:
+            rdatas.add(normalize_rdata(rtype, data))
+    return index
+
+
+class ZoneFileDiff(object):
+    """The differences between two sets of DNS records, by RRset.
+
+    Both sides are indexed by (name, type) once, so the diff is linear in
+    the number of records. Either side can be a models.ZoneFile or a
+    listing of API recordsets, e.g.::
+
+        diff = ZoneFileDiff(recordset_client.iter_recordsets(zone_id),
+                            zonefile)
+        self.assertFalse(diff, diff)
+    """
+
+    def __init__(self, old, new, ignore_types=()):
+        """
+        :param old: The expected records, see index_rrsets.
+        :param new: The actual records, see index_rrsets.
+        :param ignore_types: The record types left out of the comparison.
+        """
+        old_index = index_rrsets(old, ignore_types)
+        new_index = index_rrsets(new, ignore_types)
+
+        # RRsets only in new, only in old, and in both with other data.
+        self.added = {key: rdatas for key, rdatas in new_index.items()
+                      if key not in old_index}
+        self.removed = {key: rdatas for key, rdatas in old_index.items()
+                        if key not in new_index}
+        self.changed = {key: (rdatas, new_index[key])
+                        for key, rdatas in old_index.items()
+                        if key in new_index and new_index[key] != rdatas}
+
+    @property
+    def missing(self):
+        """The data of old absent from new, keyed by (name, type)."""
+        missing = dict(self.removed)
+        for key, (old, new) in self.changed.items():
+            if old - new:
+                missing[key] = old - new
+        return missing
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __str__(self):
+        lines = []
+        for prefix, rrsets in (('+', self.added), ('-', self.removed)):
+            for (name, rtype), rdatas in sorted(rrsets.items()):
+                lines.append('%s %s %s %s' % (
+                    prefix, name, rtype, ', '.join(sorted(rdatas))))
+        for (name, rtype), (old, new) in sorted(self.changed.items()):
+            lines.append('~ %s %s %s -> %s' % (
+                name, rtype, ', '.join(sorted(old)), ', '.join(sorted(new))))
+        return '\n'.join(lines) or 'No differences'
@@ -0,0 +1,107 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import mmap
+
+# The size of the windows of the file decoded at once into lines.
+WINDOW_SIZE = 1024 * 1024
+
+
+class MappedZoneFile(object):
+    """A read-only, memory-mapped zone file.
+
+    The file is never read into a Python string as a whole: its pages are
+    loaded by the operating system as they are accessed and may be evicted
+    again, so zone files larger than the available memory can be parsed and
+    uploaded. Mapped zone files can be used as the source of
+    common.zonefile_parser.ZoneFileParser and models.ZoneFile.from_stream,
+    and as the zone file data of ZoneImportsClient.create_zone_import, which
+    sends the mapping without copying it.
+
+    The mapping must be closed, preferably by using the object as a context
+    manager.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: The path of the zone file.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped.
+                self._mmap = b''
+        self._view = memoryview(self._mmap)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._mmap)
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.path)
+
+    @property
+    def closed(self):
+        return self._view is None
+
+    def close(self):
+        """Unmap the file.
+
+        :raises BufferError: If slices of view() are still referenced.
+        """
+        if self._view is None:
+            return
+        self._view.release()
+        self._view = None
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+
+    def view(self):
+        """Return the contents of the file as a zero-copy memoryview."""
+        if self._view is None:
+            raise ValueError('I/O operation on a closed zone file')
+        return self._view
+
+    def iter_lines(self):
+        """Split the file into lines.
+
+        The file is decoded one window of about WINDOW_SIZE bytes at a time,
+        each window ending on a line boundary, straight from the mapping.
+        :return: A generator of lines, without their line terminator.
+        """
+        view = self.view()
+        size = len(view)
+        pos = 0
+        while pos < size:
+            end = pos + WINDOW_SIZE
+            if end < size:
+                newline = self._mmap.rfind(b'\n', pos, end)
+                if newline < 0:
+                    # A line longer than the window.
+                    newline = self._mmap.find(b'\n', end)
+                end = size if newline < 0 else newline + 1
+            else:
+                end = size
+            lines = str(view[pos:end], 'utf-8').split('\n')
+            if lines[-1] == '':
+                lines.pop()
+            for line in lines:
+                yield line.rstrip('\r')
+            pos = end
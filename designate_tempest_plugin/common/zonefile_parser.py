@@ -0,0 +1,266 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import codecs
+import os
+import re
+
+from designate_tempest_plugin.common import zonefile_mmap
+
+# The size of the chunks read from file-like sources.
+CHUNK_SIZE = 64 * 1024
+
+# The maximum nesting of $INCLUDE directives.
+MAX_INCLUDE_DEPTH = 10
+
+CLASSES = frozenset(['IN', 'CH', 'HS', 'CS'])
+
+# A quoted string, a comment start, a parenthesis or a plain token, where
+# backslash escapes are part of the token.
+_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|;|[()]|(?:\\.|[^\s;()"\\])+')
+
+_SPECIAL_RE = re.compile(r'["();\\]')
+
+_TTL_RE = re.compile(r'(\d+)([smhdw]?)', re.IGNORECASE)
+_TTL_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_ttl(text):
+    """Parse a TTL, either in seconds or in BIND units (e.g. '1h30m').
+
+    :param text: The TTL.
+    :return: The TTL in seconds.
+    """
+    if text.isdigit():
+        return int(text)
+
+    total = 0
+    end = 0
+    for match in _TTL_RE.finditer(text):
+        if match.start() != end:
+            break
+        total += int(match.group(1)) * _TTL_UNITS[match.group(2).lower()]
+        end = match.end()
+    if end != len(text) or not text:
+        raise ValueError('Invalid TTL: %r' % text)
+    return total
+
+
+def _iter_chunks(source):
+    if isinstance(source, (str, bytes)):
+        yield source
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def iter_lines(source):
+    """Split a source into lines, without holding it whole in memory.
+
+    :param source: A string, bytes, a text or binary file-like object, an
+                   iterable of string or UTF-8 bytes chunks, or a
+                   common.zonefile_mmap.MappedZoneFile.
+    :return: A generator of lines, without their line terminator.
+    """
+    source_lines = getattr(source, 'iter_lines', None)
+    if source_lines is not None:
+        yield from source_lines()
+        return
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = ''
+    for chunk in _iter_chunks(source):
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if '\n' not in chunk:
+            pending += chunk
+            continue
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.rstrip('\r')
+
+
+def _tokenize(line):
+    if not _SPECIAL_RE.search(line):
+        return line.split()
+
+    tokens = []
+    for token in _TOKEN_RE.findall(line):
+        if token == ';':
+            break
+        tokens.append(token)
+    return tokens
+
+
+def iter_entries(lines):
+    """Group lines into entries, joining the parenthesised continuations.
+
+    :param lines: An iterable of lines.
+    :return: A generator of (owner_omitted, tokens) tuples, owner_omitted
+             being whether the entry starts with a blank, so that it belongs
+             to the owner of the previous record.
+    """
+    tokens = []
+    depth = 0
+    owner_omitted = False
+    for line in lines:
+        if depth == 0:
+            owner_omitted = line[:1] in (' ', '\t')
+        for token in _tokenize(line):
+            if token == '(':
+                depth += 1
+            elif token == ')':
+                depth -= 1
+                if depth < 0:
+                    raise ValueError('Unbalanced parentheses: %r' % line)
+            else:
+                tokens.append(token)
+        if depth == 0 and tokens:
+            yield owner_omitted, tokens
+            tokens = []
+    if depth:
+        raise ValueError('Unbalanced parentheses at the end of the zone file')
+
+
+def _absolute_name(name, origin):
+    if name == '@':
+        if origin is None:
+            raise ValueError('"@" used without an origin')
+        return origin
+    if origin is None or (name.endswith('.') and not name.endswith('\\.')):
+        return name
+    if origin == '.':
+        return name + '.'
+    return '%s.%s' % (name, origin)
+
+
+class ZoneFileParser(object):
+    """A streaming RFC 1035 master file parser.
+
+    Iterating over the parser yields the records of the zone file one at a
+    time, as (name, ttl, type, data) tuples, so zone files of any size are
+    parsed in constant memory. The parser handles comments, parenthesised
+    multi-line records, omitted owner names, '@', names relative to the
+    origin and the $ORIGIN, $TTL and $INCLUDE directives. The data of the
+    records is normalized to single spaces between its fields; quoted
+    strings are kept as-is and names in the data are not qualified.
+    """
+
+    def __init__(self, source, origin=None, ttl=None, include_dir=None):
+        """
+        :param source: See iter_lines.
+        :param origin: The origin before any $ORIGIN directive.
+        :param ttl: The default TTL before any $TTL directive.
+        :param include_dir: The directory the $INCLUDE directives are
+                            resolved against. They are refused if not set,
+                            and may not point outside of it.
+        """
+        self.source = source
+        self.origin = _absolute_name(origin, '.') if origin else None
+        self.ttl = ttl
+        self.include_dir = include_dir
+        # The first $ORIGIN and $TTL of the zone file.
+        self.zone_origin = None
+        self.zone_ttl = None
+        self._last_ttl = None
+
+    def __iter__(self):
+        return self._parse(self.source, self.origin, 0)
+
+    def _parse(self, source, origin, depth):
+        owner = None
+        for owner_omitted, tokens in iter_entries(iter_lines(source)):
+            first = tokens[0]
+            if not owner_omitted and first.startswith('$'):
+                directive = first.upper()
+                if len(tokens) < 2:
+                    raise ValueError('Missing value of %s' % directive)
+                if directive == '$ORIGIN':
+                    origin = _absolute_name(tokens[1], origin)
+                    if self.zone_origin is None:
+                        self.zone_origin = origin
+                elif directive == '$TTL':
+                    self.ttl = parse_ttl(tokens[1])
+                    if self.zone_ttl is None:
+                        self.zone_ttl = self.ttl
+                elif directive == '$INCLUDE':
+                    include_origin = (_absolute_name(tokens[2], origin)
+                                      if len(tokens) > 2 else origin)
+                    yield from self._include(tokens[1], include_origin,
+                                             depth)
+                else:
+                    raise ValueError('Unsupported directive %s' % directive)
+                continue
+
+            if owner_omitted:
+                if owner is None:
+                    raise ValueError('No owner for record %r' % tokens)
+                fields = tokens
+            else:
+                owner = _absolute_name(first, origin)
+                fields = tokens[1:]
+
+            yield self._record(owner, fields)
+
+    def _record(self, owner, fields):
+        ttl = None
+        rclass = None
+        i = 0
+        # The TTL and the class are both optional, in any order.
+        while i < len(fields) and i < 2:
+            field = fields[i]
+            if ttl is None and field[0].isdigit():
+                ttl = parse_ttl(field)
+            elif rclass is None and field.upper() in CLASSES:
+                rclass = field.upper()
+            else:
+                break
+            i += 1
+
+        if i >= len(fields):
+            raise ValueError('Missing type of record %s' % owner)
+        if rclass not in (None, 'IN'):
+            raise ValueError('Unsupported class %s of record %s' %
+                             (rclass, owner))
+
+        if ttl is None:
+            ttl = self.ttl if self.ttl is not None else self._last_ttl
+        else:
+            self._last_ttl = ttl
+
+        return owner, ttl, fields[i].upper(), ' '.join(fields[i + 1:])
+
+    def _include(self, filename, origin, depth):
+        if self.include_dir is None:
+            raise ValueError('$INCLUDE %s refused, no include directory '
+                             'is set' % filename)
+        if depth >= MAX_INCLUDE_DEPTH:
+            raise ValueError('Too many nested $INCLUDE directives')
+
+        root = os.path.realpath(self.include_dir)
+        path = os.path.realpath(os.path.join(root, filename))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError('$INCLUDE %s is outside of %s' %
+                             (filename, self.include_dir))
+
+        with zonefile_mmap.MappedZoneFile(path) as f:
+            yield from self._parse(f, origin, depth + 1)
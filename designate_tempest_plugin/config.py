@@ -52,7 +52,107 @@ DnsGroup = [
                     "If it is not specified, a new zone will be created "),
     cfg.StrOpt('tld_suffix',
                default='test',
-               help="TLD suffix that used in all tests (if not overridden).")
+               help="TLD suffix that used in all tests (if not overridden)."),
+    cfg.StrOpt('request_metrics_file',
+               help="If set, the method, resource template, status, size "
+                    "and latency of every DNS API request are appended to "
+                    "this file as JSON lines."),
+    cfg.StrOpt('cassette_mode',
+               default='off',
+               choices=['off', 'record', 'replay'],
+               help="Whether the DNS API requests are recorded to, or "
+                    "replayed from, the cassette_path file."),
+    cfg.StrOpt('cassette_path',
+               help="The cassette file used by cassette_mode. It is gzip "
+                    "compressed if its name ends with '.gz'."),
+    cfg.BoolOpt('cassette_replay_latency',
+                default=False,
+                help="Whether replayed requests wait for the latency "
+                     "recorded with them."),
+    cfg.StrOpt('api_version_cache_dir',
+               help="If set, the API versions document is cached in this "
+                    "directory and shared between test worker processes. "
+                    "It is otherwise cached per process only."),
+    cfg.IntOpt('api_version_cache_ttl',
+               default=300,
+               help="Time in seconds a file cached in api_version_cache_dir "
+                    "stays valid."),
+    cfg.IntOpt('retry_max_attempts',
+               default=0,
+               help="The number of times a DNS API request answered with "
+                    "HTTP 429 or 503 is retried. 0 disables retries."),
+    cfg.FloatOpt('retry_backoff',
+                 default=0.5,
+                 help="The base delay in seconds of the exponential backoff "
+                      "between retries, used when the response has no "
+                      "Retry-After header."),
+    cfg.FloatOpt('retry_max_backoff',
+                 default=30.0,
+                 help="The maximum delay in seconds between retries."),
+    cfg.BoolOpt('retry_non_idempotent',
+                default=False,
+                help="Whether POST and PATCH requests are retried too."),
+    cfg.DictOpt('rate_limits',
+                default={},
+                help="Client-side rate limits of the DNS API requests, in "
+                     "requests per second, keyed by client class name (e.g. "
+                     "ZonesClient) or by a shell-style pattern of resource "
+                     "templates (e.g. v2/zones/{id}/recordsets*). A request "
+                     "is limited by the first matching entry."),
+    cfg.IntOpt('rate_limit_burst',
+               default=1,
+               help="The number of requests allowed at once by each "
+                    "rate_limits entry."),
+    cfg.BoolOpt('rate_limit_per_credential',
+                default=True,
+                help="Whether each credential is rate limited on its own "
+                     "rather than sharing the rate_limits with the others."),
+    cfg.StrOpt('json_codec',
+               default='oslo',
+               choices=['oslo', 'orjson'],
+               help="The codec used to serialize and deserialize the DNS "
+                    "API JSON bodies. orjson is faster but requires the "
+                    "orjson library."),
+    cfg.BoolOpt('http_keepalive',
+                default=False,
+                help="Whether the DNS service clients keep their HTTP "
+                     "connections open between requests. The clients of a "
+                     "credential then share their connection pools."),
+    cfg.IntOpt('http_pool_maxsize',
+               default=10,
+               help="The number of connections kept open per host by each "
+                    "connection pool when http_keepalive is enabled."),
+    cfg.BoolOpt('http_pool_block',
+                default=False,
+                help="Whether requests wait for a pooled connection to be "
+                     "free rather than opening an extra, short-lived one "
+                     "when http_pool_maxsize connections are in use."),
+    cfg.IntOpt('http_num_pools',
+               default=10,
+               help="The number of hosts whose connection pools are kept "
+                    "per credential when http_keepalive is enabled."),
+    cfg.BoolOpt('http_accept_gzip',
+                default=False,
+                help="Whether the DNS service clients ask for gzip encoded "
+                     "GET responses, e.g. large listings and zone files, "
+                     "to reduce the amount of data transferred."),
+    cfg.BoolOpt('cache_show_requests',
+                default=False,
+                help="Whether the DNS service clients cache the objects "
+                     "they show. Cached objects are revalidated with a "
+                     "conditional request when the server sent an ETag or "
+                     "Last-Modified header, or reused for show_cache_ttl "
+                     "seconds otherwise, and dropped when any DNS client "
+                     "writes to them, to their zone or to the records of "
+                     "their zone."),
+    cfg.FloatOpt('show_cache_ttl',
+                 default=1.0,
+                 help="How long, in seconds, cached objects without a "
+                      "validator are reused."),
+    cfg.StrOpt('trace_dir',
+               help="When set, the API calls, waits and DNS queries of "
+                    "every test are written to a Chrome trace event file "
+                    "named after the test in this directory."),
 ]
 
 dns_feature_group = cfg.OptGroup(name='dns_feature_enabled',
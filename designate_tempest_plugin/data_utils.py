@@ -19,6 +19,8 @@ from oslo_log import log as logging
 from tempest import config
 from tempest.lib.common.utils import data_utils
 
+from designate_tempest_plugin.common import models
+
 LOG = logging.getLogger(__name__)
 CONF = config.CONF
 
@@ -102,6 +104,37 @@ def rand_zonefile_data(name=None, ttl=None):
     return zone_base.replace('&', name).replace('#', str(ttl))
 
 
+def rand_zonefile(name=None, ttl=None, num_records=0):
+    """Generate a random zone file of arbitrary size
+
+    The records are generated lazily, so ZoneFile.write_to can stream zone
+    files far larger than memory; the result can only be written once.
+    :param name: The zone name, random if not given.
+    :param ttl: The default TTL of the zone, random if not given.
+    :param num_records: The number of A records added to the SOA, NS and MX
+                        records of the zone.
+    :return: A ZoneFile
+    """
+    if name is None:
+        name = rand_zone_name()
+    if ttl is None:
+        ttl = rand_ttl()
+
+    def records():
+        yield models.ZoneFileRecord(
+            name, 'SOA', 'ns.{0} nsadmin.{0} {1} {1} {1} {1} {1}'.format(
+                name, ttl))
+        yield models.ZoneFileRecord(name, 'NS', 'ns.' + name)
+        yield models.ZoneFileRecord(name, 'MX', '10 mail.' + name)
+        yield models.ZoneFileRecord('ns.' + name, 'A', '1.0.0.1')
+        for i in range(num_records):
+            yield models.ZoneFileRecord(
+                'host-%d.%s' % (i, name), 'A',
+                '10.%d.%d.%d' % (i >> 16 & 255, i >> 8 & 255, i & 255))
+
+    return models.ZoneFile(origin=name, ttl=ttl, records=records())
+
+
 def rand_quotas(zones=None, zone_records=None, zone_recordsets=None,
                 recordset_records=None, api_export_size=None):
     quotas_dict = {
@@ -17,6 +17,9 @@ import os
 from tempest import config
 from tempest.test_discover import plugins
 
+from designate_tempest_plugin.common import http_pool
+from designate_tempest_plugin.common import rate_limit
+from designate_tempest_plugin.common import retry
 from designate_tempest_plugin import config as project_config
 from designate_tempest_plugin.services.dns import v2 as dns_v2_services
 
@@ -82,6 +85,7 @@ class DesignateTempestPlugin(plugins.TempestPlugin):
 
     def get_service_clients(self):
         dns_config = config.service_client_config('dns')
+        dns_config.update(self._dns_client_params())
         admin_params = {
             'name': 'dns_admin',
             'service_version': 'dns.admin',
@@ -97,3 +101,49 @@ class DesignateTempestPlugin(plugins.TempestPlugin):
         admin_params.update(dns_config)
         v2_params.update(dns_config)
         return [admin_params, v2_params]
+
+    @staticmethod
+    def _dns_client_params():
+        """Return the parameters of the DNS clients set in the [dns] group.
+
+        They are passed to every DNS client when it is created, see
+        DnsClientBase. The connection pools and the rate limiter are built
+        once per process and shared by all the clients.
+        """
+        conf = config.CONF.dns
+        params = {
+            'accept_gzip': conf.http_accept_gzip,
+            'cache_show_requests': conf.cache_show_requests,
+            'show_cache_ttl': conf.show_cache_ttl,
+        }
+
+        if conf.http_keepalive:
+            params['connection_pools'] = http_pool.ConnectionPools(
+                maxsize=conf.http_pool_maxsize,
+                block=conf.http_pool_block,
+                num_pools=conf.http_num_pools)
+
+        if conf.retry_max_attempts:
+            methods = set(retry.IDEMPOTENT_METHODS)
+            if conf.retry_non_idempotent:
+                methods.update(('POST', 'PATCH'))
+            params['retry_policy'] = retry.RetryPolicy(
+                max_retries=conf.retry_max_attempts,
+                backoff=conf.retry_backoff,
+                max_backoff=conf.retry_max_backoff,
+                methods=methods)
+
+        if conf.rate_limits:
+            limiter = rate_limit.RateLimiter()
+            for target, rate in conf.rate_limits.items():
+                if target.endswith('Client'):
+                    kwargs = {'client_class': target}
+                else:
+                    kwargs = {'template': target}
+                limiter.add_rule(
+                    float(rate), burst=conf.rate_limit_burst,
+                    per_credential=conf.rate_limit_per_credential,
+                    **kwargs)
+            params['rate_limiter'] = limiter
+
+        return params
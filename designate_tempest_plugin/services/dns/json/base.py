@@ -11,18 +11,38 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+import collections
+from concurrent import futures
 import functools
+import time
 
 from oslo_log import log as logging
-from oslo_serialization import jsonutils as json
 from tempest.lib.common import rest_client
 from tempest.lib import exceptions as lib_exc
 from urllib import parse as urllib_parse
 
+from designate_tempest_plugin.common import api_version_cache
+from designate_tempest_plugin.common import cassette
+from designate_tempest_plugin.common import exceptions
+from designate_tempest_plugin.common import http_cache
+from designate_tempest_plugin.common import http_pool
+from designate_tempest_plugin.common import json_codec
+from designate_tempest_plugin.common import json_stream
+from designate_tempest_plugin.common import metrics
 from designate_tempest_plugin.common import models
+from designate_tempest_plugin.common import rate_limit
+from designate_tempest_plugin.common import retry
+from designate_tempest_plugin.common import routes
+from designate_tempest_plugin.common import single_flight
+from designate_tempest_plugin.common import tracing
+from designate_tempest_plugin.common import upload
 
 LOG = logging.getLogger(__name__)
 
+# Shared by every client so that identical GETs issued through different
+# client instances of the same credential are coalesced too.
+_GET_FLIGHTS = single_flight.SingleFlight()
+
 
 def handle_errors(f):
     """A decorator that allows to ignore certain types of errors."""
@@ -56,15 +76,112 @@ class DnsClientBase(rest_client.RestClient):
     UPDATE_STATUS_CODES = []
     DELETE_STATUS_CODES = []
 
+    # When enabled, concurrent identical GETs issued by _show_request and
+    # _list_request share a single in-flight HTTP request and its result.
+    coalesce_gets = False
+
+    # A common.retry.RetryPolicy overriding the one set with common.retry.use
+    retry_policy = None
+
+    # A codec overriding the one set with common.json_codec.use
+    json_codec = None
+
+    # When enabled, the JSON bodies returned by _list_request are only
+    # decoded when first accessed, see common.json_codec.LazyBody.
+    lazy_list_bodies = False
+
+    # When enabled, the objects of the collections listed in RESULT_TYPES
+    # are returned by _list_request and _iter_request as compact, read-only
+    # common.models.SlottedResource objects rather than dicts.
+    typed_list_results = False
+    RESULT_TYPES = {}
+
+    # When enabled, the pages walked by _iter_request are downloaded and
+    # decoded incrementally, see _stream_list_request.
+    stream_list_bodies = False
+
+    # The size of the chunks read from streamed response and request bodies.
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # When enabled, the responses of _show_request are cached by the client
+    # and revalidated, or served for SHOW_CACHE_TTL seconds if the server
+    # sends no validator, see common.http_cache.
+    cache_show_requests = False
+    SHOW_CACHE_TTL = 1.0
+
+    # When enabled, GET requests ask for gzip encoded responses, which are
+    # decoded transparently, see raw_request.
+    accept_gzip = False
+
+    # A common.rate_limit.RateLimiter overriding the one set with
+    # common.rate_limit.use
+    rate_limiter = None
+
+    def __init__(self, *args, accept_gzip=None, cache_show_requests=None,
+                 show_cache_ttl=None, connection_pools=None,
+                 rate_limiter=None, retry_policy=None, **kwargs):
+        """
+        The keyword arguments below override, for this client only, the
+        class attributes of the same name and the process-wide settings of
+        the common modules. The tempest plugin sets them from the [dns]
+        configuration options.
+        :param accept_gzip: See the accept_gzip attribute.
+        :param cache_show_requests: See the cache_show_requests attribute.
+        :param show_cache_ttl: See the SHOW_CACHE_TTL attribute.
+        :param connection_pools: A common.http_pool.ConnectionPools the
+                                 client keeps its connections alive in.
+        :param rate_limiter: A common.rate_limit.RateLimiter.
+        :param retry_policy: A common.retry.RetryPolicy.
+        """
+        super(DnsClientBase, self).__init__(*args, **kwargs)
+        if accept_gzip is not None:
+            self.accept_gzip = accept_gzip
+        if cache_show_requests is not None:
+            self.cache_show_requests = cache_show_requests
+        if show_cache_ttl is not None:
+            self.SHOW_CACHE_TTL = show_cache_ttl
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+
+        # A retry policy must see every response it may retry, so urllib3
+        # may not retry them first.
+        status_retries = (self.retry_policy or retry.active()) is None
+        pools = connection_pools or http_pool.active()
+        if pools is not None:
+            self.http_obj = pools.get(self.auth_provider, self.http_obj,
+                                      status_retries=status_retries)
+        elif not status_retries:
+            self.http_obj = http_pool.without_status_retries(self.http_obj)
+
+    def connection_stats(self):
+        """Return the connection counters of this client's pool manager.
+
+        :return: A dict with the requests, new_connections and
+                 reused_connections counts, which are shared with the other
+                 clients of the pool manager, or None if the client does not
+                 keep its connections alive, see common.http_pool.
+        """
+        stats = getattr(self.http_obj, 'stats', None)
+        return stats.as_dict() if stats is not None else None
+
+    def get_json_codec(self):
+        """Return the codec used to serialize and deserialize JSON bodies."""
+        return self.json_codec or json_codec.active()
+
     def serialize(self, data):
-        if isinstance(data, str):
+        if isinstance(data, (str, bytes, memoryview)):
             return data
-        return json.dumps(data)
+        return self.get_json_codec().dumps(data)
 
-    def deserialize(self, resp, object_str):
+    def deserialize(self, resp, object_str, lazy=False):
         if 'content-type' in resp.keys():
             if 'application/json' in resp['content-type']:
-                return json.loads(object_str)
+                if lazy:
+                    return json_codec.LazyBody(self.get_json_codec(),
+                                               object_str)
+                return self.get_json_codec().loads(object_str)
             elif 'text/dns' in resp['content-type']:
                 return models.ZoneFile.from_text(object_str.decode("utf-8"))
             else:
@@ -86,6 +203,149 @@ class DnsClientBase(rest_client.RestClient):
             expected_code=expected_code, read_code=int(read_code),
         )
 
+    def _request(self, method, url, headers=None, body=None, chunked=False):
+        """Sends an authenticated HTTP request.
+
+        Every attempt first waits for the rate limiter in use, if any (the
+        rate_limiter attribute or else common.rate_limit.active()). Responses
+        the retry policy in use (the retry_policy attribute or else
+        common.retry.active()) considers retryable are sent again after the
+        delay it returns. Every request is
+        then handed, with its number of retries and its queueing delay, as a
+        metrics.RequestSample to the observers registered with
+        metrics.add_observer.
+        """
+        policy = self.retry_policy or retry.active()
+        limiter = self.rate_limiter or rate_limit.active()
+        template = metrics.resource_template(url)
+        retries = 0
+        queue_delay = 0.0
+        resp = None
+        resp_body = None
+        start = time.monotonic()
+        try:
+            while True:
+                if limiter is not None:
+                    queue_delay += limiter.acquire(self, template)
+                resp, resp_body = self._send_request(
+                    method, url, headers=headers, body=body, chunked=chunked)
+                delay = (policy.delay(method, resp, retries)
+                         if policy is not None else None)
+                if delay is None or isinstance(body, upload.StreamedBody):
+                    # Streamed bodies cannot be sent again.
+                    return resp, resp_body
+                if chunked and hasattr(resp, 'drain_conn'):
+                    # The body of a streamed response is left unread, which
+                    # would keep its connection out of the pool. Replayed
+                    # responses have no connection.
+                    resp.drain_conn()
+                    resp.release_conn()
+                retries += 1
+                LOG.debug('Retrying %s %s in %.2f s after a HTTP %s '
+                          '(retry %d)', method, url, delay, resp.status,
+                          retries)
+                time.sleep(delay)
+        finally:
+            tracer = tracing.active()
+            if tracer is not None:
+                tracer.complete(
+                    '%s %s' % (method, template), 'api', start,
+                    time.monotonic(),
+                    args={'status': getattr(resp, 'status', None),
+                          'retries': retries, 'queue_delay': queue_delay})
+            if metrics.has_observers():
+                metrics.notify(metrics.RequestSample(
+                    method=method,
+                    template=template,
+                    status=getattr(resp, 'status', None),
+                    request_bytes=self._body_size(body),
+                    response_bytes=len(resp_body) if resp_body else 0,
+                    latency=time.monotonic() - start - queue_delay,
+                    retries=retries,
+                    queue_delay=queue_delay,
+                    wire_bytes=getattr(resp, 'wire_bytes', None)))
+
+    @staticmethod
+    def _body_size(body):
+        if isinstance(body, upload.StreamedBody):
+            return body.size
+        return len(body) if body else 0
+
+    def _send_request(self, method, url, headers=None, body=None,
+                      chunked=False):
+        """Sends a single HTTP request, or replays a recorded one.
+
+        When a cassette is in use (see common.cassette.use), responses are
+        either recorded to it or served from it. Replayed requests skip the
+        authentication and the network entirely, but go through the same
+        response and error checks as live ones.
+        """
+        tape = cassette.active()
+        if tape is not None and tape.mode == cassette.REPLAY:
+            resp, resp_body = tape.play(method, url)
+            self.response_checker(method, resp, resp_body)
+            return resp, resp_body
+
+        start = time.monotonic()
+        resp, resp_body = super(DnsClientBase, self)._request(
+            method, url, headers=headers, body=body, chunked=chunked)
+
+        if tape is not None:
+            if chunked and method == 'GET':
+                # Streamed bodies are recorded once they have been read.
+                resp = tape.record_stream(method, url, resp, start)
+            else:
+                tape.record(method, url, resp, resp_body,
+                            time.monotonic() - start)
+        return resp, resp_body
+
+    def raw_request(self, url, method, headers=None, body=None,
+                    chunked=False, log_req_body=None):
+        """Sends a HTTP request, asking for a gzip encoded response.
+
+        When accept_gzip is enabled, GET requests are sent with an
+        "Accept-Encoding: gzip" header and their body is read and decoded
+        here rather than by the pool manager, so that the number of bytes
+        received over the network can be reported as the wire_bytes
+        attribute of the response. Other requests are sent unchanged.
+        """
+        if not self.accept_gzip or method != 'GET':
+            return super(DnsClientBase, self).raw_request(
+                url, method, headers=headers, body=body, chunked=chunked,
+                log_req_body=log_req_body)
+
+        if headers is None:
+            headers = self.get_headers()
+        headers = dict(headers)
+        if not any(k.lower() == 'accept-encoding' for k in headers):
+            headers['Accept-Encoding'] = 'gzip'
+
+        if chunked:
+            # Streamed bodies are decoded as they are read.
+            return super(DnsClientBase, self).raw_request(
+                url, method, headers=headers, body=body, chunked=True,
+                log_req_body=log_req_body)
+
+        start = time.time()
+        r, _ = super(DnsClientBase, self).raw_request(
+            url, method, headers=headers, body=body, chunked=True,
+            log_req_body=log_req_body)
+        try:
+            resp_body = r.read(decode_content=True)
+            wire_bytes = r.tell()
+        finally:
+            r.release_conn()
+
+        resp = cassette.Response(
+            r.status, {str(k).lower(): v for k, v in r.headers.items()}, url)
+        resp.reason = r.reason
+        resp.version = r.version
+        resp.wire_bytes = wire_bytes
+        self._log_request(method, url, resp, secs=(time.time() - start),
+                          req_headers=headers, req_body=body,
+                          resp_body=resp_body)
+        return resp, resp_body
+
     def get_uri(self, resource_name, uuid=None, params=None,
                 uuid_prefix_char=None):
         """Get URI for a specific resource or object.
@@ -98,19 +358,78 @@ class DnsClientBase(rest_client.RestClient):
                 by API character, for example ":" instead of "/".
         :returns: Relative URI for the resource or object.
         """
-        uri_pattern = '{pref}/{res}{uuid}{params}'
+        template, ids = routes.split_ids(resource_name)
+        return routes.get_route(self.uri_prefix, template).build(
+            uuid=uuid, params=params, uuid_prefix_char=uuid_prefix_char,
+            ids=ids)
+
+    def _coalesced_get(self, uri, headers=None, extra_headers=False):
+        """Sends a GET request, joining an identical one already in flight.
+
+        Requests are only coalesced when coalesce_gets is enabled and they
+        share the URI, the headers and the credential (auth provider). The
+        raw response is shared, each caller deserializes its own copy.
+        :param uri: The relative URI to send the request to.
+        :param headers (dict): The headers to use for the request.
+        :param extra_headers (bool): Whether the headers returned by
+                                     get_headers() are to be added.
+        :returns: A tuple with the server response and the raw body.
+        """
+        if not self.coalesce_gets:
+            return self.get(uri, headers=headers, extra_headers=extra_headers)
 
-        if uuid_prefix_char:
-            uuid = uuid_prefix_char + '%s' % uuid if uuid else ''
-        else:
-            uuid = '/%s' % uuid if uuid else ''
+        key = (id(self.auth_provider), uri, extra_headers,
+               tuple(sorted((k.lower(), str(v))
+                            for k, v in (headers or {}).items())))
+        return _GET_FLIGHTS.do(key, self.get, uri, headers=headers,
+                               extra_headers=extra_headers)
 
-        params = '?%s' % urllib_parse.urlencode(params) if params else ''
+    def _cached_get(self, uri, headers=None, extra_headers=False):
+        """Sends a GET request, unless its response is cached.
 
-        return uri_pattern.format(pref=self.uri_prefix,
-                                  res=resource_name,
-                                  uuid=uuid,
-                                  params=params)
+        Cached responses with an ETag or Last-Modified validator are
+        revalidated with a conditional request and reused on a 304 Not
+        Modified, the others are reused until they expire.
+        :param uri: The relative URI to send the request to.
+        :param headers (dict): The headers to use for the request.
+        :param extra_headers (bool): Whether the headers returned by
+                                     get_headers() are to be added.
+        :returns: A tuple with the server response and the raw body.
+        """
+        cache = self.__dict__.get('_show_cache')
+        if cache is None:
+            cache = self._show_cache = http_cache.ResponseCache(
+                ttl=self.SHOW_CACHE_TTL)
+
+        key = cache.make_key(uri, headers, extra_headers)
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            return entry.resp, entry.body
+
+        if entry is not None:
+            validators = http_cache.conditional_headers(entry)
+            if headers is None:
+                headers, extra_headers = validators, True
+            else:
+                headers = dict(headers, **validators)
+
+        resp, body = self._coalesced_get(
+            uri, headers=headers, extra_headers=extra_headers)
+
+        if resp.status == 304 and entry is not None:
+            return entry.resp, entry.body
+        if resp.status == 200:
+            cache.put(key, resp, body)
+        return resp, body
+
+    def _invalidate_cache(self, resource, uuid=None, uuid_prefix_char=None):
+        """Drops the cached responses a write may have changed.
+
+        The responses cached by every client are dropped, whether this
+        client caches its own or not, see common.http_cache.invalidate_all.
+        """
+        http_cache.invalidate_all(self.get_uri(
+            resource, uuid=uuid, uuid_prefix_char=uuid_prefix_char))
 
     def _create_request(self, resource, data=None, params=None,
                         headers=None, extra_headers=False,
@@ -118,8 +437,8 @@ class DnsClientBase(rest_client.RestClient):
         """Create an object of the specified type.
         :param resource: The name of the REST resource, e.g., 'zones'.
         :param data: A Python dict that represents an object of the
-                     specified type (to be serialized) or a plain string which
-                     is sent as-is.
+                     specified type (to be serialized) or a plain string or
+                     bytes-like object which is sent as-is.
         :param params: A Python dict that represents the query paramaters to
                        include in the request URI.
         :param headers (dict): The headers to use for the request.
@@ -137,8 +456,51 @@ class DnsClientBase(rest_client.RestClient):
         body = self.serialize(data)
         uri = self.get_uri(resource, params=params)
 
-        resp, body = self.post(uri, body=body, headers=headers,
-                               extra_headers=extra_headers)
+        try:
+            resp, body = self.post(uri, body=body, headers=headers,
+                                   extra_headers=extra_headers)
+        finally:
+            self._invalidate_cache(resource)
+
+        if expected_statuses is None:
+            self.expected_success(self.CREATE_STATUS_CODES, resp.status)
+        else:
+            self.expected_success(expected_statuses, resp.status)
+
+        return resp, self.deserialize(resp, body)
+
+    def _upload_request(self, resource, source, params=None, headers=None,
+                        compress=False, expected_statuses=None):
+        """Create an object from a body streamed with chunked encoding.
+
+        The body is read and sent in chunks of STREAM_CHUNK_SIZE bytes as the
+        request goes, so it is never held whole in memory and the upload
+        starts right away. Streamed requests are never retried.
+        :param resource: The name of the REST resource, e.g., 'zones'.
+        :param source: The body, see common.upload.iter_chunks.
+        :param params: A Python dict that represents the query paramaters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param compress: Whether to gzip the body on the fly, which is sent
+                         with a "Content-Encoding: gzip" header.
+        :param expected_statuses: If set, it will override the default expected
+                                  statuses list with the status codes provided
+                                  by caller function
+        :returns: A tuple with the server response and the deserialized created
+                 object.
+        """
+        if compress:
+            headers = dict(headers or self.get_headers())
+            headers['Content-Encoding'] = 'gzip'
+        body = upload.StreamedBody(source, compress=compress,
+                                   chunk_size=self.STREAM_CHUNK_SIZE)
+        uri = self.get_uri(resource, params=params)
+
+        try:
+            resp, body = self.post(uri, body=body, headers=headers,
+                                   chunked=True)
+        finally:
+            self._invalidate_cache(resource)
 
         if expected_statuses is None:
             self.expected_success(self.CREATE_STATUS_CODES, resp.status)
@@ -167,8 +529,12 @@ class DnsClientBase(rest_client.RestClient):
         uri = self.get_uri(resource, uuid=uuid, params=params,
                            uuid_prefix_char=uuid_prefix_char)
 
-        resp, body = self.get(
-            uri, headers=headers, extra_headers=extra_headers)
+        if self.cache_show_requests:
+            resp, body = self._cached_get(
+                uri, headers=headers, extra_headers=extra_headers)
+        else:
+            resp, body = self._coalesced_get(
+                uri, headers=headers, extra_headers=extra_headers)
 
         self.expected_success(self.SHOW_STATUS_CODES, resp.status)
 
@@ -184,11 +550,196 @@ class DnsClientBase(rest_client.RestClient):
         """
         uri = self.get_uri(resource, params=params)
 
-        resp, body = self.get(uri, headers=headers)
+        resp, body = self._coalesced_get(uri, headers=headers)
 
         self.expected_success(self.LIST_STATUS_CODES, resp.status)
 
-        return resp, self.deserialize(resp, body)
+        if self.typed_list_results and self.RESULT_TYPES:
+            body = self.deserialize(resp, body)
+            for key, model in self.RESULT_TYPES.items():
+                if isinstance(body, dict) and key in body:
+                    body[key] = [model.from_dict(obj) for obj in body[key]]
+            return resp, body
+
+        return resp, self.deserialize(resp, body, lazy=self.lazy_list_bodies)
+
+    def _iter_request(self, resource, key, params=None, headers=None,
+                      page_size=None):
+        """Lazily iterates over every object of a paginated collection.
+
+        Pages are fetched one at a time through _list_request, or through
+        _stream_list_request if stream_list_bodies is enabled, and the
+        marker/limit query of the 'links.next' reference is followed until
+        the server stops returning one, so at most a single page is held in
+        memory at any time.
+        :param resource: The name of the REST resource, e.g., 'zones'.
+        :param key: The key of the collection in the response body,
+                    e.g., 'zones'.
+        :param params: A Python dict that represents the query paramaters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of objects requested per page. If not
+                          set, the server default limit is used.
+        :returns: A generator of serialized objects as dictionaries.
+        """
+        params = dict(params or {})
+        if page_size:
+            params['limit'] = page_size
+
+        while True:
+            if self.stream_list_bodies:
+                body = yield from self._stream_list_request(
+                    resource, key, params=params, headers=headers)
+            else:
+                _, body = self._list_request(
+                    resource, params=params, headers=headers)
+                yield from body.get(key, [])
+
+            next_params = self._next_page_params(body, params)
+            if next_params is None:
+                return
+            params.update(next_params)
+
+    @staticmethod
+    def _next_page_params(body, params):
+        """Returns the query parameters of the next page of a collection.
+
+        :param body: The decoded body of the current page.
+        :param params: The query parameters of the current page.
+        :returns: A dict of query parameters, or None if the current page is
+                  the last one.
+        """
+        next_link = (body.get('links') or {}).get('next')
+        if not next_link:
+            return None
+
+        next_params = dict(urllib_parse.parse_qsl(
+            urllib_parse.urlsplit(next_link).query))
+        if next_params.get('marker') in (None, params.get('marker')):
+            # A missing or unchanged marker would loop forever.
+            return None
+        return next_params
+
+    def _stream_list_request(self, resource, key, params=None,
+                             headers=None):
+        """Gets a list of objects, decoding them as the body arrives.
+
+        The response body is read in chunks of STREAM_CHUNK_SIZE bytes and
+        every object of the 'key' array is yielded as soon as it is complete,
+        so that the whole body is never held in memory.
+        :param resource: The name of the REST resource, e.g., 'zones'.
+        :param key: The key of the collection in the response body,
+                    e.g., 'zones'.
+        :param params: A Python dict that represents the query paramaters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :returns: A generator of serialized objects as dictionaries, which
+                  returns the rest of the body (e.g. 'links' and 'metadata')
+                  once exhausted.
+        """
+        uri = self.get_uri(resource, params=params)
+
+        resp, body = self.get(uri, headers=headers, chunked=True)
+        try:
+            self.expected_success(self.LIST_STATUS_CODES, resp.status)
+
+            parser = json_stream.ArrayStreamParser(
+                key, self.get_json_codec().loads)
+            if hasattr(resp, 'stream'):
+                chunks = resp.stream(self.STREAM_CHUNK_SIZE)
+            else:
+                # Replayed responses are not streamed.
+                chunks = [body]
+            model = (self.RESULT_TYPES.get(key)
+                     if self.typed_list_results else None)
+            for chunk in chunks:
+                if model is None:
+                    yield from parser.feed(chunk)
+                else:
+                    yield from map(model.from_dict, parser.feed(chunk))
+            return parser.close()
+        finally:
+            if hasattr(resp, 'release_conn'):
+                resp.release_conn()
+
+    def _download_request(self, uri, fileobj=None, headers=None):
+        """Downloads a response body in chunks of STREAM_CHUNK_SIZE bytes.
+
+        The body is neither decoded nor held whole in memory.
+        :param uri: The relative URI to send the request to.
+        :param fileobj: A binary file-like object the body is written to.
+        :param headers (dict): The headers to use for the request.
+        :returns: A tuple with the server response and, if fileobj is set,
+                  the number of bytes written to it, or else a generator of
+                  the chunks of the body, which releases the connection once
+                  exhausted or closed.
+        """
+        resp, body = self.get(uri, headers=headers, chunked=True)
+        try:
+            self.expected_success(self.SHOW_STATUS_CODES, resp.status)
+        except Exception:
+            if hasattr(resp, 'release_conn'):
+                resp.release_conn()
+            raise
+
+        chunks = self._iter_body(resp, body)
+        if fileobj is None:
+            return resp, chunks
+
+        size = 0
+        for chunk in chunks:
+            fileobj.write(chunk)
+            size += len(chunk)
+        return resp, size
+
+    def _iter_body(self, resp, body):
+        try:
+            if hasattr(resp, 'stream'):
+                yield from resp.stream(self.STREAM_CHUNK_SIZE)
+            elif body:
+                # Replayed responses are not streamed.
+                yield body
+        finally:
+            if hasattr(resp, 'release_conn'):
+                resp.release_conn()
+
+    def _bulk_request(self, func, payloads, concurrency):
+        """Calls func for every payload with a bounded number in flight.
+
+        The payloads are consumed lazily and at most ``concurrency`` calls
+        run at the same time on a pool of threads sharing this client, whose
+        underlying urllib3 pool manager is thread-safe. Once a call failed,
+        the calls in flight are completed but no other is made.
+        :param func: A callable taking a single payload.
+        :param payloads: An iterable of payloads.
+        :param concurrency: The maximum number of calls in flight.
+        :returns: A list of the results of func, in payload order.
+        :raises BulkRequestError: If any call failed, with the results of
+                                  the others.
+        """
+        results = []
+        errors = []
+
+        def collect(future):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append(e)
+
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight = collections.deque()
+            for payload in payloads:
+                if len(in_flight) >= concurrency:
+                    collect(in_flight.popleft())
+                if errors:
+                    break
+                in_flight.append(executor.submit(func, payload))
+            while in_flight:
+                collect(in_flight.popleft())
+
+        if errors:
+            raise exceptions.BulkRequestError(results, errors)
+        return results
 
     def _put_request(self, resource, uuid, data, params=None,
                      headers=None, extra_headers=False):
@@ -211,8 +762,11 @@ class DnsClientBase(rest_client.RestClient):
         """
         body = self.serialize(data)
         uri = self.get_uri(resource, uuid=uuid, params=params)
-        resp, body = self.put(
-            uri, body=body, headers=headers, extra_headers=extra_headers)
+        try:
+            resp, body = self.put(
+                uri, body=body, headers=headers, extra_headers=extra_headers)
+        finally:
+            self._invalidate_cache(resource, uuid)
 
         self.expected_success(self.PUT_STATUS_CODES, resp.status)
 
@@ -244,8 +798,11 @@ class DnsClientBase(rest_client.RestClient):
             resource, uuid=uuid, params=params,
             uuid_prefix_char=uuid_prefix_char)
 
-        resp, body = self.patch(uri, body=body,
-                                headers=headers, extra_headers=extra_headers)
+        try:
+            resp, body = self.patch(uri, body=body, headers=headers,
+                                    extra_headers=extra_headers)
+        finally:
+            self._invalidate_cache(resource, uuid, uuid_prefix_char)
 
         self.expected_success(self.UPDATE_STATUS_CODES, resp.status)
 
@@ -268,8 +825,11 @@ class DnsClientBase(rest_client.RestClient):
         """
         uri = self.get_uri(resource, uuid=uuid, params=params)
 
-        resp, body = self.delete(
-            uri, headers=headers, extra_headers=extra_headers)
+        try:
+            resp, body = self.delete(
+                uri, headers=headers, extra_headers=extra_headers)
+        finally:
+            self._invalidate_cache(resource, uuid)
 
         self.expected_success(self.DELETE_STATUS_CODES, resp.status)
         if resp.status == 202:
@@ -277,14 +837,29 @@ class DnsClientBase(rest_client.RestClient):
 
         return resp, body
 
+    def get_versions_document(self):
+        """Get the API versions document of the endpoint.
+
+        The document is cached for the whole process, see
+        common.api_version_cache. The memory cache is keyed on the catalog
+        filters of the client, so that a cache hit, like a cassette replay,
+        needs no catalog lookup, while the cache files shared between
+        processes are also keyed on its base URL.
+        :return: A tuple with the server response and the raw body.
+        """
+        key = '|'.join('%s=%s' % item
+                       for item in sorted(self.filters.items()))
+        return api_version_cache.get(key, lambda: self.get('/'),
+                                     endpoint=lambda: self.base_url)
+
     def get_max_api_version(self):
         """Get the maximum version available on the API endpoint.
         :return: Maximum version string available on the endpoint.
         """
-        response, body = self.get('/')
+        response, body = self.get_versions_document()
         self.expected_success(200, response.status)
 
-        versions_list = json.loads(body)['versions']
+        versions_list = self.get_json_codec().loads(body)['versions']
 
         # Handle the legacy version document format
         if 'values' in versions_list:
@@ -19,6 +19,8 @@ import dns.tsigkeyring
 from tempest import config
 from oslo_utils import netutils
 
+from designate_tempest_plugin.common import tracing
+
 CONF = config.CONF
 
 
@@ -65,6 +67,7 @@ class SingleQueryClient(object):
             self.keyring = None
             self.tsig_algorithm = None
 
+    @tracing.traced('dns', name='query')
     def query(self, name, rdatatype):
         return self._dig(name, rdatatype, self.nameserver.ip,
                          self.nameserver.port, timeout=self.query_timeout)
@@ -0,0 +1,435 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import collections
+import functools
+import ssl
+import time
+
+from oslo_log import log as logging
+from tempest.lib.common.utils import test_utils
+from tempest.lib import exceptions as lib_exc
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from designate_tempest_plugin.common import cassette
+from designate_tempest_plugin.common import constants as const
+from designate_tempest_plugin.common import exceptions
+from designate_tempest_plugin.common import http_cache
+from designate_tempest_plugin.common import metrics
+from designate_tempest_plugin.common import upload
+
+LOG = logging.getLogger(__name__)
+
+
+def handle_errors(f):
+    """A decorator that allows coroutines to ignore certain types of errors.
+    """
+
+    @functools.wraps(f)
+    async def wrapper(*args, **kwargs):
+        ignored_errors = kwargs.pop('ignore_errors', tuple())
+
+        try:
+            return await f(*args, **kwargs)
+        except ignored_errors as e:
+            # Silently ignore errors as requested
+            LOG.debug('Ignoring exception of type %s, as requested', type(e))
+
+    return wrapper
+
+
+class AsyncDnsClientBase(object):
+    """Base asyncio client for Designate API.
+
+    An async client wraps the synchronous client of the same API, e.g. an
+    AsyncZonesClient wraps a ZonesClient, and delegates to it the URI
+    building, the headers, the authentication, the expected status codes,
+    the error checks and the body (de)serialization. Only the HTTP exchange
+    is done asynchronously, with aiohttp, so that a single process can keep
+    thousands of requests in flight.
+
+    Clients sharing a session share its connection pool, e.g.::
+
+        async with aiohttp.ClientSession() as session:
+            zones = AsyncZonesClient(zones_client, session=session)
+            recordsets = AsyncRecordsetClient(recordset_client,
+                                              session=session)
+    """
+
+    def __init__(self, client, session=None, limit=1000):
+        """
+        :param client: The synchronous client to wrap.
+        :param session: An aiohttp.ClientSession to send the requests with.
+                        If not set, the client creates, and closes, its own.
+        :param limit: The maximum number of connections of the session
+                      created by the client.
+        """
+        if aiohttp is None:
+            raise ImportError('The asyncio DNS clients require the aiohttp '
+                              'library to be installed')
+        self.client = client
+        self.build_interval = client.build_interval
+        self.build_timeout = client.build_timeout
+        self._session = session
+        self._own_session = session is None
+        self._limit = limit
+        self._auth_lock = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the session, if it was created by the client."""
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._limit, ssl=self._ssl_context()))
+        return self._session
+
+    def _ssl_context(self):
+        if self.client.dscv:
+            return False
+        ca_certs = self.client.http_obj.connection_pool_kw.get('ca_certs')
+        if ca_certs:
+            return ssl.create_default_context(cafile=ca_certs)
+        return None
+
+    async def request(self, method, uri, headers=None, extra_headers=False,
+                      body=None):
+        """Send an authenticated HTTP request.
+
+        :param method: The HTTP method of the request.
+        :param uri: The URI relative to the DNS endpoint.
+        :param headers (dict): The headers to use for the request.
+        :param extra_headers (bool): Whether the headers returned by the
+                                     get_headers() method are to be added.
+        :param body: The body of the request.
+        :return: A tuple with the server response and the raw body.
+        """
+        client = self.client
+        if headers is None:
+            headers = client.get_headers()
+        elif extra_headers:
+            headers = dict(headers, **client.get_headers())
+
+        if client.accept_gzip and method == 'GET':
+            # aiohttp decodes the body transparently.
+            headers = dict(headers, **{'Accept-Encoding': 'gzip'})
+
+        url, headers, body = await self._auth_request(
+            method, uri, headers, body)
+
+        data = body
+        if isinstance(body, upload.StreamedBody):
+            # Sent with chunked transfer encoding as it is read.
+            data = self._iter_streamed_body(body)
+
+        session = self._get_session()
+        start = time.monotonic()
+        async with session.request(
+                method, url, headers=headers, data=data,
+                allow_redirects=getattr(client.http_obj, 'follow_redirects',
+                                        True)) as r:
+            resp_body = await r.read()
+            resp = cassette.Response(
+                r.status, {k.lower(): v for k, v in r.headers.items()}, url)
+
+        if method != 'GET':
+            # Drops the responses cached by the synchronous clients.
+            http_cache.invalidate_all(uri.split('?', 1)[0])
+
+        if metrics.has_observers():
+            metrics.notify(metrics.RequestSample(
+                method=method,
+                template=metrics.resource_template(uri),
+                status=resp.status,
+                request_bytes=self.client._body_size(body),
+                response_bytes=len(resp_body),
+                latency=time.monotonic() - start))
+
+        client.response_checker(method, resp, resp_body)
+        client._error_checker(resp, resp_body)
+        return resp, resp_body
+
+    async def _auth_request(self, method, uri, headers, body):
+        """Authenticate a request, see the auth_request of tempest.
+
+        While the auth provider has no valid token cached, fetching one and
+        looking the endpoint up in the catalog block, so they are done in a
+        thread, one request at a time, rather than in the event loop.
+        """
+        client = self.client
+        auth = functools.partial(client.auth_provider.auth_request, method,
+                                 uri, headers, body, client.filters)
+        if self._has_token():
+            return auth()
+
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._has_token():
+                return auth()
+            return await asyncio.get_running_loop().run_in_executor(
+                None, auth)
+
+    def _has_token(self):
+        auth_provider = self.client.auth_provider
+        cache = getattr(auth_provider, 'cache', None)
+        return cache is not None and not auth_provider.is_expired(cache)
+
+    async def _create_request(self, resource, data=None, params=None,
+                              headers=None, extra_headers=False,
+                              expected_statuses=None):
+        """Create an object of the specified type.
+
+        See DnsClientBase._create_request.
+        """
+        client = self.client
+        resp, body = await self.request(
+            'POST', client.get_uri(resource, params=params), headers=headers,
+            extra_headers=extra_headers, body=client.serialize(data))
+
+        if expected_statuses is None:
+            client.expected_success(client.CREATE_STATUS_CODES, resp.status)
+        else:
+            client.expected_success(expected_statuses, resp.status)
+
+        return resp, client.deserialize(resp, body)
+
+    async def _upload_request(self, resource, source, params=None,
+                              headers=None, compress=False,
+                              expected_statuses=None):
+        """Create an object from a body streamed with chunked encoding.
+
+        See DnsClientBase._upload_request.
+        """
+        client = self.client
+        if compress:
+            headers = dict(headers or client.get_headers())
+            headers['Content-Encoding'] = 'gzip'
+        body = upload.StreamedBody(source, compress=compress,
+                                   chunk_size=client.STREAM_CHUNK_SIZE)
+
+        resp, body = await self.request(
+            'POST', client.get_uri(resource, params=params), headers=headers,
+            body=body)
+
+        if expected_statuses is None:
+            client.expected_success(client.CREATE_STATUS_CODES, resp.status)
+        else:
+            client.expected_success(expected_statuses, resp.status)
+
+        return resp, client.deserialize(resp, body)
+
+    @staticmethod
+    async def _iter_streamed_body(body):
+        for chunk in body:
+            yield bytes(chunk)
+
+    async def _show_request(self, resource, uuid, headers=None, params=None,
+                            extra_headers=False, uuid_prefix_char=None):
+        """Gets a specific object of the specified type.
+
+        See DnsClientBase._show_request.
+        """
+        client = self.client
+        uri = client.get_uri(resource, uuid=uuid, params=params,
+                             uuid_prefix_char=uuid_prefix_char)
+        resp, body = await self.request(
+            'GET', uri, headers=headers, extra_headers=extra_headers)
+
+        client.expected_success(client.SHOW_STATUS_CODES, resp.status)
+
+        return resp, client.deserialize(resp, body)
+
+    async def _list_request(self, resource, params=None, headers=None):
+        """Gets a list of objects.
+
+        See DnsClientBase._list_request.
+        """
+        client = self.client
+        resp, body = await self.request(
+            'GET', client.get_uri(resource, params=params), headers=headers)
+
+        client.expected_success(client.LIST_STATUS_CODES, resp.status)
+
+        return resp, client.deserialize(resp, body)
+
+    async def _iter_request(self, resource, key, params=None, headers=None,
+                            page_size=None):
+        """Lazily iterates over every object of a paginated collection.
+
+        See DnsClientBase._iter_request.
+        """
+        params = dict(params or {})
+        if page_size:
+            params['limit'] = page_size
+
+        while True:
+            _, body = await self._list_request(
+                resource, params=params, headers=headers)
+
+            for item in body.get(key, []):
+                yield item
+
+            next_params = self.client._next_page_params(body, params)
+            if next_params is None:
+                return
+            params.update(next_params)
+
+    async def _put_request(self, resource, uuid, data, params=None,
+                           headers=None, extra_headers=False):
+        """Updates the specified object using PUT request.
+
+        See DnsClientBase._put_request.
+        """
+        client = self.client
+        resp, body = await self.request(
+            'PUT', client.get_uri(resource, uuid=uuid, params=params),
+            headers=headers, extra_headers=extra_headers,
+            body=client.serialize(data))
+
+        client.expected_success(client.PUT_STATUS_CODES, resp.status)
+
+        return resp, client.deserialize(resp, body)
+
+    async def _update_request(self, resource, uuid, data, params=None,
+                              headers=None, extra_headers=False,
+                              uuid_prefix_char=None):
+        """Updates the specified object using PATCH request.
+
+        See DnsClientBase._update_request.
+        """
+        client = self.client
+        uri = client.get_uri(resource, uuid=uuid, params=params,
+                             uuid_prefix_char=uuid_prefix_char)
+        resp, body = await self.request(
+            'PATCH', uri, headers=headers, extra_headers=extra_headers,
+            body=client.serialize(data))
+
+        client.expected_success(client.UPDATE_STATUS_CODES, resp.status)
+
+        return resp, client.deserialize(resp, body)
+
+    async def _delete_request(self, resource, uuid, params=None,
+                              headers=None, extra_headers=False):
+        """Deletes the specified object.
+
+        See DnsClientBase._delete_request.
+        """
+        client = self.client
+        resp, body = await self.request(
+            'DELETE', client.get_uri(resource, uuid=uuid, params=params),
+            headers=headers, extra_headers=extra_headers)
+
+        client.expected_success(client.DELETE_STATUS_CODES, resp.status)
+        if resp.status == 202:
+            body = client.deserialize(resp, body)
+
+        return resp, body
+
+    async def _bulk_request(self, func, payloads, concurrency):
+        """Awaits func for every payload with a bounded number in flight.
+
+        The payloads are consumed lazily and at most ``concurrency`` calls
+        run at the same time. Once a call failed, the calls in flight are
+        completed but no other is made.
+        :param func: A coroutine function taking a single payload.
+        :param payloads: An iterable of payloads.
+        :param concurrency: The maximum number of calls in flight.
+        :returns: A list of the results of func, in payload order.
+        :raises BulkRequestError: If any call failed, with the results of
+                                  the others.
+        """
+        results = []
+        errors = []
+        in_flight = collections.deque()
+
+        async def collect(task):
+            try:
+                results.append(await task)
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            for payload in payloads:
+                if len(in_flight) >= concurrency:
+                    await collect(in_flight.popleft())
+                if errors:
+                    break
+                in_flight.append(asyncio.ensure_future(func(payload)))
+            while in_flight:
+                await collect(in_flight.popleft())
+        finally:
+            # Only left when the caller was cancelled.
+            for task in in_flight:
+                task.cancel()
+
+        if errors:
+            raise exceptions.BulkRequestError(results, errors)
+        return results
+
+    async def _wait_for_status(self, entity, uuid, show, status):
+        """Waits for an object to reach the given status.
+
+        :param entity: The kind of object, for the error messages.
+        :param uuid: The identifier of the object.
+        :param show: A coroutine function returning the object.
+        :param status: The status to wait for.
+        :return: The object, once in the given status.
+        """
+        LOG.info('Waiting for %s %s to reach %s', entity, uuid, status)
+        start = time.monotonic()
+
+        while True:
+            obj = await show()
+            if obj['status'] == status:
+                LOG.info('%s %s reached %s', entity, uuid, status)
+                return obj
+
+            if obj['status'] == const.ERROR:
+                raise exceptions.InvalidStatusError(entity, uuid,
+                                                    obj['status'])
+
+            if time.monotonic() - start >= self.build_timeout:
+                message = ('%(entity)s %(uuid)s failed to reach '
+                           'status=%(status)s within the required time '
+                           '(%(timeout)s s). Current status: '
+                           '%(status_curr)s' %
+                           {'entity': entity,
+                            'uuid': uuid,
+                            'status': status,
+                            'status_curr': obj['status'],
+                            'timeout': self.build_timeout})
+
+                caller = test_utils.find_test_caller()
+
+                if caller:
+                    message = '(%s) %s' % (caller, message)
+
+                raise lib_exc.TimeoutException(message)
+
+            await asyncio.sleep(self.build_interval)
@@ -0,0 +1,73 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from tempest import config
+
+from designate_tempest_plugin.services.dns.v2.aio import base
+
+CONF = config.CONF
+
+
+class AsyncPtrClient(base.AsyncDnsClientBase):
+    """Asyncio client for the Designate floating IP PTR records API.
+
+    Wraps a PtrClient, see its methods for the meaning of the parameters.
+    """
+
+    @base.handle_errors
+    async def set_ptr_record(self, floatingip_id, ptr_name=None,
+                             ttl=None, description=None, headers=None,
+                             tld=None):
+        """Set a PTR record for the given FloatingIP.
+
+        :return: created PTR dictionary.
+        """
+        ptr = self.client.build_ptr_data(ptr_name=ptr_name, ttl=ttl,
+                                         description=description, tld=tld)
+
+        return (await self._update_request(
+            'reverse/floatingips/{}'.format(CONF.identity.region),
+            floatingip_id, ptr, headers=headers, uuid_prefix_char=':'))[1]
+
+    @base.handle_errors
+    async def show_ptr_record(self, floatingip_id, headers=None):
+        """Show PTR record for the given FloatingIP.
+
+        :return: Shown PTR dictionary.
+        """
+        return (await self._show_request(
+            'reverse/floatingips/{}'.format(CONF.identity.region),
+            floatingip_id, headers=headers, uuid_prefix_char=':'))[1]
+
+    @base.handle_errors
+    async def list_ptr_records(self, headers=None):
+        """List PTR records.
+
+        :return: List of PTR records.
+        """
+        return (await self._list_request(
+            'reverse/floatingips', headers=headers))[1]['floatingips']
+
+    @base.handle_errors
+    async def unset_ptr_record(self, floatingip_id, headers=None):
+        """Unset the PTR record for a given FloatingIP.
+
+        :return: Tuple (Response, Body)
+        """
+        resp, body = await self._update_request(
+            'reverse/floatingips/{}'.format(CONF.identity.region),
+            floatingip_id, {'ptrdname': None}, headers=headers,
+            uuid_prefix_char=':')
+        # Unset PTR should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+        return resp, body
@@ -0,0 +1,157 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.services.dns.v2.aio import base
+
+
+class AsyncRecordsetClient(base.AsyncDnsClientBase):
+    """Asyncio client for the Designate recordsets API.
+
+    Wraps a RecordsetClient, see its methods for the meaning of the
+    parameters.
+    """
+
+    @base.handle_errors
+    async def create_recordset(self, zone_uuid, recordset_data,
+                               params=None, headers=None, wait_until=False):
+        """Create a recordset for the specified zone.
+
+        :return: A tuple with the server response and the created recordset.
+        """
+        resp, body = await self._create_request(
+            'zones/{0}/recordsets'.format(zone_uuid), params=params,
+            data=recordset_data, headers=headers,
+            extra_headers=bool(headers))
+
+        # Create Recordset should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        if wait_until:
+            await self.wait_for_recordset_status(
+                zone_uuid, body['id'], wait_until, headers=headers)
+
+        return resp, body
+
+    async def create_recordsets_bulk(self, zone_uuid, recordsets_data,
+                                     concurrency=1000, headers=None,
+                                     wait_until=False):
+        """Create many recordsets in the specified zone with a bounded number
+        of requests in flight.
+
+        :param zone_uuid: Unique identifier of the zone in UUID format.
+        :param recordsets_data: An iterable of dictionaries that represent
+                                the recordsets data.
+        :param concurrency: The maximum number of requests in flight.
+            Default: 1000
+        :param headers (dict): The headers to use for the requests.
+        :param wait_until: Once every recordset is created, wait until all
+                           of them reach the desired status
+        :return: A list of (response, recordset) tuples, in the order of
+                 recordsets_data.
+        """
+        results = await self._bulk_request(
+            lambda data: self.create_recordset(
+                zone_uuid, data, headers=headers),
+            recordsets_data, concurrency)
+
+        if wait_until:
+            await self._bulk_request(
+                lambda body: self.wait_for_recordset_status(
+                    zone_uuid, body['id'], wait_until, headers=headers),
+                [body for _, body in results], concurrency)
+
+        return results
+
+    @base.handle_errors
+    async def update_recordset(self, zone_uuid, recordset_uuid,
+                               recordset_data, params=None, headers=None,
+                               extra_headers=None, wait_until=False):
+        """Update the recordset related to the specified zone.
+
+        :return: A tuple with the server response and the updated recordset.
+        """
+        resp, body = await self._put_request(
+            'zones/{0}/recordsets'.format(zone_uuid), recordset_uuid,
+            data=recordset_data, params=params,
+            headers=headers, extra_headers=extra_headers)
+
+        # Update Recordset should Return a HTTP 202, or a 200 if the recordset
+        # is already active
+        self.client.expected_success([200, 202], resp.status)
+
+        if wait_until:
+            await self.wait_for_recordset_status(
+                zone_uuid, body['id'], wait_until)
+
+        return resp, body
+
+    @base.handle_errors
+    async def show_recordset(self, zone_uuid, recordset_uuid,
+                             params=None, headers=None):
+        """Gets a specific recordset related to a specific zone.
+
+        :return: Serialized recordset as a dictionary.
+        """
+        return await self._show_request(
+            'zones/{0}/recordsets'.format(zone_uuid), recordset_uuid,
+            params=params, headers=headers)
+
+    @base.handle_errors
+    async def delete_recordset(self, zone_uuid, recordset_uuid, params=None,
+                               headers=None):
+        """Deletes a recordset related to the specified zone UUID.
+
+        :return: A tuple with the server response and the response body.
+        """
+        resp, body = await self._delete_request(
+            'zones/{0}/recordsets'.format(zone_uuid), recordset_uuid,
+            params=params, headers=headers)
+
+        # Delete Recordset should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        return resp, body
+
+    @base.handle_errors
+    async def list_recordset(self, uuid, params=None, headers=None):
+        """List recordsets related to the specified zone.
+
+        :return: Serialized recordsets as a list.
+        """
+        return await self._list_request(
+            'zones/{0}/recordsets'.format(uuid),
+            params=params, headers=headers)
+
+    def iter_recordsets(self, uuid, params=None, headers=None,
+                        page_size=None):
+        """Lazily iterates over the recordsets of a zone, page by page.
+
+        :return: An asynchronous generator of serialized recordsets as
+                 dictionaries.
+        """
+        return self._iter_request(
+            'zones/{0}/recordsets'.format(uuid), 'recordsets',
+            params=params, headers=headers, page_size=page_size)
+
+    async def wait_for_recordset_status(self, zone_id, recordset_id, status,
+                                        headers=None):
+        """Waits for a recordset to reach the given status.
+
+        :return: The recordset, once in the given status.
+        """
+        async def show():
+            return (await self.show_recordset(
+                zone_id, recordset_id, headers=headers))[1]
+
+        return await self._wait_for_status(
+            'Recordset', recordset_id, show, status)
@@ -0,0 +1,108 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.services.dns.v2.aio import base
+
+
+class AsyncZoneExportsClient(base.AsyncDnsClientBase):
+    """Asyncio client for the Designate zone exports API.
+
+    Wraps a ZoneExportsClient, see its methods for the meaning of the
+    parameters.
+    """
+
+    @base.handle_errors
+    async def create_zone_export(self, uuid, params=None,
+                                 wait_until=False, headers=None):
+        """Create a zone export.
+
+        :return: A tuple with the server response and the zone export.
+        """
+        resp, body = await self._create_request(
+            'zones/{0}/tasks/export'.format(uuid), params=params,
+            headers=headers)
+
+        # Create Zone Export should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        if wait_until:
+            await self.wait_for_zone_export_status(
+                body['id'], wait_until, headers=headers)
+
+        return resp, body
+
+    @base.handle_errors
+    async def show_zone_export(self, uuid, params=None, headers=None):
+        """Get the zone export task.
+
+        :return: Serialized exported zone as a dictionary.
+        """
+        return await self._show_request(
+            'zones/tasks/exports', uuid, params=params, headers=headers)
+
+    @base.handle_errors
+    async def show_exported_zonefile(self, uuid, params=None, headers=None):
+        """Get the exported zone file.
+
+        :return: A tuple with the server response and the zone file.
+        """
+        return await self._show_request(
+            'zones/tasks/exports/{0}/export'.format(uuid),
+            uuid='', headers=self.client._zonefile_headers(headers),
+            params=params)
+
+    @base.handle_errors
+    async def list_zone_exports(self, params=None, headers=None):
+        """List zone export tasks.
+
+        :return: Serialized exported zones as a list.
+        """
+        return await self._list_request(
+            'zones/tasks/exports', params=params, headers=headers)
+
+    def iter_zone_exports(self, params=None, headers=None, page_size=None):
+        """Lazily iterates over all zone exports, page by page.
+
+        :return: An asynchronous generator of serialized zone exports as
+                 dictionaries.
+        """
+        return self._iter_request(
+            'zones/tasks/exports', 'exports',
+            params=params, headers=headers, page_size=page_size)
+
+    @base.handle_errors
+    async def delete_zone_export(self, uuid, params=None, headers=None):
+        """Deletes the zone export task with the specified UUID.
+
+        :return: A tuple with the server response and the response body.
+        """
+        resp, body = await self._delete_request(
+            'zones/tasks/exports', uuid, params=params, headers=headers)
+
+        # Delete Zone export should Return a HTTP 204
+        self.client.expected_success(204, resp.status)
+
+        return resp, body
+
+    async def wait_for_zone_export_status(self, zone_export_id, status,
+                                          headers=None):
+        """Waits for a zone export to reach the given status.
+
+        :return: The zone export, once in the given status.
+        """
+        async def show():
+            return (await self.show_zone_export(
+                zone_export_id, headers=headers))[1]
+
+        return await self._wait_for_status(
+            'Zone export', zone_export_id, show, status)
@@ -0,0 +1,106 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.services.dns.v2.aio import base
+
+
+class AsyncZoneImportsClient(base.AsyncDnsClientBase):
+    """Asyncio client for the Designate zone imports API.
+
+    Wraps a ZoneImportsClient, see its methods for the meaning of the
+    parameters.
+    """
+
+    @base.handle_errors
+    async def create_zone_import(self, zonefile_data=None, attributes=None,
+                                 wait_until=None, headers=None,
+                                 compress=False):
+        """Create a zone import.
+
+        :return: (response, body) tuple.
+        """
+        streamed = compress or self.client.is_zonefile_stream(zonefile_data)
+        headers, request_body = self.client.build_zone_import_request(
+            zonefile_data=zonefile_data, attributes=attributes,
+            headers=headers, compress=compress)
+
+        if streamed:
+            resp, body = await self._upload_request(
+                'zones/tasks/imports', request_body, headers=headers,
+                compress=compress)
+        else:
+            resp, body = await self._create_request(
+                'zones/tasks/imports', request_body, headers=headers)
+
+        # Create Zone Import should return HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        if wait_until:
+            await self.wait_for_zone_import_status(body['id'], wait_until)
+
+        return resp, body
+
+    @base.handle_errors
+    async def show_zone_import(self, uuid, params=None, headers=None):
+        """Gets a specific zone import.
+
+        :return: Serialized imported zone as a dictionary.
+        """
+        return await self._show_request(
+            'zones/tasks/imports', uuid, params=params, headers=headers)
+
+    @base.handle_errors
+    async def list_zone_imports(self, params=None, headers=None):
+        """Gets all the imported zones.
+
+        :return: Serialized imported zones as a list.
+        """
+        return await self._list_request(
+            'zones/tasks/imports', params=params, headers=headers)
+
+    def iter_zone_imports(self, params=None, headers=None, page_size=None):
+        """Lazily iterates over all zone imports, page by page.
+
+        :return: An asynchronous generator of serialized zone imports as
+                 dictionaries.
+        """
+        return self._iter_request(
+            'zones/tasks/imports', 'imports',
+            params=params, headers=headers, page_size=page_size)
+
+    @base.handle_errors
+    async def delete_zone_import(self, uuid, params=None, headers=None):
+        """Deletes a imported zone having the specified UUID.
+
+        :return: A tuple with the server response and the response body.
+        """
+        resp, body = await self._delete_request(
+            'zones/tasks/imports', uuid, params=params, headers=headers)
+
+        # Delete Zone Import should return HTTP 204
+        self.client.expected_success(204, resp.status)
+
+        return resp, body
+
+    async def wait_for_zone_import_status(self, zone_import_id, status,
+                                          headers=None):
+        """Waits for a zone import to reach the given status.
+
+        :return: The zone import, once in the given status.
+        """
+        async def show():
+            return (await self.show_zone_import(
+                zone_import_id, headers=headers))[1]
+
+        return await self._wait_for_status(
+            'Zone import', zone_import_id, show, status)
@@ -0,0 +1,164 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.common import constants as const
+from designate_tempest_plugin.services.dns.v2.aio import base
+
+
+class AsyncZonesClient(base.AsyncDnsClientBase):
+    """Asyncio client for the Designate zones API.
+
+    Wraps a ZonesClient, see its methods for the meaning of the parameters.
+    """
+
+    @base.handle_errors
+    async def create_zone(self, name=None, email=None, ttl=None,
+                          description=None, attributes=None,
+                          wait_until=False,
+                          zone_type=const.PRIMARY_ZONE_TYPE,
+                          primaries=None, params=None, project_id=None,
+                          headers=None):
+        """Create a zone with the specified parameters.
+
+        :return: A tuple with the server response and the created zone.
+        """
+        zone = self.client.build_zone_data(
+            name=name, email=email, ttl=ttl, description=description,
+            attributes=attributes, zone_type=zone_type, primaries=primaries)
+
+        headers = self.client.build_zone_headers(headers, project_id)
+        extra_headers = headers is not None
+
+        resp, body = await self._create_request(
+            'zones', zone, params=params, headers=headers,
+            extra_headers=extra_headers)
+
+        # Create Zone should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        if wait_until:
+            await self.wait_for_zone_status(body['id'], wait_until,
+                                            headers=headers)
+
+        return resp, body
+
+    async def create_zones_bulk(self, zones, concurrency=1000,
+                                wait_until=False, headers=None):
+        """Create many zones with a bounded number of requests in flight.
+
+        :param zones: An iterable of dicts, each holding the keyword arguments
+                      of a create_zone call.
+        :param concurrency: The maximum number of requests in flight.
+            Default: 1000
+        :param wait_until: Once every zone is created, wait until all of
+                           them reach the desired status
+        :param headers (dict): The headers to use for the requests.
+        :return: A list of (response, zone) tuples, in the order of zones.
+        """
+        sudo_project_ids = {}
+
+        async def create(kwargs):
+            resp, body = await self.create_zone(headers=headers, **kwargs)
+            if kwargs.get('project_id'):
+                sudo_project_ids[body['id']] = kwargs['project_id']
+            return resp, body
+
+        results = await self._bulk_request(create, zones, concurrency)
+
+        if wait_until:
+            await self._bulk_request(
+                lambda body: self.wait_for_zone_status(
+                    body['id'], wait_until,
+                    headers=self.client.build_zone_headers(
+                        headers, sudo_project_ids.get(body['id']))),
+                [body for _, body in results], concurrency)
+
+        return results
+
+    @base.handle_errors
+    async def show_zone(self, uuid, params=None, headers=None):
+        """Gets a specific zone.
+
+        :return: Serialized zone as a dictionary.
+        """
+        return await self._show_request(
+            'zones', uuid, params=params, headers=headers)
+
+    @base.handle_errors
+    async def list_zones(self, params=None, headers=None):
+        """Gets a list of zones.
+
+        :return: Serialized zones as a list.
+        """
+        return await self._list_request(
+            'zones', params=params, headers=headers)
+
+    def iter_zones(self, params=None, headers=None, page_size=None):
+        """Lazily iterates over all zones, page by page.
+
+        :return: An asynchronous generator of serialized zones as
+                 dictionaries.
+        """
+        return self._iter_request(
+            'zones', 'zones',
+            params=params, headers=headers, page_size=page_size)
+
+    @base.handle_errors
+    async def update_zone(self, uuid, email=None, ttl=None,
+                          description=None, wait_until=False, params=None,
+                          headers=None):
+        """Update a zone with the specified parameters.
+
+        :return: A tuple with the server response and the updated zone.
+        """
+        zone = self.client.build_zone_update_data(
+            email=email, ttl=ttl, description=description)
+
+        resp, body = await self._update_request(
+            'zones', uuid, zone, params=params, headers=headers)
+
+        # Update Zone should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        if wait_until:
+            await self.wait_for_zone_status(body['id'], wait_until)
+
+        return resp, body
+
+    @base.handle_errors
+    async def delete_zone(self, uuid, params=None, headers=None,
+                          delete_shares=None):
+        """Deletes a zone having the specified UUID.
+
+        :return: A tuple with the server response and the response body.
+        """
+        if delete_shares:
+            headers = dict(headers or {}, **{
+                'x-designate-delete-shares': 'True'})
+        resp, body = await self._delete_request(
+            'zones', uuid, params=params, headers=headers)
+
+        # Delete Zone should Return a HTTP 202
+        self.client.expected_success(202, resp.status)
+
+        return resp, body
+
+    async def wait_for_zone_status(self, zone_id, status, headers=None):
+        """Waits for a zone to reach given status.
+
+        :return: The zone, once in the given status.
+        """
+        async def show():
+            return (await self.show_zone(zone_id, headers=headers))[1]
+
+        return await self._wait_for_status('Zone', zone_id, show, status)
@@ -22,6 +22,6 @@ class ApiVersionClient(base.DnsClientV2Base):
 
         :return: Dictionary containing version details
         """
-        resp, body = self.get('/')
+        resp, body = self.get_versions_document()
         self.expected_success(self.LIST_STATUS_CODES, resp.status)
         return resp, self.deserialize(resp, body)
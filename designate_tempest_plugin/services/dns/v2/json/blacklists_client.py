@@ -67,6 +67,19 @@ class BlacklistsClient(base.DnsClientV2Base):
         """
         return self._list_request('blacklists', params=params)
 
+    def iter_blacklists(self, params=None, headers=None,
+                        page_size=None):
+        """Lazily iterates over all blacklists, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of blacklists requested per page.
+        :return: A generator of serialized blacklists as dictionaries.
+        """
+        return self._iter_request(
+            'blacklists', 'blacklists',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_blacklist(self, uuid, params=None):
         """Deletes a blacklist having the specified UUID.
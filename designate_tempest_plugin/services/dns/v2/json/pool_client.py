@@ -70,6 +70,19 @@ class PoolClient(base.DnsClientV2Base):
         """
         return self._list_request('pools', params=params, headers=headers)
 
+    def iter_pools(self, params=None, headers=None,
+                   page_size=None):
+        """Lazily iterates over all pools, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of pools requested per page.
+        :return: A generator of serialized pools as dictionaries.
+        """
+        return self._iter_request(
+            'pools', 'pools',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_pool(self, uuid, params=None, headers=None):
         """Deletes a pool having the specified UUID.
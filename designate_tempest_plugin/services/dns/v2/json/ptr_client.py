@@ -22,6 +22,19 @@ CONF = config.CONF
 
 class PtrClient(base.DnsClientV2Base):
 
+    def build_ptr_data(self, ptr_name=None, ttl=None, description=None,
+                       tld=None):
+        """Build the body of a PTR record setting request.
+
+        Missing values are randomly generated, see set_ptr_record for the
+        meaning of the parameters.
+        :return: The PTR record as a dictionary.
+        """
+        return {
+            'ptrdname': ptr_name or dns_data_utils.rand_domain_name(tld),
+            'ttl': ttl or dns_data_utils.rand_ttl(),
+            'description': description or data_utils.rand_name('test-ptr')}
+
     @base.handle_errors
     def set_ptr_record(self, floatingip_id, ptr_name=None,
                        ttl=None, description=None, headers=None,
@@ -36,10 +49,8 @@ class PtrClient(base.DnsClientV2Base):
         :param tld, the TLD to be used in ptrdname generated value.
         :return: created PTR dictionary.
         """
-        ptr = {
-            'ptrdname': ptr_name or dns_data_utils.rand_domain_name(tld),
-            'ttl': ttl or dns_data_utils.rand_ttl(),
-            'description': description or data_utils.rand_name('test-ptr')}
+        ptr = self.build_ptr_data(ptr_name=ptr_name, ttl=ttl,
+                                  description=description, tld=tld)
 
         return self._update_request(
             resource='reverse/floatingips/{}'.format(CONF.identity.region),
@@ -68,6 +79,18 @@ class PtrClient(base.DnsClientV2Base):
         return self._list_request(
             'reverse/floatingips', headers=headers)[1]['floatingips']
 
+    def iter_ptr_records(self, params=None, headers=None, page_size=None):
+        """Lazily iterates over all PTR records, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of PTR records requested per page.
+        :return: A generator of PTR records as dictionaries.
+        """
+        return self._iter_request(
+            'reverse/floatingips', 'floatingips',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def unset_ptr_record(self, floatingip_id, headers=None):
         """Unset the PTR record for a given FloatingIP
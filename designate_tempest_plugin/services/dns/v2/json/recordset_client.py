@@ -12,6 +12,8 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from designate_tempest_plugin.common import models
+from designate_tempest_plugin.common import recordset_index
 from designate_tempest_plugin.common import waiters
 from designate_tempest_plugin.services.dns.v2.json import base
 
@@ -20,18 +22,19 @@ class RecordsetClient(base.DnsClientV2Base):
     """API V2 Tempest REST client for Recordset API"""
 
     SHOW_STATUS_CODES = [200, 301]
+    RESULT_TYPES = {'recordsets': models.Recordset}
 
     def __init__(self, auth_provider, service, region,
                  endpoint_type='publicURL',
                  build_interval=1, build_timeout=60,
                  disable_ssl_certificate_validation=False, ca_certs=None,
                  trace_requests='', name=None, http_timeout=None,
-                 proxy_url=None):
+                 proxy_url=None, **kwargs):
         super(RecordsetClient, self).__init__(
                 auth_provider, service, region, endpoint_type, build_interval,
                 build_timeout, disable_ssl_certificate_validation, ca_certs,
                 trace_requests, name, http_timeout, proxy_url,
-                follow_redirects=False)
+                follow_redirects=False, **kwargs)
 
     @base.handle_errors
     def create_recordset(self, zone_uuid, recordset_data,
@@ -64,6 +67,39 @@ class RecordsetClient(base.DnsClientV2Base):
 
         return resp, body
 
+    def create_recordsets_bulk(self, zone_uuid, recordsets_data,
+                               concurrency=10, headers=None,
+                               wait_until=False):
+        """Create many recordsets in the specified zone with a bounded number
+        of requests in flight.
+
+        :param zone_uuid: Unique identifier of the zone in UUID format.
+        :param recordsets_data: An iterable of dictionaries that represent
+                                the recordsets data.
+        :param concurrency: The maximum number of create requests in flight.
+            Default: 10
+        :param headers (dict): The headers to use for the requests.
+        :param wait_until: Once every recordset is created, block until all
+                           of them reach the desired status
+        :return: A list of (response, recordset) tuples, in the order of
+                 recordsets_data, once every recordset is created.
+        :raises BulkRequestError: If a recordset could not be created, with
+                                  the (response, recordset) tuples of the
+                                  recordsets which were, so that they can be
+                                  cleaned up.
+        """
+        results = self._bulk_request(
+            lambda data: self.create_recordset(
+                zone_uuid, data, headers=headers),
+            recordsets_data, concurrency)
+
+        if wait_until:
+            waiters.wait_for_recordsets_status(
+                self, zone_uuid, [body['id'] for _, body in results],
+                wait_until, headers=headers)
+
+        return results
+
     @base.handle_errors
     def update_recordset(self, zone_uuid, recordset_uuid,
                          recordset_data, params=None,
@@ -151,6 +187,39 @@ class RecordsetClient(base.DnsClientV2Base):
             'zones/{0}/recordsets'.format(uuid),
             params=params, headers=headers)
 
+    def iter_recordsets(self, uuid, params=None, headers=None,
+                        page_size=None):
+        """Lazily iterates over the recordsets of a zone, page by page.
+        :param uuid: Unique identifier of the zone in UUID format.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of recordsets requested per page.
+        :return: A generator of serialized recordsets as dictionaries.
+        """
+        return self._iter_request(
+            'zones/{0}/recordsets'.format(uuid), 'recordsets',
+            params=params, headers=headers, page_size=page_size)
+
+    def build_recordset_index(self, uuid=None, params=None, headers=None,
+                              page_size=None):
+        """Index the recordsets of a zone, or of all zones, page by page.
+        :param uuid: Unique identifier of the zone in UUID format. If not
+                     set, the recordsets of every zone are indexed.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of recordsets requested per page.
+        :return: A common.recordset_index.RecordsetIndex.
+        """
+        if uuid:
+            recordsets = self.iter_recordsets(
+                uuid, params=params, headers=headers, page_size=page_size)
+        else:
+            recordsets = self.iter_zones_recordsets(
+                params=params, headers=headers, page_size=page_size)
+        return recordset_index.RecordsetIndex.from_listing(recordsets)
+
     @base.handle_errors
     def show_zones_recordset(self, recordset_uuid, params=None):
         """Gets a single recordset, using the cross_zone endpoint
@@ -179,6 +248,19 @@ class RecordsetClient(base.DnsClientV2Base):
         return self._list_request(
             'recordsets', params=params)
 
+    def iter_zones_recordsets(self, params=None, headers=None,
+                              page_size=None):
+        """Lazily iterates over recordsets across all zones, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of recordsets requested per page.
+        :return: A generator of serialized recordsets as dictionaries.
+        """
+        return self._iter_request(
+            'recordsets', 'recordsets',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def list_owned_recordsets(self, params=None, headers=None):
         """Lists recordsets for all projects in Designate.
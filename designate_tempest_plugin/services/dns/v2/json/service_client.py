@@ -26,6 +26,18 @@ class ServiceClient(base.DnsClientV2Base):
         return self._list_request(
             'service_statuses', headers=headers)[1]['service_statuses']
 
+    def iter_statuses(self, params=None, headers=None, page_size=None):
+        """Lazily iterates over all Services and statuses, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of service statuses requested per page.
+        :return: A generator of service statuses as dictionaries.
+        """
+        return self._iter_request(
+            'service_statuses', 'service_statuses',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def show_statuses(self, uuid, headers=None):
         """Show Service status
@@ -62,6 +62,20 @@ class SharedZonesClient(base.DnsClientV2Base):
         return self._list_request('zones/{}/shares'.format(zone_id),
                                   params=params, headers=headers)
 
+    def iter_zone_shares(self, zone_id, params=None, headers=None,
+                         page_size=None):
+        """Lazily iterates over the shares of a zone, page by page.
+        :param zone_id: Zone UUID to query for the shares
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of zone shares requested per page.
+        :return: A generator of serialized zone shares as dictionaries.
+        """
+        return self._iter_request(
+            'zones/{}/shares'.format(zone_id), 'shared_zones',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_zone_share(self, zone_id, zone_share_id, headers=None):
         """Deletes the zone share
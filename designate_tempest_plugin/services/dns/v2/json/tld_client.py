@@ -61,6 +61,19 @@ class TldClient(base.DnsClientV2Base):
         """
         return self._list_request('tlds', params=params)
 
+    def iter_tlds(self, params=None, headers=None,
+                  page_size=None):
+        """Lazily iterates over all tlds, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of tlds requested per page.
+        :return: A generator of serialized tlds as dictionaries.
+        """
+        return self._iter_request(
+            'tlds', 'tlds',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_tld(self, uuid, params=None):
         """Deletes a tld having the specified UUID.
@@ -67,3 +67,16 @@ class TransferAcceptClient(base.DnsClientV2Base):
         """
         return self._list_request(
             'zones/tasks/transfer_accepts', params=params, headers=headers)
+
+    def iter_transfer_accepts(self, params=None, headers=None,
+                              page_size=None):
+        """Lazily iterates over all accepted zone transfers, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of transfer accepts requested per page.
+        :return: A generator of serialized transfer accepts as dictionaries.
+        """
+        return self._iter_request(
+            'zones/tasks/transfer_accepts', 'transfer_accepts',
+            params=params, headers=headers, page_size=page_size)
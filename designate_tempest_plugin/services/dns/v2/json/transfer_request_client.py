@@ -85,6 +85,19 @@ class TransferRequestClient(base.DnsClientV2Base):
         return self._list_request(
             'zones/tasks/transfer_requests', params=params, headers=headers)
 
+    def iter_transfer_requests(self, params=None, headers=None,
+                               page_size=None):
+        """Lazily iterates over all transfer requests, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of transfer requests requested per page.
+        :return: A generator of serialized transfer requests as dictionaries.
+        """
+        return self._iter_request(
+            'zones/tasks/transfer_requests', 'transfer_requests',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_transfer_request(self, uuid, params=None):
         """Deletes an transfer_requestsed zone having the specified UUID.
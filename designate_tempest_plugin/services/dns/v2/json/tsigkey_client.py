@@ -62,6 +62,19 @@ class TsigkeyClient(base.DnsClientV2Base):
         """
         return self._list_request('tsigkeys', params=params, headers=headers)
 
+    def iter_tsigkeys(self, params=None, headers=None,
+                      page_size=None):
+        """Lazily iterates over all tsigkeys, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of tsigkeys requested per page.
+        :return: A generator of serialized tsigkeys as dictionaries.
+        """
+        return self._iter_request(
+            'tsigkeys', 'tsigkeys',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def show_tsigkey(self, uuid=None, params=None, headers=None):
         """Gets a specific tsigkey.
@@ -78,6 +78,36 @@ class ZoneExportsClient(base.DnsClientV2Base):
         :return: Serialized exported zone as a dictionary.
         """
 
+        return self._show_request(
+            'zones/tasks/exports/{0}/export'.format(uuid),
+            uuid='', headers=self._zonefile_headers(headers), params=params)
+
+    @base.handle_errors
+    def download_exported_zonefile(self, uuid, fileobj=None, params=None,
+                                   headers=None):
+        """Download the exported zone file in chunks.
+
+        Unlike show_exported_zonefile, the zone file is neither decoded nor
+        parsed, nor held whole in memory. The chunks can be parsed lazily
+        with models.ZoneFile.iter_records.
+
+        :param uuid: Unique identifier of the zone export task in UUID format.
+        :param fileobj: A binary file-like object the zone file is written
+                        to.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers: See show_exported_zonefile.
+        :return: A tuple with the server response and, if fileobj is set,
+                 the number of bytes written to it, or else a generator of
+                 the chunks of the zone file.
+        """
+        uri = self.get_uri('zones/tasks/exports/{0}/export'.format(uuid),
+                           params=params)
+        return self._download_request(
+            uri, fileobj=fileobj, headers=self._zonefile_headers(headers))
+
+    @staticmethod
+    def _zonefile_headers(headers):
         if headers:
             if 'accept' not in [key.lower() for key in headers.keys()]:
                 headers['Accept'] = 'text/dns'
@@ -85,10 +115,7 @@ class ZoneExportsClient(base.DnsClientV2Base):
             headers = {'Accept': 'text/dns'}
         else:
             headers = {}
-
-        return self._show_request(
-            'zones/tasks/exports/{0}/export'.format(uuid),
-            uuid='', headers=headers, params=params)
+        return headers
 
     @base.handle_errors
     def list_zone_exports(self, params=None, headers=None):
@@ -102,6 +129,19 @@ class ZoneExportsClient(base.DnsClientV2Base):
         return self._list_request(
             'zones/tasks/exports', params=params, headers=headers)
 
+    def iter_zone_exports(self, params=None, headers=None,
+                          page_size=None):
+        """Lazily iterates over all zone exports, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of zone exports requested per page.
+        :return: A generator of serialized zone exports as dictionaries.
+        """
+        return self._iter_request(
+            'zones/tasks/exports', 'exports',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_zone_export(self, uuid, params=None, headers=None):
         """Deletes the zone export task with the specified UUID.
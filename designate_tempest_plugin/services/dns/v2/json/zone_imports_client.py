@@ -14,14 +14,59 @@
 
 from designate_tempest_plugin import data_utils as dns_data_utils
 from designate_tempest_plugin.common import waiters
+from designate_tempest_plugin.common import zonefile_mmap
 from designate_tempest_plugin.services.dns.v2.json import base
 
 
 class ZoneImportsClient(base.DnsClientV2Base):
 
+    def build_zone_import_request(self, zonefile_data=None, attributes=None,
+                                  headers=None, compress=False):
+        """Build the headers and the body of a zone import request.
+
+        See create_zone_import for the meaning of the parameters.
+        :return: A tuple with the headers and the body of the request.
+        """
+        if compress and attributes is not None:
+            raise ValueError('Compressed zone files cannot be sent with '
+                             'attributes')
+        # An empty zone file, even a MappedZoneFile of an empty file, is
+        # sent as is.
+        zonefile = (zonefile_data if zonefile_data is not None
+                    else dns_data_utils.rand_zonefile_data())
+        if attributes is not None and self.is_zonefile_stream(zonefile):
+            raise ValueError('Streamed zone files cannot be sent with '
+                             'attributes')
+        if isinstance(zonefile, zonefile_mmap.MappedZoneFile):
+            if attributes is not None:
+                # The zone file is embedded in the JSON body, so it has to
+                # be decoded.
+                zonefile = str(zonefile.view(), 'utf-8')
+            else:
+                zonefile = zonefile.view()
+        if attributes is not None:
+            if not headers:
+                headers = {'Content-Type': 'application/json'}
+            request_body = {
+                'zonefile': zonefile,
+                'attributes': attributes,
+            }
+        else:
+            if not headers:
+                headers = {'Content-Type': 'text/dns'}
+            request_body = zonefile
+
+        return headers, request_body
+
+    @staticmethod
+    def is_zonefile_stream(zonefile_data):
+        """Whether zone file data is a file-like object or an iterable."""
+        return not isinstance(zonefile_data, (
+            type(None), str, bytes, memoryview, zonefile_mmap.MappedZoneFile))
+
     @base.handle_errors
     def create_zone_import(self, zonefile_data=None, attributes=None,
-                           wait_until=None, headers=None):
+                           wait_until=None, headers=None, compress=False):
         """Create a zone import.
 
         When attributes are provided the request uses application/json
@@ -29,28 +74,36 @@ class ZoneImportsClient(base.DnsClientV2Base):
         JSON body).  Otherwise the raw zonefile text is posted with
         content type text/dns.
 
-        :param zonefile_data: Zone file content as a string.
+        Zone files given as a file-like object or an iterable, or compressed,
+        are streamed with chunked transfer encoding: they are read as the
+        request is sent, in constant memory.
+
+        :param zonefile_data: Zone file content as a string, a
+            common.zonefile_mmap.MappedZoneFile, which is sent without being
+            copied in memory unless attributes are provided, a text or binary
+            file-like object, or an iterable of string or bytes chunks.
         :param attributes: Optional dict of zone attributes
             (e.g. ``{'pool_id': '<uuid>'}``).  Triggers JSON mode.
         :param wait_until: If not None, wait for this import status.
         :param headers: Optional headers dict for the request.
+        :param compress: Whether to gzip the zone file on the fly, which is
+            streamed with a "Content-Encoding: gzip" header.
         :return: (response, body) tuple.
         """
-        zonefile = zonefile_data or dns_data_utils.rand_zonefile_data()
-        if attributes is not None:
-            if not headers:
-                headers = {'Content-Type': 'application/json'}
-            request_body = {
-                'zonefile': zonefile,
-                'attributes': attributes,
-            }
-        else:
-            if not headers:
-                headers = {'Content-Type': 'text/dns'}
-            request_body = zonefile
+        # Decided before the zone file is wrapped in the request body, which
+        # is a dict in JSON mode.
+        streamed = compress or self.is_zonefile_stream(zonefile_data)
+        headers, request_body = self.build_zone_import_request(
+            zonefile_data=zonefile_data, attributes=attributes,
+            headers=headers, compress=compress)
 
-        resp, body = self._create_request(
-            'zones/tasks/imports', request_body, headers=headers)
+        if streamed:
+            resp, body = self._upload_request(
+                'zones/tasks/imports', request_body, headers=headers,
+                compress=compress)
+        else:
+            resp, body = self._create_request(
+                'zones/tasks/imports', request_body, headers=headers)
 
         # Create Zone Import should return HTTP 202
         self.expected_success(202, resp.status)
@@ -83,6 +136,19 @@ class ZoneImportsClient(base.DnsClientV2Base):
         return self._list_request(
             'zones/tasks/imports', params=params, headers=headers)
 
+    def iter_zone_imports(self, params=None, headers=None,
+                          page_size=None):
+        """Lazily iterates over all zone imports, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of zone imports requested per page.
+        :return: A generator of serialized zone imports as dictionaries.
+        """
+        return self._iter_request(
+            'zones/tasks/imports', 'imports',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_zone_import(self, uuid, params=None, headers=None):
         """Deletes a imported zone having the specified UUID.
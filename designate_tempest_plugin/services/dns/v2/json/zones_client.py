@@ -11,11 +11,14 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+import collections
+
 from tempest.lib.common.utils import data_utils
 
 from designate_tempest_plugin.common import constants as const
 
 from designate_tempest_plugin import data_utils as dns_data_utils
+from designate_tempest_plugin.common import models
 from designate_tempest_plugin.common import waiters
 from designate_tempest_plugin.services.dns.v2.json import base
 
@@ -23,11 +26,77 @@ from designate_tempest_plugin.services.dns.v2.json import base
 class ZonesClient(base.DnsClientV2Base):
     """API V2 Tempest REST client for Designate API"""
 
+    RESULT_TYPES = {'zones': models.Zone}
+
+    def build_zone_data(self, name=None, email=None, ttl=None,
+                        description=None, attributes=None,
+                        zone_type=const.PRIMARY_ZONE_TYPE, primaries=None):
+        """Build the body of a zone creation request.
+
+        Missing values are randomly generated, see create_zone for the
+        meaning of the parameters.
+        :return: The zone as a dictionary.
+        """
+        zone = {
+            'name': name or dns_data_utils.rand_zone_name()
+            if name != '' else '',
+            'email': email or dns_data_utils.rand_email()
+            if email != '' else '',
+            'ttl': ttl or dns_data_utils.rand_ttl()
+            if ttl != 0 else 0,
+            'description': description or data_utils.rand_name('test-zone')
+            if description != '' else '',
+            'attributes': attributes or {
+                'attribute_key': data_utils.rand_name('attribute_value')}
+        }
+        # If SECONDARY, "email" and "ttl" cannot be supplied
+        if zone_type == const.SECONDARY_ZONE_TYPE:
+            zone['type'] = zone_type
+            del zone['email']
+            del zone['ttl']
+            if primaries is None:
+                raise AttributeError(
+                    'Error - "primaries" is mandatory parameter'
+                    ' for a SECONDARY zone type')
+
+            zone['masters'] = primaries
+
+        return zone
+
+    def build_zone_update_data(self, email=None, ttl=None,
+                               description=None):
+        """Build the body of a zone update request.
+
+        Missing values are randomly generated, see update_zone for the
+        meaning of the parameters.
+        :return: The zone as a dictionary.
+        """
+        return {
+            'email': email or dns_data_utils.rand_email(),
+            'ttl': ttl or dns_data_utils.rand_ttl(),
+            'description': description or data_utils.rand_name('test-zone'),
+        }
+
+    @staticmethod
+    def build_zone_headers(headers=None, project_id=None):
+        """Build the headers of a zone request.
+
+        :param headers (dict): The headers to use for the request.
+        :param project_id: When specified, the project the request is made
+                           on behalf of.
+        :return: The headers, or None to use the default ones.
+        """
+        if project_id:
+            headers = dict(headers or {})
+            headers['x-auth-sudo-project-id'] = project_id
+        return headers or None
+
     @base.handle_errors
     def create_zone(self, name=None, email=None, ttl=None, description=None,
                     attributes=None, wait_until=False,
                     zone_type=const.PRIMARY_ZONE_TYPE,
-                    primaries=None, params=None, project_id=None):
+                    primaries=None, params=None, project_id=None,
+                    headers=None):
 
         """Create a zone with the specified parameters.
 
@@ -52,38 +121,16 @@ class ZonesClient(base.DnsClientV2Base):
                        include in the request URI.
         :param project_id: When specified, overrides the project ID the zone
                            will be associated with.
+        :param headers (dict): The headers to use for the request.
         :return: A tuple with the server response and the created zone.
         """
 
-        zone = {
-            'name': name or dns_data_utils.rand_zone_name()
-            if name != '' else '',
-            'email': email or dns_data_utils.rand_email()
-            if email != '' else '',
-            'ttl': ttl or dns_data_utils.rand_ttl()
-            if ttl != 0 else 0,
-            'description': description or data_utils.rand_name('test-zone')
-            if description != '' else '',
-            'attributes': attributes or {
-                'attribute_key': data_utils.rand_name('attribute_value')}
-        }
-        # If SECONDARY, "email" and "ttl" cannot be supplied
-        if zone_type == const.SECONDARY_ZONE_TYPE:
-            zone['type'] = zone_type
-            del zone['email']
-            del zone['ttl']
-            if primaries is None:
-                raise AttributeError(
-                    'Error - "primaries" is mandatory parameter'
-                    ' for a SECONDARY zone type')
+        zone = self.build_zone_data(
+            name=name, email=email, ttl=ttl, description=description,
+            attributes=attributes, zone_type=zone_type, primaries=primaries)
 
-            zone['masters'] = primaries
-
-        headers = None
-        extra_headers = False
-        if project_id:
-            headers = {'x-auth-sudo-project-id': project_id}
-            extra_headers = True
+        headers = self.build_zone_headers(headers, project_id)
+        extra_headers = headers is not None
 
         resp, body = self._create_request('zones', zone, params=params,
                                           headers=headers,
@@ -98,6 +145,46 @@ class ZonesClient(base.DnsClientV2Base):
 
         return resp, body
 
+    def create_zones_bulk(self, zones, concurrency=10, wait_until=False,
+                          headers=None):
+        """Create many zones with a bounded number of requests in flight.
+
+        :param zones: An iterable of dicts, each holding the keyword arguments
+                      of a create_zone call.
+        :param concurrency: The maximum number of create requests in flight.
+            Default: 10
+        :param wait_until: Once every zone is created, block until all of
+                           them reach the desired status
+        :param headers (dict): The headers to use for the requests.
+        :return: A list of (response, zone) tuples, in the order of zones,
+                 once every zone is created.
+        :raises BulkRequestError: If a zone could not be created, with the
+                                  (response, zone) tuples of the zones which
+                                  were, so that they can be cleaned up.
+        """
+        # The zones created on behalf of another project, which are only
+        # listed, and so waited for, on behalf of that project too.
+        sudo_project_ids = {}
+
+        def create(kwargs):
+            resp, body = self.create_zone(headers=headers, **kwargs)
+            if kwargs.get('project_id'):
+                sudo_project_ids[body['id']] = kwargs['project_id']
+            return resp, body
+
+        results = self._bulk_request(create, zones, concurrency)
+
+        if wait_until:
+            zone_ids = collections.defaultdict(list)
+            for _, body in results:
+                zone_ids[sudo_project_ids.get(body['id'])].append(body['id'])
+            for project_id, ids in zone_ids.items():
+                waiters.wait_for_zones_status(
+                    self, ids, wait_until,
+                    headers=self.build_zone_headers(headers, project_id))
+
+        return results
+
     @base.handle_errors
     def show_zone(self, uuid, params=None, headers=None):
         """Gets a specific zone.
@@ -133,6 +220,19 @@ class ZonesClient(base.DnsClientV2Base):
         """
         return self._list_request('zones', params=params, headers=headers)
 
+    def iter_zones(self, params=None, headers=None,
+                   page_size=None):
+        """Lazily iterates over all zones, page by page.
+        :param params: A Python dict that represents the query parameters to
+                       include in the request URI.
+        :param headers (dict): The headers to use for the request.
+        :param page_size: The number of zones requested per page.
+        :return: A generator of serialized zones as dictionaries.
+        """
+        return self._iter_request(
+            'zones', 'zones',
+            params=params, headers=headers, page_size=page_size)
+
     @base.handle_errors
     def delete_zone(self, uuid, params=None, headers=None, delete_shares=None):
         """Deletes a zone having the specified UUID.
@@ -174,11 +274,8 @@ class ZonesClient(base.DnsClientV2Base):
         :param headers (dict): The headers to use for the request.
         :return: A tuple with the server response and the updated zone.
         """
-        zone = {
-            'email': email or dns_data_utils.rand_email(),
-            'ttl': ttl or dns_data_utils.rand_ttl(),
-            'description': description or data_utils.rand_name('test-zone'),
-        }
+        zone = self.build_zone_update_data(
+            email=email, ttl=ttl, description=description)
 
         resp, body = self._update_request('zones', uuid, zone, params=params,
                                           headers=headers)
@@ -11,12 +11,19 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+import os
+
 from oslo_utils import versionutils
 
 from tempest import test
 from tempest import config
 from tempest.lib.common.utils import test_utils as utils
 
+from designate_tempest_plugin.common import api_version_cache
+from designate_tempest_plugin.common import cassette
+from designate_tempest_plugin.common import json_codec
+from designate_tempest_plugin.common import metrics
+from designate_tempest_plugin.common import tracing
 from designate_tempest_plugin.services.dns.query.query_client import (
     QueryClient)
 from designate_tempest_plugin.tests import rbac_utils
@@ -108,6 +115,21 @@ class BaseDnsTest(rbac_utils.RBACTestsMixin, test.BaseTestCase):
         # API version check, so create one instance here.
         cls.zones_client = cls.os_primary.dns_v2.ZonesClient()
 
+        if CONF.dns.request_metrics_file:
+            metrics.add_jsonl_observer(CONF.dns.request_metrics_file)
+
+        api_version_cache.configure(
+            cache_dir=CONF.dns.api_version_cache_dir,
+            ttl=CONF.dns.api_version_cache_ttl)
+
+        if json_codec.active().name != CONF.dns.json_codec:
+            json_codec.use(json_codec.get_codec(CONF.dns.json_codec))
+
+        if CONF.dns.cassette_mode != 'off' and cassette.active() is None:
+            cassette.use(cassette.Cassette(
+                CONF.dns.cassette_path, CONF.dns.cassette_mode,
+                replay_latency=CONF.dns.cassette_replay_latency))
+
     @classmethod
     def resource_setup(cls):
         """Setup resources needed by the tests."""
@@ -116,6 +138,19 @@ class BaseDnsTest(rbac_utils.RBACTestsMixin, test.BaseTestCase):
         # The credential does not matter here.
         cls.api_version = cls.zones_client.get_max_api_version()
 
+    def setUp(self):
+        super(BaseDnsTest, self).setUp()
+
+        if CONF.dns.trace_dir:
+            tracer = tracing.Tracer()
+            tracing.use(tracer)
+            # Registered first, so that it runs after the test cleanups.
+            self.addCleanup(self._write_trace, tracer)
+
+    def _write_trace(self, tracer):
+        tracing.use(None)
+        tracer.write(os.path.join(CONF.dns.trace_dir, self.id() + '.json'))
+
     def assertExpected(self, expected, actual, excluded_keys):
         for key, value in expected.items():
             if key not in excluded_keys:
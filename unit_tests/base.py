@@ -0,0 +1,131 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import collections
+from http import server
+import json
+import threading
+
+import testtools
+
+# A request received by FakeDesignate.
+Request = collections.namedtuple('Request', ['method', 'path', 'headers',
+                                             'body'])
+
+
+class FakeAuthProvider(object):
+    """An auth provider pointing the clients to a local server."""
+
+    def __init__(self, base_url):
+        self._base_url = base_url
+        self.auth_requests = 0
+
+    def auth_request(self, method, url, headers=None, body=None,
+                     filters=None):
+        self.auth_requests += 1
+        return self._base_url + '/' + url.lstrip('/'), headers, body
+
+    def base_url(self, filters=None):
+        self.auth_requests += 1
+        return self._base_url
+
+    def get_token(self):
+        return 'token'
+
+    def set_alt_auth_data(self, *args, **kwargs):
+        pass
+
+
+class _Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _read_body(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if not size:
+                    self.rfile.readline()
+                    return b''.join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _handle(self):
+        request = Request(self.command, self.path, dict(self.headers),
+                          self._read_body())
+        self.server.requests.append(request)
+        status, headers, body = self.server.app(request)
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf-8')
+            headers = dict({'Content-Type': 'application/json'}, **headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeDesignate(object):
+    """A local HTTP server answering the requests with an application.
+
+    :param app: A callable taking a Request and returning a (status,
+                headers, body) tuple, the body being bytes or a JSON
+                serializable object.
+    """
+
+    def __init__(self, app):
+        self._server = server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.app = app
+        self._server.requests = []
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        daemon=True)
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d' % self._server.server_port
+
+    @property
+    def requests(self):
+        return self._server.requests
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestCase(testtools.TestCase):
+    """Runs the clients against a FakeDesignate server."""
+
+    def app(self, request):
+        return 404, {}, {'code': 404, 'type': 'not_found'}
+
+    def setUp(self):
+        super(TestCase, self).setUp()
+        self.server = FakeDesignate(self.app)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.auth_provider = FakeAuthProvider(self.server.url)
+
+    def make_client(self, cls, **kwargs):
+        return cls(self.auth_provider, 'dns', 'RegionOne', **kwargs)
@@ -0,0 +1,207 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import json
+import threading
+import time
+
+from designate_tempest_plugin.services.dns.v2 import aio
+from designate_tempest_plugin.services.dns.v2.json import recordset_client
+from designate_tempest_plugin.services.dns.v2.json import zone_exports_client
+from designate_tempest_plugin.services.dns.v2.json import zone_imports_client
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+ZONEFILE = b'$ORIGIN example.org.\nwww.example.org. IN A 192.0.2.1\n'
+
+
+class AsyncClientsTest(base.TestCase):
+    """Runs the asyncio clients against a fake zones API."""
+
+    def app(self, request):
+        path = request.path.split('?')[0]
+        if self.consumed_at_first_request is None:
+            self.consumed_at_first_request = len(self.consumed)
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self._route(request, path)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def _route(self, request, path):
+        if path == '/v2/zones' and request.method == 'POST':
+            zone = dict(json.loads(request.body), id='zone-%d' % len(
+                self.zones), status='PENDING')
+            self.zones[zone['id']] = zone
+            return 202, {}, zone
+        if path == '/v2/zones':
+            zones = sorted(self.zones.values(), key=lambda z: z['id'])
+            if 'marker=' in request.path:
+                marker = request.path.split('marker=')[1].split('&')[0]
+                zones = [z for z in zones if z['id'] > marker]
+            links = {}
+            if len(zones) > 2:
+                zones = zones[:2]
+                links['next'] = '%s/v2/zones?limit=2&marker=%s' % (
+                    self.server.url, zones[-1]['id'])
+            return 200, {}, {'zones': zones, 'links': links}
+        if path.endswith('/recordsets') and request.method == 'POST':
+            recordset = dict(json.loads(request.body), id='rs-%s' % len(
+                self.server.requests), status='PENDING')
+            return 202, {}, recordset
+        if path.endswith('/export'):
+            return 200, {'Content-Type': 'text/dns'}, ZONEFILE
+        if path == '/v2/zones/tasks/imports':
+            return 202, {}, {'id': 'import-id', 'status': 'PENDING'}
+        zone = self.zones[path.rsplit('/', 1)[1]]
+        if request.method == 'PATCH':
+            zone.update(json.loads(request.body))
+            return 202, {}, zone
+        if request.method == 'DELETE':
+            return 202, {}, dict(self.zones.pop(zone['id']),
+                                 action='DELETE')
+        # The zones are ACTIVE once shown.
+        shown = dict(zone)
+        zone['status'] = 'ACTIVE'
+        return 200, {}, shown
+
+    def setUp(self):
+        super(AsyncClientsTest, self).setUp()
+        self.zones = {}
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0
+        self.consumed = []
+        self.consumed_at_first_request = None
+
+    def run_client(self, async_cls, sync_cls, func):
+        async def run():
+            async with async_cls(self.make_client(sync_cls)) as client:
+                client.build_interval = 0.01
+                return await func(client)
+        return asyncio.run(run())
+
+    def _create_zone(self, client, name='example.org.', **kwargs):
+        return client.create_zone(name=name, email='admin@example.org',
+                                  ttl=3600, **kwargs)
+
+    def test_zones(self):
+        async def zones(client):
+            _, created = await self._create_zone(client, wait_until='ACTIVE')
+            _, shown = await client.show_zone(created['id'])
+            _, updated = await client.update_zone(
+                created['id'], email='dns@example.org', ttl=600,
+                description='updated')
+            _, listed = await client.list_zones()
+            _, deleted = await client.delete_zone(created['id'])
+            return created, shown, updated, listed, deleted
+
+        created, shown, updated, listed, deleted = self.run_client(
+            aio.AsyncZonesClient, zones_client.ZonesClient, zones)
+
+        self.assertEqual('PENDING', created['status'])
+        self.assertEqual('ACTIVE', shown['status'])
+        self.assertEqual(600, updated['ttl'])
+        self.assertEqual([created['id']],
+                         [zone['id'] for zone in listed['zones']])
+        self.assertEqual('DELETE', deleted['action'])
+        self.assertEqual({}, self.zones)
+
+    def test_iter_zones(self):
+        for i in range(5):
+            self.zones['zone-%d' % i] = {'id': 'zone-%d' % i}
+
+        async def iter_zones(client):
+            return [zone['id'] async for zone in client.iter_zones()]
+
+        self.assertEqual(
+            ['zone-%d' % i for i in range(5)],
+            self.run_client(aio.AsyncZonesClient, zones_client.ZonesClient,
+                            iter_zones))
+
+    def test_create_zones_bulk(self):
+        self.delay = 0.05
+
+        def payloads():
+            for i in range(6):
+                self.consumed.append(i)
+                yield {'name': 'zone%d.org.' % i,
+                       'email': 'admin@example.org', 'ttl': 3600}
+
+        results = self.run_client(
+            aio.AsyncZonesClient, zones_client.ZonesClient,
+            lambda client: client.create_zones_bulk(
+                payloads(), concurrency=2, wait_until='ACTIVE'))
+
+        self.assertEqual(['zone%d.org.' % i for i in range(6)],
+                         [body['name'] for _, body in results])
+        self.assertEqual(2, self.max_in_flight)
+        # The payloads are consumed as the requests go.
+        self.assertLessEqual(self.consumed_at_first_request, 3)
+        self.assertEqual('ACTIVE', self.zones['zone-5']['status'])
+
+    def test_create_recordsets_bulk(self):
+        results = self.run_client(
+            aio.AsyncRecordsetClient, recordset_client.RecordsetClient,
+            lambda client: client.create_recordsets_bulk(
+                'zone-id', [{'name': 'www%d.example.org.' % i, 'type': 'A',
+                             'records': ['192.0.2.1']} for i in range(3)],
+                concurrency=2))
+
+        self.assertEqual(['www%d.example.org.' % i for i in range(3)],
+                         [body['name'] for _, body in results])
+
+    def test_show_exported_zonefile(self):
+        _, zonefile = self.run_client(
+            aio.AsyncZoneExportsClient, zone_exports_client.ZoneExportsClient,
+            lambda client: client.show_exported_zonefile('export-id'))
+
+        self.assertEqual('example.org.', zonefile.origin)
+        self.assertEqual('text/dns', self.server.requests[0].headers['Accept'])
+
+    def test_create_zone_import(self):
+        _, body = self.run_client(
+            aio.AsyncZoneImportsClient, zone_imports_client.ZoneImportsClient,
+            lambda client: client.create_zone_import(ZONEFILE))
+
+        self.assertEqual('import-id', body['id'])
+        self.assertEqual(ZONEFILE, self.server.requests[0].body)
+
+    def test_token_is_fetched_off_the_event_loop(self):
+        auth_request = self.auth_provider.auth_request
+        threads = []
+
+        def record_thread(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return auth_request(*args, **kwargs)
+
+        self.auth_provider.auth_request = record_thread
+        self.run_client(aio.AsyncZonesClient, zones_client.ZonesClient,
+                        self._create_zone)
+
+        self.assertNotIn(threading.main_thread(), threads)
+
+        # Once a token is cached, the requests are authenticated right away.
+        self.auth_provider.cache = ('token', {})
+        self.auth_provider.is_expired = lambda cache: False
+        threads.clear()
+        self.run_client(aio.AsyncZonesClient, zones_client.ZonesClient,
+                        self._create_zone)
+
+        self.assertEqual([threading.main_thread()], threads)
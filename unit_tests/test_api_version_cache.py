@@ -0,0 +1,74 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import os
+import shutil
+import tempfile
+
+import testtools
+
+from designate_tempest_plugin.common import api_version_cache
+from designate_tempest_plugin.common import cassette
+
+
+class ApiVersionCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ApiVersionCacheTest, self).setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        api_version_cache.configure(cache_dir=self.cache_dir)
+        self.addCleanup(api_version_cache.configure)
+        self.addCleanup(api_version_cache.clear)
+        self.fetched = []
+
+    def _get(self, url):
+        def fetch():
+            self.fetched.append(url)
+            resp = cassette.Response(
+                200, {'content-type': 'application/json'}, url)
+            return resp, url.encode('utf-8')
+
+        # A new process, sharing only the cache files.
+        api_version_cache.clear()
+        return api_version_cache.get('service=dns', fetch,
+                                     endpoint=lambda: url)[1]
+
+    def test_files_are_shared_per_endpoint(self):
+        self.assertEqual(b'http://cloud1', self._get('http://cloud1'))
+        self.assertEqual(b'http://cloud1', self._get('http://cloud1'))
+        self.assertEqual(b'http://cloud2', self._get('http://cloud2'))
+
+        self.assertEqual(['http://cloud1', 'http://cloud2'], self.fetched)
+
+    def test_file_of_another_format(self):
+        self._get('http://cloud1')
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'w') as f:
+                f.write('{"document": "old"}')
+
+        self.assertEqual(b'http://cloud1', self._get('http://cloud1'))
+        self.assertEqual(2, len(self.fetched))
+
+    def test_replay_skips_the_endpoint(self):
+        self.addCleanup(cassette.use, None)
+        fd, path = tempfile.mkstemp(dir=self.cache_dir)
+        os.close(fd)
+        cassette.use(cassette.Cassette(path, cassette.REPLAY))
+
+        def endpoint():
+            raise AssertionError('The endpoint was resolved')
+
+        api_version_cache.get(
+            'service=dns', lambda: (cassette.Response(200, {}, ''), b'{}'),
+            endpoint=endpoint)
@@ -0,0 +1,110 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+
+from designate_tempest_plugin.common import exceptions
+from designate_tempest_plugin.services.dns.v2.json import recordset_client
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+HEADERS = {'x-auth-all-projects': 'True'}
+
+
+class BulkCreateTest(base.TestCase):
+
+    def app(self, request):
+        return 202, {}, {'id': 'id-%d' % len(self.server.requests)}
+
+    def test_create_zones_bulk(self):
+        client = self.make_client(zones_client.ZonesClient)
+
+        results = client.create_zones_bulk(
+            [{'name': 'zone%d.org.' % i, 'email': 'admin@example.org',
+              'ttl': 3600} for i in range(3)],
+            concurrency=2, headers=HEADERS)
+
+        # Every zone is created before the method returns.
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual(3, len(results))
+        for request in self.server.requests:
+            self.assertEqual('True', request.headers['x-auth-all-projects'])
+            self.assertEqual('application/json',
+                             request.headers['Content-Type'])
+
+    def test_create_recordsets_bulk(self):
+        client = self.make_client(recordset_client.RecordsetClient)
+
+        results = client.create_recordsets_bulk(
+            'zone-id', [{'name': 'www%d.example.org.' % i, 'type': 'A',
+                         'records': ['192.0.2.1']} for i in range(3)],
+            concurrency=2, headers=HEADERS)
+
+        self.assertEqual(3, len(self.server.requests))
+        self.assertEqual(3, len(results))
+        for request in self.server.requests:
+            self.assertEqual('True', request.headers['x-auth-all-projects'])
+
+
+class BulkCreateZonesTest(base.TestCase):
+    """Runs create_zones_bulk against zones listed per project."""
+
+    def app(self, request):
+        project_id = request.headers.get('x-auth-sudo-project-id')
+        if request.method == 'POST':
+            name = json.loads(request.body)['name']
+            if name.startswith('fail'):
+                return 500, {}, {'code': 500, 'type': 'error'}
+            zone = {'id': name, 'status': 'ACTIVE', 'project': project_id}
+            self.zones.append(zone)
+            return 202, {}, dict(zone, status='PENDING')
+        return 200, {}, {'zones': [zone for zone in self.zones
+                                   if zone['project'] == project_id],
+                         'links': {}}
+
+    def setUp(self):
+        super(BulkCreateZonesTest, self).setUp()
+        self.zones = []
+        self.client = self.make_client(zones_client.ZonesClient)
+
+    def _zones(self, *names, **kwargs):
+        return [dict({'name': name, 'email': 'admin@example.org',
+                      'ttl': 3600}, **kwargs) for name in names]
+
+    def test_wait_for_zones_of_other_projects(self):
+        zones = (self._zones('zone1.org.') +
+                 self._zones('zone2.org.', project_id='other'))
+
+        results = self.client.create_zones_bulk(
+            zones, wait_until='ACTIVE')
+
+        self.assertEqual(['zone1.org.', 'zone2.org.'],
+                         [body['id'] for _, body in results])
+        listings = [r for r in self.server.requests if r.method == 'GET']
+        self.assertEqual(
+            [None, 'other'],
+            sorted((r.headers.get('x-auth-sudo-project-id')
+                    for r in listings), key=str))
+
+    def test_failure_keeps_the_created_zones(self):
+        zones = self._zones('zone1.org.', 'fail.org.', 'zone2.org.')
+
+        e = self.assertRaises(exceptions.BulkRequestError,
+                              self.client.create_zones_bulk, zones,
+                              concurrency=1)
+
+        self.assertEqual(['zone1.org.'],
+                         [body['id'] for _, body in e.results])
+        self.assertEqual(1, len(e.errors))
+        # No zone is created after a failure.
+        self.assertEqual(2, len(self.server.requests))
@@ -0,0 +1,125 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import io
+import os
+import tempfile
+
+from designate_tempest_plugin.common import api_version_cache
+from designate_tempest_plugin.common import cassette
+from designate_tempest_plugin.services.dns.v2.json import zone_exports_client
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+ZONEFILE = b'$ORIGIN example.org.\nexample.org. IN NS ns.example.org.\n'
+
+
+class CassetteTest(base.TestCase):
+
+    def app(self, request):
+        if request.path == '/':
+            return 200, {}, {'versions': [
+                {'id': 'v2.1', 'status': 'CURRENT'}]}
+        if request.path.endswith('/export'):
+            return 200, {'Content-Type': 'text/dns'}, ZONEFILE
+        if 'marker=zone-2' in request.path:
+            return 200, {}, {'zones': [{'id': 'zone-3'}], 'links': {}}
+        return 200, {}, {
+            'zones': [{'id': 'zone-1'}, {'id': 'zone-2'}],
+            'links': {'next': self.server.url +
+                      '/v2/zones?limit=2&marker=zone-2'}}
+
+    def setUp(self):
+        super(CassetteTest, self).setUp()
+        fd, self.path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        self.addCleanup(cassette.use, None)
+        self.addCleanup(api_version_cache.clear)
+
+    def record_and_replay(self, func):
+        tape = cassette.Cassette(self.path, cassette.RECORD)
+        cassette.use(tape)
+        recorded = func()
+        tape.close()
+        requests = len(self.server.requests)
+
+        cassette.use(cassette.Cassette(self.path, cassette.REPLAY))
+        replayed = func()
+
+        self.assertEqual(requests, len(self.server.requests))
+        return recorded, replayed
+
+    def test_streamed_list(self):
+        client = self.make_client(zones_client.ZonesClient)
+        client.stream_list_bodies = True
+
+        recorded, replayed = self.record_and_replay(
+            lambda: [z['id'] for z in client.iter_zones(page_size=2)])
+
+        self.assertEqual(['zone-1', 'zone-2', 'zone-3'], recorded)
+        self.assertEqual(recorded, replayed)
+
+    def test_download(self):
+        client = self.make_client(zone_exports_client.ZoneExportsClient)
+
+        def download():
+            _, chunks = client.download_exported_zonefile('export-id')
+            return b''.join(chunks)
+
+        recorded, replayed = self.record_and_replay(download)
+
+        self.assertEqual(ZONEFILE, recorded)
+        self.assertEqual(ZONEFILE, replayed)
+
+    def test_download_to_file(self):
+        client = self.make_client(zone_exports_client.ZoneExportsClient)
+
+        def download():
+            f = io.BytesIO()
+            client.download_exported_zonefile('export-id', fileobj=f)
+            return f.getvalue()
+
+        recorded, replayed = self.record_and_replay(download)
+
+        self.assertEqual(ZONEFILE, recorded)
+        self.assertEqual(ZONEFILE, replayed)
+
+    def test_gzip_download(self):
+        client = self.make_client(zone_exports_client.ZoneExportsClient,
+                                  accept_gzip=True)
+
+        def download():
+            _, chunks = client.download_exported_zonefile('export-id')
+            return b''.join(chunks)
+
+        recorded, replayed = self.record_and_replay(download)
+
+        self.assertEqual(recorded, replayed)
+
+    def test_versions_document_needs_no_auth(self):
+        client = self.make_client(zones_client.ZonesClient)
+
+        def get_max_api_version():
+            api_version_cache.clear()
+            auth_requests = self.auth_provider.auth_requests
+            version = client.get_max_api_version()
+            return version, self.auth_provider.auth_requests - auth_requests
+
+        recorded, replayed = self.record_and_replay(get_max_api_version)
+
+        self.assertEqual(('2.1', 1), recorded)
+        self.assertEqual(('2.1', 0), replayed)
+        # Cache hits need no auth either.
+        self.assertEqual('2.1', client.get_max_api_version())
+        self.assertEqual(1, self.auth_provider.auth_requests)
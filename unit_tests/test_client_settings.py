@@ -0,0 +1,65 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.common import rate_limit
+from designate_tempest_plugin.services.dns.json import base as dns_base
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+
+class ClientSettingsTest(base.TestCase):
+    """The settings of a client do not leak into the other clients."""
+
+    def app(self, request):
+        return 200, {}, {'id': 'zone-id', 'serial': 1}
+
+    def test_accept_gzip(self):
+        gzip_client = self.make_client(zones_client.ZonesClient,
+                                       accept_gzip=True)
+        client = self.make_client(zones_client.ZonesClient)
+
+        gzip_client.show_zone('zone-id')
+        client.show_zone('zone-id')
+
+        self.assertFalse(dns_base.DnsClientBase.accept_gzip)
+        self.assertEqual('gzip',
+                         self.server.requests[0].headers['Accept-Encoding'])
+        self.assertNotEqual(
+            'gzip', self.server.requests[1].headers.get('Accept-Encoding'))
+
+    def test_cache_show_requests(self):
+        caching_client = self.make_client(
+            zones_client.ZonesClient, cache_show_requests=True,
+            show_cache_ttl=60)
+        client = self.make_client(zones_client.ZonesClient)
+
+        for _ in range(2):
+            caching_client.show_zone('zone-id')
+            client.show_zone('zone-id')
+
+        self.assertFalse(dns_base.DnsClientBase.cache_show_requests)
+        self.assertEqual(3, len(self.server.requests))
+
+    def test_rate_limiter(self):
+        limiter = rate_limit.RateLimiter()
+        limiter.add_rule(1000, client_class='ZonesClient')
+        limited_client = self.make_client(zones_client.ZonesClient,
+                                          rate_limiter=limiter)
+        client = self.make_client(zones_client.ZonesClient)
+
+        limited_client.show_zone('zone-id')
+        client.show_zone('zone-id')
+
+        stats = limiter.stats()['ZonesClient']
+        self.assertEqual(1, sum(s['requests'] for s in stats.values()))
+        self.assertIsNone(rate_limit.active())
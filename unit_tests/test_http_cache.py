@@ -0,0 +1,80 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import itertools
+
+from designate_tempest_plugin.common import http_cache
+from designate_tempest_plugin.services.dns.v2.json import recordset_client
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+
+class ResponseCacheTest(base.TestCase):
+
+    def setUp(self):
+        super(ResponseCacheTest, self).setUp()
+        self.serials = itertools.count(1)
+        self.zones_client = self.make_client(
+            zones_client.ZonesClient, cache_show_requests=True,
+            show_cache_ttl=60)
+
+    def app(self, request):
+        if request.method == 'POST':
+            return 202, {}, {'id': 'recordset-id', 'status': 'PENDING'}
+        return 200, {}, {'id': 'zone-id', 'serial': next(self.serials)}
+
+    def show_serial(self):
+        return self.zones_client.show_zone('zone-id')[1]['serial']
+
+    def test_show_is_cached(self):
+        self.assertEqual(1, self.show_serial())
+        self.assertEqual(1, self.show_serial())
+        self.assertEqual(1, len(self.server.requests))
+
+    def test_write_through_another_client_invalidates(self):
+        client = self.make_client(recordset_client.RecordsetClient)
+        self.assertEqual(1, self.show_serial())
+
+        client.create_recordset('zone-id', {'name': 'www', 'type': 'A',
+                                            'records': ['10.0.0.1']})
+
+        self.assertEqual(2, self.show_serial())
+
+    def test_write_to_another_zone_does_not_invalidate(self):
+        client = self.make_client(recordset_client.RecordsetClient)
+        self.assertEqual(1, self.show_serial())
+
+        client.create_recordset('other-zone-id', {'name': 'www', 'type': 'A',
+                                                  'records': ['10.0.0.1']})
+
+        self.assertEqual(1, self.show_serial())
+
+    def test_invalidate_all(self):
+        cache = http_cache.ResponseCache()
+        resp = {'status': '200'}
+        for uri in ('v2/zones/zone-id', 'v2/zones/zone-id/recordsets/rs-id',
+                    'v2/zones/other-id', 'v2/zones/tasks/imports/import-id'):
+            cache.put(cache.make_key(uri), resp, b'{}')
+
+        http_cache.invalidate_all('v2/zones/zone-id/recordsets')
+
+        self.assertIsNone(cache.get(cache.make_key('v2/zones/zone-id')))
+        self.assertIsNone(cache.get(
+            cache.make_key('v2/zones/zone-id/recordsets/rs-id')))
+        self.assertIsNotNone(cache.get(cache.make_key('v2/zones/other-id')))
+
+        http_cache.invalidate_all('v2/zones/tasks/imports')
+
+        self.assertIsNotNone(cache.get(cache.make_key('v2/zones/other-id')))
+        self.assertIsNone(cache.get(
+            cache.make_key('v2/zones/tasks/imports/import-id')))
@@ -0,0 +1,118 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from tempest.lib.common import http
+
+from designate_tempest_plugin.common import http_pool
+from designate_tempest_plugin.services.dns.v2.json import recordset_client
+from designate_tempest_plugin.services.dns.v2.json import tld_client
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+
+class ConnectionPoolsTest(base.TestCase):
+
+    def setUp(self):
+        super(ConnectionPoolsTest, self).setUp()
+        self.pools = http_pool.ConnectionPools(maxsize=2)
+
+    def app(self, request):
+        return 200, {}, {'id': 'zone-id', 'serial': 1}
+
+    def make_pooled_client(self, cls=zones_client.ZonesClient, **kwargs):
+        return self.make_client(cls, connection_pools=self.pools, **kwargs)
+
+    def test_clients_of_a_credential_share_a_pool(self):
+        zones = self.make_pooled_client()
+        tlds = self.make_pooled_client(tld_client.TldClient)
+
+        self.assertIsInstance(zones.http_obj, http_pool.KeepAliveHttp)
+        self.assertIs(zones.http_obj, tlds.http_obj)
+
+    def test_credentials_do_not_share_a_pool(self):
+        client = self.make_pooled_client()
+        self.auth_provider = base.FakeAuthProvider(self.server.url)
+        other_client = self.make_pooled_client()
+
+        self.assertIsNot(client.http_obj, other_client.http_obj)
+
+    def test_redirect_settings_do_not_share_a_pool(self):
+        zones = self.make_pooled_client()
+        recordsets = self.make_pooled_client(recordset_client.RecordsetClient)
+
+        self.assertIsNot(zones.http_obj, recordsets.http_obj)
+        self.assertFalse(recordsets.http_obj.follow_redirects)
+
+    def test_settings_are_carried_over(self):
+        client = self.make_pooled_client(
+            disable_ssl_certificate_validation=True, http_timeout=30)
+        default_client = self.make_pooled_client()
+
+        self.assertIsNot(client.http_obj, default_client.http_obj)
+        kw = client.http_obj.connection_pool_kw
+        self.assertEqual('CERT_NONE', kw['cert_reqs'])
+        self.assertEqual(30, kw['timeout'])
+        self.assertEqual(2, kw['maxsize'])
+
+    def test_proxies_are_left_alone(self):
+        proxy = http.ClosingProxyHttp('http://proxy:3128')
+
+        self.assertIs(proxy, self.pools.get(self.auth_provider, proxy))
+
+    def test_connections_are_reused(self):
+        zones = self.make_pooled_client()
+        tlds = self.make_pooled_client(tld_client.TldClient)
+
+        for _ in range(3):
+            zones.show_zone('zone-id')
+            tlds.show_tld('tld-id')
+
+        expected = {'requests': 6, 'new_connections': 1,
+                    'reused_connections': 5}
+        self.assertEqual(expected, zones.connection_stats())
+        self.assertEqual(expected, tlds.connection_stats())
+        self.assertEqual(expected, self.pools.stats())
+        self.assertEqual(6, len(self.server.requests))
+
+    def test_stats_are_summed_over_credentials(self):
+        client = self.make_pooled_client()
+        self.auth_provider = base.FakeAuthProvider(self.server.url)
+        other_client = self.make_pooled_client()
+
+        client.show_zone('zone-id')
+        client.show_zone('zone-id')
+        other_client.show_zone('zone-id')
+
+        self.assertEqual({'requests': 2, 'new_connections': 1,
+                          'reused_connections': 1},
+                         client.connection_stats())
+        self.assertEqual({'requests': 3, 'new_connections': 2,
+                          'reused_connections': 1},
+                         self.pools.stats())
+
+    def test_without_pools(self):
+        client = self.make_client(zones_client.ZonesClient)
+
+        client.show_zone('zone-id')
+
+        self.assertNotIsInstance(client.http_obj, http_pool.KeepAliveHttp)
+        self.assertIsNone(client.connection_stats())
+
+    def test_active_pools(self):
+        http_pool.use(self.pools)
+        self.addCleanup(http_pool.use, None)
+
+        client = self.make_client(zones_client.ZonesClient)
+
+        self.assertIs(client.http_obj,
+                      self.pools.get(self.auth_provider, http.ClosingHttp()))
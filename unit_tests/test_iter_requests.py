@@ -0,0 +1,46 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.services.dns.v2.json import ptr_client
+from designate_tempest_plugin.services.dns.v2.json import service_client
+from unit_tests import base
+
+
+class IterRequestTest(base.TestCase):
+
+    def app(self, request):
+        path = request.path.split('?')[0]
+        key = path.rsplit('/', 1)[-1]
+        if 'marker=id-2' in request.path:
+            return 200, {}, {key: [{'id': 'id-3'}], 'links': {}}
+        return 200, {}, {
+            key: [{'id': 'id-1'}, {'id': 'id-2'}],
+            'links': {'next': self.server.url + path +
+                      '?limit=2&marker=id-2'}}
+
+    def test_iter_ptr_records(self):
+        client = self.make_client(ptr_client.PtrClient)
+
+        self.assertEqual(
+            ['id-1', 'id-2', 'id-3'],
+            [ptr['id'] for ptr in client.iter_ptr_records(page_size=2)])
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_iter_statuses(self):
+        client = self.make_client(service_client.ServiceClient)
+
+        self.assertEqual(
+            ['id-1', 'id-2', 'id-3'],
+            [status['id'] for status in client.iter_statuses(page_size=2)])
+        self.assertIn('/v2/service_statuses?limit=2&marker=id-2',
+                      self.server.requests[1].path)
@@ -0,0 +1,113 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+
+import testtools
+
+from designate_tempest_plugin.common import json_stream
+
+ITEMS = [
+    {'name': 'www.example.org.', 'records': ['192.0.2.1']},
+    {'name': 'q"uote\\d [{', 'records': ['"\\"', ']}']},
+    {'nested': [[1, [2]], {'a': {'b': []}}], 'n': 12345.5e-3},
+    'café ☃',
+    [],
+    {},
+    -42,
+    None,
+]
+DOCUMENT = {
+    'links': {'self': 'http://example.org/v2/recordsets?x=[1]'},
+    'recordsets': ITEMS,
+    'metadata': {'total_count': len(ITEMS), 'recordsets': []},
+}
+
+
+def _parse(data, size, key='recordsets'):
+    parser = json_stream.ArrayStreamParser(key)
+    items = []
+    for i in range(0, len(data), size):
+        items.extend(parser.feed(data[i:i + size]))
+    return items, parser.close()
+
+
+class ArrayStreamParserTest(testtools.TestCase):
+
+    def _assert_parsed(self, document, key='recordsets'):
+        data = json.dumps(document, ensure_ascii=False).encode('utf-8')
+        rest = dict(document, **{key: []})
+
+        # Every chunk size splits strings, escapes, numbers and UTF-8
+        # sequences at a different place.
+        for size in (1, 2, 3, 7, 64, len(data)):
+            items, doc = _parse(data, size, key)
+            self.assertEqual(document[key], items, 'chunk size %d' % size)
+            self.assertEqual(rest, doc, 'chunk size %d' % size)
+
+    def test_items(self):
+        self._assert_parsed(DOCUMENT)
+
+    def test_empty_array(self):
+        self._assert_parsed({'recordsets': [], 'links': {}})
+
+    def test_key_in_nested_object_is_ignored(self):
+        document = {
+            'metadata': {'recordsets': [1, 2]},
+            'recordsets': [3],
+            'links': ['"recordsets": [4]'],
+        }
+        self._assert_parsed(document)
+
+    def test_key_in_string_is_ignored(self):
+        document = {'a': '"recordsets": [1]', 'recordsets': [2]}
+        self._assert_parsed(document)
+
+    def test_whitespace(self):
+        data = b'{ "recordsets" :\n [ 1 ,\n\t2 , {"a": 3} ] ,\n "x": 1 }'
+
+        for size in (1, 5, len(data)):
+            items, doc = _parse(data, size)
+            self.assertEqual([1, 2, {'a': 3}], items)
+            self.assertEqual({'recordsets': [], 'x': 1}, doc)
+
+    def test_items_are_returned_as_they_complete(self):
+        parser = json_stream.ArrayStreamParser('recordsets')
+
+        self.assertEqual([], parser.feed(b'{"recordsets": [{"a": '))
+        self.assertEqual([], parser.feed(b'1}'))
+        self.assertEqual([{'a': 1}], parser.feed(b', 12'))
+        # The number may continue in the next chunk.
+        self.assertEqual([123], parser.feed(b'3]'))
+        self.assertEqual([], parser.feed(b'}'))
+        self.assertEqual({'recordsets': []}, parser.close())
+
+    def test_missing_key(self):
+        data = json.dumps({'zones': [1, 2]}).encode('utf-8')
+
+        items, doc = _parse(data, 3)
+
+        self.assertEqual([], items)
+        self.assertEqual({'zones': [1, 2]}, doc)
+
+    def test_truncated(self):
+        data = json.dumps(DOCUMENT).encode('utf-8')
+
+        for end in (5, data.index(b'recordsets') + 20, len(data) - 1):
+            self.assertRaises(ValueError, _parse, data[:end], 4)
+
+    def test_invalid_separator(self):
+        parser = json_stream.ArrayStreamParser('recordsets')
+
+        self.assertRaises(ValueError, parser.feed,
+                          b'{"recordsets": [1 2]}')
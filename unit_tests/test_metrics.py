@@ -0,0 +1,53 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import os
+import tempfile
+
+from oslo_serialization import jsonutils as json
+import testtools
+
+from designate_tempest_plugin.common import metrics
+
+
+class JsonLinesObserverTest(testtools.TestCase):
+
+    def setUp(self):
+        super(JsonLinesObserverTest, self).setUp()
+        fd, self.path = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+
+    def _read(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_observe(self):
+        observer = metrics.JsonLinesObserver(self.path)
+        observer.FLUSH_LINES = 2
+        sample = metrics.RequestSample('GET', 'v2/zones', 200, 0, 10, 0.1)
+
+        observer.observe(sample)
+        # The lines are buffered until FLUSH_LINES are observed.
+        self.assertEqual([], self._read())
+        observer.observe(sample)
+        self.assertEqual(2, len(self._read()))
+        observer.observe(sample)
+        observer.close()
+
+        lines = self._read()
+        self.assertEqual(3, len(lines))
+        self.assertEqual(sample._asdict(), lines[0])
+
+    def test_observe_is_abstract(self):
+        self.assertRaises(TypeError, metrics.RequestObserver)
@@ -0,0 +1,242 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import codecs
+import io
+import operator
+import pickle
+import sys
+
+import testtools
+
+from designate_tempest_plugin.common import models
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+ZONEFILE = ('$ORIGIN example.org.\n'
+            '$TTL 300\n'
+            'www.example.org. IN A 192.0.2.1\n'
+            'mail.example.org. IN A 192.0.2.2\n')
+
+
+class ZoneFileTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ZoneFileTest, self).setUp()
+        self.zonefile = models.ZoneFile('example.org.', 300, [
+            models.ZoneFileRecord('www.example.org.', 'A', '192.0.2.1'),
+            models.ZoneFileRecord('mail.example.org.', 'A', '192.0.2.2')])
+
+    def test_write_to_text(self):
+        f = io.StringIO()
+
+        self.assertEqual(2, self.zonefile.write_to(f))
+        self.assertEqual(ZONEFILE, f.getvalue())
+
+    def test_write_to_binary(self):
+        f = io.BytesIO()
+
+        self.assertEqual(2, self.zonefile.write_to(f))
+        self.assertEqual(ZONEFILE.encode('utf-8'), f.getvalue())
+
+    def test_write_to_stream_writer(self):
+        # Text file-like objects are not all io.TextIOBase instances.
+        f = io.BytesIO()
+
+        self.zonefile.write_to(codecs.getwriter('utf-8')(f))
+        self.assertEqual(ZONEFILE.encode('utf-8'), f.getvalue())
+
+    def test_write_to_in_batches(self):
+        self.zonefile.WRITE_BATCH_SIZE = 1
+        f = io.BytesIO()
+
+        self.assertEqual(2, self.zonefile.write_to(f))
+        self.assertEqual(ZONEFILE.encode('utf-8'), f.getvalue())
+
+
+class ZoneFileRecordTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ZoneFileRecordTest, self).setUp()
+        self.record = models.ZoneFileRecord('www.example.org.', 'A',
+                                            '192.0.2.1')
+
+    def test_read_only(self):
+        self.assertRaises(AttributeError, setattr, self.record, 'data',
+                          '192.0.2.2')
+        self.assertRaises(AttributeError, setattr, self.record, 'ttl', 60)
+        self.assertRaises(AttributeError, delattr, self.record, 'name')
+        self.assertFalse(hasattr(self.record, '__dict__'))
+        self.assertEqual('192.0.2.1', self.record.data)
+
+    def test_equality(self):
+        same = models.ZoneFileRecord('www.example.org.', 'A', '192.0.2.1')
+        others = [
+            models.ZoneFileRecord('mail.example.org.', 'A', '192.0.2.1'),
+            models.ZoneFileRecord('www.example.org.', 'TXT', '192.0.2.1'),
+            models.ZoneFileRecord('www.example.org.', 'A', '192.0.2.2')]
+
+        self.assertEqual(same, self.record)
+        self.assertFalse(same != self.record)
+        self.assertEqual(hash(same), hash(self.record))
+        for other in others:
+            self.assertNotEqual(other, self.record)
+        self.assertEqual(4, len(set(others + [same, self.record])))
+
+    def test_not_equal_to_other_types(self):
+        as_dict = {'name': 'www.example.org.', 'type': 'A',
+                   'data': '192.0.2.1'}
+
+        self.assertNotEqual(as_dict, self.record)
+        self.assertNotEqual(self.record, str(self.record))
+
+    def test_values_are_strings(self):
+        record = models.ZoneFileRecord('www.example.org.', 'MX', 10)
+
+        self.assertEqual('10', record.data)
+        self.assertEqual(
+            record, models.ZoneFileRecord('www.example.org.', 'MX', '10'))
+
+    def test_interned(self):
+        name = ''.join(['www.', 'example.org.'])
+        record = models.ZoneFileRecord(name, ''.join(['A', 'AAA']), '::1')
+
+        self.assertIs(sys.intern('www.example.org.'), record.name)
+        self.assertIs(sys.intern('AAAA'), record.type)
+
+    def test_pickle(self):
+        record = pickle.loads(pickle.dumps(self.record))
+
+        self.assertEqual(self.record, record)
+        self.assertEqual(hash(self.record), hash(record))
+
+    def test_from_text(self):
+        self.assertEqual(self.record, models.ZoneFileRecord.from_text(
+            'www.example.org. 3600 IN A 192.0.2.1'))
+        self.assertRaises(ValueError, models.ZoneFileRecord.from_text, '')
+
+
+ZONE = {
+    'id': 'zone-id',
+    'name': 'example.org.',
+    'email': 'admin@example.org',
+    'ttl': 3600,
+    'status': 'ACTIVE',
+    'project_id': 'project-id',
+    'masters': [],
+    'attributes': {'tier': 'gold'},
+    'links': {'self': 'http://example.org/v2/zones/zone-id'},
+    'extra_field': 'extra',
+}
+
+
+class SlottedResourceTest(testtools.TestCase):
+
+    def test_mapping(self):
+        zone = models.Zone.from_dict(ZONE)
+        expected = dict(ZONE)
+        del expected['links']
+
+        self.assertEqual(expected, dict(zone))
+        self.assertEqual(expected, zone.to_dict())
+        self.assertEqual(len(expected), len(zone))
+        self.assertEqual('example.org.', zone['name'])
+        self.assertEqual('extra', zone['extra_field'])
+        self.assertEqual('admin@example.org', zone.get('email'))
+        self.assertEqual(zone, expected)
+
+    def test_missing_fields(self):
+        zone = models.Zone.from_dict({'id': 'zone-id', 'serial': None})
+
+        self.assertEqual({'id': 'zone-id', 'serial': None}, zone.to_dict())
+        self.assertIsNone(zone['serial'])
+        self.assertNotIn('name', zone)
+        self.assertNotIn('links', zone)
+        self.assertIsNone(zone.get('name'))
+        self.assertRaises(KeyError, zone.__getitem__, 'name')
+        self.assertRaises(KeyError, zone.__getitem__, 'unknown')
+
+    def test_lists_are_returned_as_new_lists(self):
+        recordset = models.Recordset.from_dict(
+            {'id': 'recordset-id', 'records': ['192.0.2.1', '192.0.2.2']})
+
+        records = recordset['records']
+        records.append('192.0.2.3')
+
+        self.assertEqual(['192.0.2.1', '192.0.2.2'], recordset['records'])
+        self.assertEqual(('192.0.2.1', '192.0.2.2'), recordset.records)
+
+    def test_interned_values(self):
+        status = ''.join(['ACT', 'IVE'])
+        zones = [models.Zone.from_dict({'status': ''.join(['ACT', 'IVE'])}),
+                 models.Zone.from_dict({'status': status})]
+
+        self.assertIs(zones[0]['status'], zones[1]['status'])
+
+    def test_read_only(self):
+        recordset = models.Recordset.from_dict({'id': 'recordset-id'})
+
+        self.assertRaises(AttributeError, setattr, recordset, 'id', 'other')
+        self.assertRaises(AttributeError, setattr, recordset, 'unknown', 1)
+        self.assertRaises(TypeError, operator.setitem, recordset, 'id',
+                          'other')
+        self.assertFalse(hasattr(recordset, '__dict__'))
+
+    def test_to_dict_is_mutable(self):
+        zone = models.Zone.from_dict(ZONE)
+
+        data = zone.to_dict()
+        data['name'] = 'example.com.'
+
+        self.assertEqual('example.org.', zone['name'])
+
+    def test_repr(self):
+        zone = models.Zone.from_dict({'id': 'zone-id'})
+
+        self.assertEqual("Zone({'id': 'zone-id'})", repr(zone))
+
+
+class TypedListResultsTest(base.TestCase):
+
+    def app(self, request):
+        return 200, {}, {'zones': [ZONE, dict(ZONE, id='other-id')],
+                         'links': {}, 'metadata': {'total_count': 2}}
+
+    def setUp(self):
+        super(TypedListResultsTest, self).setUp()
+        self.client = self.make_client(zones_client.ZonesClient)
+        self.client.typed_list_results = True
+
+    def test_list(self):
+        _, body = self.client.list_zones()
+
+        self.assertEqual({'total_count': 2}, body['metadata'])
+        self.assertEqual(['zone-id', 'other-id'],
+                         [zone['id'] for zone in body['zones']])
+        for zone in body['zones']:
+            self.assertIsInstance(zone, models.Zone)
+
+    def test_iter(self):
+        zones = list(self.client.iter_zones())
+
+        self.assertEqual(['zone-id', 'other-id'],
+                         [zone['id'] for zone in zones])
+        for zone in zones:
+            self.assertIsInstance(zone, models.Zone)
+
+    def test_untyped_list(self):
+        self.client.typed_list_results = False
+
+        _, body = self.client.list_zones()
+
+        self.assertEqual(ZONE, dict(body['zones'][0]))
@@ -0,0 +1,178 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+from unittest import mock
+
+import testtools
+
+from designate_tempest_plugin.common import rate_limit
+
+
+class _Clock(object):
+    """A monotonic clock only advancing when slept on."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class TokenBucketTest(testtools.TestCase):
+
+    def setUp(self):
+        super(TokenBucketTest, self).setUp()
+        self.clock = _Clock()
+        patcher = mock.patch.object(rate_limit, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_invalid_rate(self):
+        self.assertRaises(ValueError, rate_limit.TokenBucket, 0)
+
+    def test_burst_then_rate(self):
+        bucket = rate_limit.TokenBucket(rate=10, burst=3)
+
+        delays = [bucket.acquire() for _ in range(5)]
+
+        self.assertEqual([0.0, 0.0, 0.0], delays[:3])
+        self.assertAlmostEqual(0.1, delays[3])
+        self.assertAlmostEqual(0.1, delays[4])
+        self.assertEqual(2, len(self.clock.sleeps))
+
+    def test_refill(self):
+        bucket = rate_limit.TokenBucket(rate=10, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        self.clock.now += 0.15
+        self.assertEqual(0.0, bucket.acquire())
+        self.assertAlmostEqual(0.05, bucket.acquire())
+
+    def test_refill_is_capped_at_burst(self):
+        bucket = rate_limit.TokenBucket(rate=10, burst=2)
+
+        self.clock.now += 60
+        delays = [bucket.acquire() for _ in range(3)]
+
+        self.assertEqual([0.0, 0.0], delays[:2])
+        self.assertAlmostEqual(0.1, delays[2])
+
+    def test_waiters_reserve_their_token(self):
+        # Without sleeping, every request queues behind the previous ones.
+        self.clock.sleep = lambda delay: None
+        bucket = rate_limit.TokenBucket(rate=4)
+
+        delays = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual([0.0, 0.25, 0.5, 0.75], delays)
+
+    def test_stats(self):
+        bucket = rate_limit.TokenBucket(rate=10)
+        for _ in range(3):
+            bucket.acquire()
+
+        stats = bucket.stats()
+
+        self.assertEqual(3, stats['requests'])
+        self.assertEqual(2, stats['delayed'])
+        self.assertAlmostEqual(0.2, stats['total_delay'])
+        self.assertAlmostEqual(0.1, stats['max_delay'])
+        self.assertAlmostEqual(0.2 / 3, stats['mean_delay'])
+
+
+class BlockingTest(testtools.TestCase):
+
+    def test_concurrent_requests_are_spread(self):
+        bucket = rate_limit.TokenBucket(rate=50)
+        times = []
+        lock = threading.Lock()
+
+        def run():
+            bucket.acquire()
+            with lock:
+                times.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=run) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        # The first request goes through, the next ones every 20 ms.
+        self.assertEqual(5, len(times))
+        self.assertGreaterEqual(max(times) - start, 0.075)
+
+
+class RateLimiterTest(testtools.TestCase):
+
+    class ZonesClient(object):
+        def __init__(self, auth_provider):
+            self.auth_provider = auth_provider
+
+    class RecordsetClient(ZonesClient):
+        pass
+
+    def setUp(self):
+        super(RateLimiterTest, self).setUp()
+        patcher = mock.patch.object(rate_limit, 'TokenBucket')
+        self.bucket_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bucket_cls.side_effect = lambda rate, burst: mock.Mock(
+            rate=rate, **{'acquire.return_value': 0.0})
+        self.limiter = rate_limit.RateLimiter()
+
+    def test_invalid_rule(self):
+        self.assertRaises(ValueError, self.limiter.add_rule, 1)
+        self.assertRaises(ValueError, self.limiter.add_rule, 1,
+                          client_class='ZonesClient', template='v2/*')
+
+    def test_first_matching_rule_applies(self):
+        self.limiter.add_rule(1, template='v2/zones/{id}/recordsets*')
+        self.limiter.add_rule(2, client_class='ZonesClient')
+        self.limiter.add_rule(3, template='v2/*')
+        zones = self.ZonesClient('creds')
+        recordsets = self.RecordsetClient('creds')
+
+        self.limiter.acquire(zones, 'v2/zones/{id}/recordsets')
+        self.limiter.acquire(zones, 'v2/zones')
+        self.limiter.acquire(recordsets, 'v2/zones')
+        self.limiter.acquire(recordsets, 'v1/servers')
+
+        self.assertEqual([mock.call(1, 1), mock.call(2, 1), mock.call(3, 1)],
+                         self.bucket_cls.call_args_list)
+
+    def test_buckets_per_credential(self):
+        self.limiter.add_rule(1, client_class='ZonesClient')
+        self.limiter.add_rule(2, client_class='RecordsetClient',
+                              per_credential=False)
+        creds, other_creds = object(), object()
+
+        for auth_provider in (creds, creds, other_creds):
+            self.limiter.acquire(self.ZonesClient(auth_provider), 'v2/zones')
+            self.limiter.acquire(self.RecordsetClient(auth_provider),
+                                 'v2/zones')
+
+        stats = self.limiter.stats()
+        self.assertEqual({id(creds), id(other_creds)},
+                         set(stats['ZonesClient']))
+        self.assertEqual({None}, set(stats['RecordsetClient']))
+        self.assertEqual(3, self.bucket_cls.call_count)
@@ -0,0 +1,147 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import testtools
+
+from designate_tempest_plugin.common import models
+from designate_tempest_plugin.common import recordset_index
+from designate_tempest_plugin.services.dns.v2.json import recordset_client
+from unit_tests import base
+
+
+def _recordset(recordset_id, name, type_='A', zone_id='zone-id', **kwargs):
+    return dict(id=recordset_id, name=name, type=type_, zone_id=zone_id,
+                **kwargs)
+
+
+RECORDSETS = [
+    _recordset('rs-1', 'www.example.org.'),
+    _recordset('rs-2', 'www.example.org.', 'AAAA'),
+    _recordset('rs-3', 'mail.example.org.'),
+    _recordset('rs-4', 'www.example.org.', zone_id='other-zone-id'),
+]
+
+
+class RecordsetIndexTest(testtools.TestCase):
+
+    def setUp(self):
+        super(RecordsetIndexTest, self).setUp()
+        self.index = recordset_index.RecordsetIndex.from_listing(RECORDSETS)
+
+    def test_get(self):
+        self.assertEqual(4, len(self.index))
+        self.assertIn('rs-1', self.index)
+        self.assertIs(RECORDSETS[0], self.index.get('rs-1'))
+        self.assertIsNone(self.index.get('unknown'))
+        self.assertEqual(RECORDSETS, list(self.index))
+
+    def test_find(self):
+        self.assertIs(RECORDSETS[2],
+                      self.index.find('mail.example.org.', 'A'))
+        self.assertIs(RECORDSETS[1],
+                      self.index.find('www.example.org.', 'AAAA'))
+        self.assertIsNone(self.index.find('mail.example.org.', 'AAAA'))
+        self.assertIsNone(self.index.find('ftp.example.org.', 'A'))
+
+    def test_find_ignores_case_and_trailing_dot(self):
+        self.assertIs(RECORDSETS[2],
+                      self.index.find('MAIL.Example.org', 'a'))
+
+    def test_find_in_zone(self):
+        self.assertIs(RECORDSETS[0], self.index.find(
+            'www.example.org.', 'A', zone_id='zone-id'))
+        self.assertIs(RECORDSETS[3], self.index.find(
+            'www.example.org.', 'A', zone_id='other-zone-id'))
+        self.assertIsNone(self.index.find(
+            'www.example.org.', 'A', zone_id='unknown'))
+
+    def test_find_all(self):
+        self.assertEqual([RECORDSETS[0], RECORDSETS[3]],
+                         self.index.find_all('www.example.org', 'A'))
+        self.assertEqual([], self.index.find_all('ftp.example.org.', 'A'))
+
+    def test_by_zone(self):
+        self.assertEqual(RECORDSETS[:3], self.index.by_zone('zone-id'))
+        self.assertEqual([], self.index.by_zone('unknown'))
+
+    def test_add_replaces(self):
+        renamed = _recordset('rs-1', 'ftp.example.org.')
+
+        self.index.add(renamed)
+
+        self.assertEqual(4, len(self.index))
+        self.assertIs(renamed, self.index.get('rs-1'))
+        self.assertIs(renamed, self.index.find('ftp.example.org.', 'A'))
+        self.assertEqual([RECORDSETS[3]],
+                         self.index.find_all('www.example.org.', 'A'))
+
+    def test_remove(self):
+        self.assertIs(RECORDSETS[2], self.index.remove('rs-3'))
+        self.assertIsNone(self.index.remove('rs-3'))
+
+        self.assertNotIn('rs-3', self.index)
+        self.assertIsNone(self.index.find('mail.example.org.', 'A'))
+        self.assertEqual(RECORDSETS[:2], self.index.by_zone('zone-id'))
+
+    def test_apply(self):
+        created = _recordset('rs-5', 'ftp.example.org.', action='CREATE')
+        deleted = dict(RECORDSETS[0], action='DELETE')
+
+        self.index.apply(created)
+        self.index.apply(deleted)
+
+        self.assertIs(created, self.index.find('ftp.example.org.', 'A'))
+        self.assertNotIn('rs-1', self.index)
+        self.assertEqual([RECORDSETS[3]],
+                         self.index.find_all('www.example.org.', 'A'))
+
+    def test_slotted_recordsets(self):
+        recordsets = [models.Recordset.from_dict(r) for r in RECORDSETS]
+        index = recordset_index.RecordsetIndex.from_listing(recordsets)
+
+        self.assertIs(recordsets[3], index.find(
+            'www.example.org.', 'A', zone_id='other-zone-id'))
+        self.assertIs(recordsets[2], index.remove('rs-3'))
+
+
+class BuildRecordsetIndexTest(base.TestCase):
+
+    def app(self, request):
+        if 'marker=rs-2' in request.path:
+            return 200, {}, {'recordsets': RECORDSETS[2:], 'links': {}}
+        path = request.path.split('?')[0]
+        return 200, {}, {
+            'recordsets': RECORDSETS[:2],
+            'links': {'next': self.server.url + path +
+                      '?limit=2&marker=rs-2'}}
+
+    def setUp(self):
+        super(BuildRecordsetIndexTest, self).setUp()
+        self.client = self.make_client(recordset_client.RecordsetClient)
+
+    def test_zone(self):
+        index = self.client.build_recordset_index('zone-id', page_size=2)
+
+        self.assertEqual(4, len(index))
+        self.assertEqual('rs-4', index.find(
+            'www.example.org.', 'A', zone_id='other-zone-id')['id'])
+        self.assertTrue(self.server.requests[0].path.startswith(
+            '/v2/zones/zone-id/recordsets'))
+        self.assertEqual(2, len(self.server.requests))
+
+    def test_all_zones(self):
+        index = self.client.build_recordset_index(page_size=2)
+
+        self.assertEqual(4, len(index))
+        self.assertTrue(self.server.requests[0].path.startswith(
+            '/v2/recordsets'))
@@ -0,0 +1,104 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+from designate_tempest_plugin.common import http_pool
+from designate_tempest_plugin.common import metrics
+from designate_tempest_plugin.common import retry
+from designate_tempest_plugin.services.dns.v2.json import zone_exports_client
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+
+class _Samples(metrics.RequestObserver):
+
+    def __init__(self):
+        self.samples = []
+
+    def observe(self, sample):
+        self.samples.append(sample)
+
+
+class RetryTest(base.TestCase):
+
+    def app(self, request):
+        if len(self.server.requests) == 1:
+            return 503, {'Retry-After': '0'}, {'code': 503}
+        return 200, {}, {'id': 'zone-id'}
+
+    def setUp(self):
+        super(RetryTest, self).setUp()
+        self.observer = _Samples()
+        metrics.add_observer(self.observer)
+        self.addCleanup(metrics.remove_observer, self.observer)
+
+    def _show_zone(self, **kwargs):
+        client = self.make_client(zones_client.ZonesClient, **kwargs)
+        client.show_zone('zone-id')
+        return client
+
+    def test_policy_sees_every_retry(self):
+        client = self._show_zone(
+            retry_policy=retry.RetryPolicy(max_retries=1, jitter=False))
+
+        self.assertFalse(client.http_obj.status_retries)
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, self.observer.samples[0].retries)
+
+    def test_policy_sees_every_retry_with_pools(self):
+        client = self._show_zone(
+            retry_policy=retry.RetryPolicy(max_retries=1, jitter=False),
+            connection_pools=http_pool.ConnectionPools())
+
+        self.assertIsInstance(client.http_obj, http_pool.KeepAliveHttp)
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, self.observer.samples[0].retries)
+
+    def test_no_policy(self):
+        # Without a policy, urllib3 keeps retrying on Retry-After.
+        self._show_zone()
+
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(0, self.observer.samples[0].retries)
+
+
+class StreamedRetryTest(base.TestCase):
+
+    def app(self, request):
+        if len(self.server.requests) == 1:
+            return 503, {'Retry-After': '0'}, {'code': 503}
+        if request.path.endswith('/export'):
+            return 200, {'Content-Type': 'text/dns'}, b'zonefile'
+        return 200, {}, {'zones': [{'id': 'zone-id'}], 'links': {}}
+
+    def make_client(self, cls, **kwargs):
+        return super(StreamedRetryTest, self).make_client(
+            cls, retry_policy=retry.RetryPolicy(max_retries=1, jitter=False),
+            connection_pools=http_pool.ConnectionPools(), **kwargs)
+
+    def test_download(self):
+        client = self.make_client(zone_exports_client.ZoneExportsClient)
+
+        _, chunks = client.download_exported_zonefile('export-id')
+
+        self.assertEqual(b'zonefile', b''.join(chunks))
+        self.assertEqual(2, len(self.server.requests))
+        # The connection of the retried response went back to the pool.
+        self.assertEqual(1, client.connection_stats()['new_connections'])
+
+    def test_streamed_list(self):
+        client = self.make_client(zones_client.ZonesClient)
+        client.stream_list_bodies = True
+
+        self.assertEqual(['zone-id'],
+                         [zone['id'] for zone in client.iter_zones()])
+        self.assertEqual(2, len(self.server.requests))
@@ -0,0 +1,59 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import testtools
+
+from designate_tempest_plugin.common import routes
+
+
+class RouteTest(testtools.TestCase):
+
+    def test_build(self):
+        route = routes.get_route('v2', 'zones')
+        self.assertEqual('v2/zones', route.build())
+        self.assertEqual('v2/zones/zone-id', route.build('zone-id'))
+        self.assertEqual('v2/zones:zone-id',
+                         route.build('zone-id', uuid_prefix_char=':'))
+        self.assertEqual('v2/zones?limit=10&marker=zone-id',
+                         route.build(params={'limit': 10,
+                                             'marker': 'zone-id'}))
+
+    def test_build_params_of_equal_values(self):
+        # True, 1 and 1.0 are equal and hash alike, but are encoded
+        # differently.
+        route = routes.get_route('v2', 'zones')
+        self.assertEqual('v2/zones?all_projects=True',
+                         route.build(params={'all_projects': True}))
+        self.assertEqual('v2/zones?all_projects=1',
+                         route.build(params={'all_projects': 1}))
+        self.assertEqual('v2/zones?limit=False',
+                         route.build(params={'limit': False}))
+        self.assertEqual('v2/zones?limit=0',
+                         route.build(params={'limit': 0}))
+
+    def test_routes_are_cached_per_template(self):
+        zone_ids = ['%08d-0000-4000-8000-000000000000' % i for i in range(3)]
+        routes.get_route.cache_clear()
+
+        for zone_id in zone_ids:
+            template, ids = routes.split_ids(
+                'zones/{0}/recordsets'.format(zone_id))
+            self.assertEqual('zones/{}/recordsets', template)
+            self.assertEqual(
+                'v2/zones/%s/recordsets/rs-id' % zone_id,
+                routes.get_route('v2', template).build('rs-id', ids=ids))
+
+        self.assertEqual(1, routes.get_route.cache_info().misses)
+
+    def test_split_ids_without_ids(self):
+        self.assertEqual(('zones', ()), routes.split_ids('zones'))
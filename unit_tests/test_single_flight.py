@@ -0,0 +1,194 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import threading
+from unittest import mock
+
+from tempest.lib import exceptions as lib_exc
+import testtools
+
+from designate_tempest_plugin.common import single_flight
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+
+class _Event(threading.Event):
+    """An event reporting the threads starting to wait for it."""
+
+    def __init__(self, waiting):
+        super(_Event, self).__init__()
+        self._waiting = waiting
+
+    def wait(self, timeout=None):
+        self._waiting.release()
+        return super(_Event, self).wait(timeout)
+
+
+class _Callers(object):
+    """Issues calls from threads and tracks the ones joining a flight."""
+
+    def __init__(self, test):
+        self.results = []
+        self._threads = []
+        self._waiting = threading.Semaphore(0)
+        waiting = self._waiting
+
+        class Call(single_flight._Call):
+            def __init__(self):
+                super(Call, self).__init__()
+                self.done = _Event(waiting)
+
+        patcher = mock.patch.object(single_flight, '_Call', Call)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+    def start(self, func, *args, **kwargs):
+        def run():
+            try:
+                self.results.append(func(*args, **kwargs))
+            except Exception as e:
+                self.results.append(e)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def wait_for_followers(self, count):
+        """Wait until count callers wait for the call in flight."""
+        for _ in range(count):
+            if not self._waiting.acquire(timeout=10):
+                raise AssertionError('The callers did not join the flight')
+
+    def join(self):
+        for thread in self._threads:
+            thread.join(10)
+
+
+class SingleFlightTest(testtools.TestCase):
+
+    def setUp(self):
+        super(SingleFlightTest, self).setUp()
+        self.flights = single_flight.SingleFlight()
+        self.callers = _Callers(self)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def func(self, value, error=None):
+        self.calls.append(value)
+        self.started.set()
+        self.release.wait(10)
+        if error is not None:
+            raise error
+        return value
+
+    def start_flight(self, key, *args, **kwargs):
+        self.callers.start(self.flights.do, key, self.func, *args, **kwargs)
+        self.assertTrue(self.started.wait(10))
+
+    def test_concurrent_calls_are_coalesced(self):
+        self.start_flight('key', 1)
+        for value in (2, 3, 4):
+            self.callers.start(self.flights.do, 'key', self.func, value)
+        self.callers.wait_for_followers(3)
+
+        self.release.set()
+        self.callers.join()
+
+        self.assertEqual([1], self.calls)
+        self.assertEqual([1, 1, 1, 1], self.callers.results)
+
+    def test_error_is_delivered_to_every_caller(self):
+        error = ValueError('failed')
+        self.start_flight('key', 1, error=error)
+        for _ in range(3):
+            self.callers.start(self.flights.do, 'key', self.func, 2)
+        self.callers.wait_for_followers(3)
+
+        self.release.set()
+        self.callers.join()
+
+        self.assertEqual([1], self.calls)
+        self.assertEqual([error] * 4, self.callers.results)
+
+    def test_different_keys_are_not_coalesced(self):
+        self.release.set()
+
+        self.assertEqual(1, self.flights.do('a', self.func, 1))
+        self.assertEqual(2, self.flights.do('b', self.func, 2))
+        self.assertEqual([1, 2], self.calls)
+
+    def test_later_calls_are_not_coalesced(self):
+        self.release.set()
+
+        self.assertEqual(1, self.flights.do('key', self.func, 1))
+        self.assertRaises(ValueError, self.flights.do, 'key', self.func, 2,
+                          error=ValueError())
+        self.assertEqual(3, self.flights.do('key', self.func, 3))
+        self.assertEqual([1, 2, 3], self.calls)
+
+
+class CoalescedGetTest(base.TestCase):
+
+    def setUp(self):
+        super(CoalescedGetTest, self).setUp()
+        self.callers = _Callers(self)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.status = 200
+
+    def app(self, request):
+        self.started.set()
+        self.release.wait(10)
+        if self.status != 200:
+            return self.status, {}, {'code': self.status, 'type': 'error'}
+        return 200, {}, {'id': 'zone-id', 'name': 'example.org.'}
+
+    def make_zones_client(self):
+        client = self.make_client(zones_client.ZonesClient)
+        client.coalesce_gets = True
+        return client
+
+    def show_zones(self, count):
+        clients = [self.make_zones_client() for _ in range(count)]
+        self.callers.start(clients[0].show_zone, 'zone-id')
+        self.assertTrue(self.started.wait(10))
+        for client in clients[1:]:
+            self.callers.start(client.show_zone, 'zone-id')
+        self.callers.wait_for_followers(count - 1)
+
+        self.release.set()
+        self.callers.join()
+        return self.callers.results
+
+    def test_identical_gets_make_one_request(self):
+        results = self.show_zones(4)
+
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(4, len(results))
+        for resp, body in results:
+            self.assertEqual(200, resp.status)
+            self.assertEqual('zone-id', body['id'])
+        # Every caller gets its own copy of the body.
+        results[0][1]['id'] = 'changed'
+        self.assertEqual('zone-id', results[1][1]['id'])
+
+    def test_error_is_raised_to_every_caller(self):
+        self.status = 404
+
+        results = self.show_zones(3)
+
+        self.assertEqual(1, len(self.server.requests))
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.assertIsInstance(result, lib_exc.NotFound)
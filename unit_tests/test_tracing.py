@@ -0,0 +1,142 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import testtools
+
+from designate_tempest_plugin.common import tracing
+from designate_tempest_plugin.common import waiters
+from designate_tempest_plugin.services.dns.v2.json import zones_client
+from unit_tests import base
+
+
+class TracerTest(testtools.TestCase):
+
+    def setUp(self):
+        super(TracerTest, self).setUp()
+        self.tracer = tracing.Tracer()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def read_trace(self):
+        path = os.path.join(self.tmp_dir, 'traces', 'trace.json')
+        self.tracer.write(path)
+        with open(path) as f:
+            return json.load(f)
+
+    def test_trace_file(self):
+        self.tracer.complete('GET v2/zones', 'api', 1.5, 1.75,
+                             args={'status': 200})
+        self.tracer.complete('query', 'dns', 2.0, 2.5)
+
+        trace = self.read_trace()
+
+        self.assertEqual({'traceEvents', 'displayTimeUnit'}, set(trace))
+        self.assertEqual('ms', trace['displayTimeUnit'])
+        thread = threading.current_thread()
+        metadata, api, dns = trace['traceEvents']
+        self.assertEqual({'name': 'thread_name', 'ph': 'M',
+                          'pid': os.getpid(), 'tid': thread.ident,
+                          'args': {'name': thread.name}}, metadata)
+        self.assertEqual({'name': 'GET v2/zones', 'cat': 'api', 'ph': 'X',
+                          'ts': 1500000.0, 'dur': 250000.0,
+                          'pid': os.getpid(), 'tid': thread.ident,
+                          'args': {'status': 200}}, api)
+        self.assertNotIn('args', dns)
+        self.assertEqual(500000.0, dns['dur'])
+
+    def test_one_track_per_thread(self):
+        def run():
+            self.tracer.complete('query', 'dns', 1.0, 2.0)
+
+        thread = threading.Thread(target=run, name='worker')
+        thread.start()
+        thread.join()
+        run()
+        run()
+
+        events = self.read_trace()['traceEvents']
+
+        names = [e['args']['name'] for e in events if e['ph'] == 'M']
+        self.assertEqual(['worker', threading.current_thread().name], names)
+        tids = {e['tid'] for e in events if e['ph'] == 'X'}
+        self.assertEqual({thread.ident, threading.current_thread().ident},
+                         tids)
+        self.assertEqual(3, sum(1 for e in events if e['ph'] == 'X'))
+
+    def test_span(self):
+        with self.tracer.span('sleep', 'wait', args={'seconds': 0}):
+            pass
+        try:
+            with self.tracer.span('failed', 'wait'):
+                raise ValueError()
+        except ValueError:
+            pass
+
+        events = self.read_trace()['traceEvents'][1:]
+
+        self.assertEqual(['sleep', 'failed'], [e['name'] for e in events])
+        self.assertEqual({'seconds': 0}, events[0]['args'])
+        for event in events:
+            self.assertGreaterEqual(event['dur'], 0)
+
+    def test_traced(self):
+        @tracing.traced('wait')
+        def wait_for_nothing(value):
+            return value
+
+        self.assertEqual(1, wait_for_nothing(1))
+
+        tracing.use(self.tracer)
+        self.addCleanup(tracing.use, None)
+        self.assertEqual(2, wait_for_nothing(2))
+
+        events = self.read_trace()['traceEvents'][1:]
+        self.assertEqual([('wait_for_nothing', 'wait')],
+                         [(e['name'], e['cat']) for e in events])
+
+
+class ClientTracingTest(base.TestCase):
+
+    def app(self, request):
+        return 404, {}, {'code': 404, 'type': 'zone_not_found'}
+
+    def setUp(self):
+        super(ClientTracingTest, self).setUp()
+        self.tracer = tracing.Tracer()
+        tracing.use(self.tracer)
+        self.addCleanup(tracing.use, None)
+        self.client = self.make_client(zones_client.ZonesClient,
+                                       build_interval=0)
+
+    def test_waiter(self):
+        waiters.wait_for_zone_404(self.client,
+                                  'a86dba58-0043-4cc6-a1bb-69d5e86f3ca3')
+
+        events = [e for e in self.tracer._events if e['ph'] == 'X']
+        self.assertEqual(
+            [('sleep', 'wait'), ('GET v2/zones/{id}', 'api'),
+             ('wait_for_zone_404', 'wait')],
+            [(e['name'], e['cat']) for e in events])
+        self.assertEqual({'status': 404, 'retries': 0, 'queue_delay': 0.0},
+                         events[1]['args'])
+        # The waiter span encloses the request.
+        wait, api = events[2], events[1]
+        self.assertLessEqual(wait['ts'], api['ts'])
+        self.assertGreaterEqual(wait['ts'] + wait['dur'],
+                                api['ts'] + api['dur'])
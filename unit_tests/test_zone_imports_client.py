@@ -0,0 +1,118 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import asyncio
+import gzip
+import io
+import json
+import os
+import tempfile
+
+from designate_tempest_plugin.common import zonefile_mmap
+from designate_tempest_plugin.services.dns.v2.aio import (
+    zone_imports_client as aio_zone_imports_client)
+from designate_tempest_plugin.services.dns.v2.json import zone_imports_client
+from unit_tests import base
+
+ZONEFILE = '$ORIGIN example.org.\nexample.org. 300 IN NS ns.example.org.\n'
+
+
+class ZoneImportsClientTest(base.TestCase):
+
+    def app(self, request):
+        return 202, {}, {'id': 'import-id', 'status': 'PENDING'}
+
+    def setUp(self):
+        super(ZoneImportsClientTest, self).setUp()
+        self.client = self.make_client(zone_imports_client.ZoneImportsClient)
+
+    def test_create_zone_import(self):
+        resp, body = self.client.create_zone_import(ZONEFILE)
+
+        self.assertEqual('import-id', body['id'])
+        request = self.server.requests[0]
+        self.assertEqual('POST', request.method)
+        self.assertEqual('/v2/zones/tasks/imports', request.path)
+        self.assertEqual('text/dns', request.headers['Content-Type'])
+        self.assertNotIn('Transfer-Encoding', request.headers)
+        self.assertEqual(ZONEFILE.encode('utf-8'), request.body)
+
+    def test_create_zone_import_with_attributes(self):
+        attributes = {'pool_id': 'pool-id'}
+        self.client.create_zone_import(ZONEFILE, attributes=attributes)
+
+        request = self.server.requests[0]
+        self.assertEqual('application/json', request.headers['Content-Type'])
+        self.assertNotIn('Transfer-Encoding', request.headers)
+        self.assertEqual({'zonefile': ZONEFILE, 'attributes': attributes},
+                         json.loads(request.body))
+
+    def test_create_zone_import_streamed(self):
+        self.client.create_zone_import(io.BytesIO(ZONEFILE.encode('utf-8')))
+
+        request = self.server.requests[0]
+        self.assertEqual('text/dns', request.headers['Content-Type'])
+        self.assertEqual('chunked', request.headers['Transfer-Encoding'])
+        self.assertEqual(ZONEFILE.encode('utf-8'), request.body)
+
+    def test_create_zone_import_streamed_iterable(self):
+        self.client.create_zone_import(iter(ZONEFILE.splitlines(True)))
+
+        self.assertEqual(ZONEFILE.encode('utf-8'),
+                         self.server.requests[0].body)
+
+    def test_create_zone_import_compressed(self):
+        self.client.create_zone_import(ZONEFILE, compress=True)
+
+        request = self.server.requests[0]
+        self.assertEqual('gzip', request.headers['Content-Encoding'])
+        self.assertEqual('chunked', request.headers['Transfer-Encoding'])
+        self.assertEqual(ZONEFILE.encode('utf-8'),
+                         gzip.decompress(request.body))
+
+    def test_create_zone_import_streamed_with_attributes(self):
+        self.assertRaises(
+            ValueError, self.client.create_zone_import,
+            io.StringIO(ZONEFILE), attributes={'pool_id': 'pool-id'})
+        self.assertRaises(
+            ValueError, self.client.create_zone_import,
+            ZONEFILE, attributes={'pool_id': 'pool-id'}, compress=True)
+        self.assertEqual([], self.server.requests)
+
+    def test_create_zone_import_empty_mapped_file(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        with zonefile_mmap.MappedZoneFile(path) as zonefile:
+            self.client.create_zone_import(zonefile)
+
+        self.assertEqual(b'', self.server.requests[0].body)
+
+    def test_async_create_zone_import_streamed(self):
+        async def create_zone_import():
+            async with aio_zone_imports_client.AsyncZoneImportsClient(
+                    self.client) as client:
+                await client.create_zone_import(
+                    io.BytesIO(ZONEFILE.encode('utf-8')))
+                await client.create_zone_import(ZONEFILE, compress=True)
+
+        asyncio.run(create_zone_import())
+
+        streamed, compressed = self.server.requests
+        self.assertEqual('text/dns', streamed.headers['Content-Type'])
+        self.assertEqual('chunked', streamed.headers['Transfer-Encoding'])
+        self.assertEqual(ZONEFILE.encode('utf-8'), streamed.body)
+        self.assertEqual('gzip', compressed.headers['Content-Encoding'])
+        self.assertEqual(ZONEFILE.encode('utf-8'),
+                         gzip.decompress(compressed.body))
@@ -0,0 +1,99 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import testtools
+
+from designate_tempest_plugin.common import models
+from designate_tempest_plugin.common import zonefile_diff
+
+
+def _zonefile(*records):
+    return models.ZoneFile('example.org.', 300, [
+        models.ZoneFileRecord(*record) for record in records])
+
+
+class ZoneFileDiffTest(testtools.TestCase):
+
+    def test_matching(self):
+        recordsets = [
+            {'name': 'www.example.org.', 'type': 'A',
+             'records': ['192.0.2.1', '192.0.2.2']},
+            {'name': 'example.org.', 'type': 'MX',
+             'records': ['10 Mail.Example.org.']},
+            {'name': 'v6.example.org.', 'type': 'AAAA',
+             'records': ['2001:db8:0:0:0:0:0:1']},
+            {'name': 'example.org.', 'type': 'TXT',
+             'records': ['"two  blanks"   "and more"']}]
+        zonefile = _zonefile(
+            ('WWW.example.org.', 'A', '192.0.2.2'),
+            ('www.example.org', 'A', '192.0.2.1'),
+            ('example.org.', 'MX', '10 mail.example.org.'),
+            ('v6.example.org.', 'AAAA', '2001:db8::1'),
+            ('example.org.', 'TXT', '"two  blanks" "and more"'))
+
+        diff = zonefile_diff.ZoneFileDiff(recordsets, zonefile)
+
+        self.assertFalse(diff)
+        self.assertEqual({}, diff.missing)
+        self.assertEqual('No differences', str(diff))
+
+    def test_missing_record(self):
+        old = _zonefile(('www.example.org.', 'A', '192.0.2.1'),
+                        ('www.example.org.', 'A', '192.0.2.2'),
+                        ('ftp.example.org.', 'A', '192.0.2.3'))
+        new = _zonefile(('www.example.org.', 'A', '192.0.2.1'),
+                        ('www.example.org.', 'A', '192.0.2.9'),
+                        ('mail.example.org.', 'A', '192.0.2.4'))
+
+        diff = zonefile_diff.ZoneFileDiff(old, new)
+
+        self.assertTrue(diff)
+        self.assertEqual({('ftp.example.org.', 'A'): {'192.0.2.3'},
+                          ('www.example.org.', 'A'): {'192.0.2.2'}},
+                         diff.missing)
+        self.assertEqual({('mail.example.org.', 'A'): {'192.0.2.4'}},
+                         diff.added)
+        self.assertEqual(
+            '+ mail.example.org. A 192.0.2.4\n'
+            '- ftp.example.org. A 192.0.2.3\n'
+            '~ www.example.org. A 192.0.2.1, 192.0.2.2 -> '
+            '192.0.2.1, 192.0.2.9', str(diff))
+
+    def test_extra_records_are_not_missing(self):
+        old = _zonefile(('www.example.org.', 'A', '192.0.2.1'))
+        new = _zonefile(('www.example.org.', 'A', '192.0.2.1'),
+                        ('www.example.org.', 'A', '192.0.2.2'))
+
+        diff = zonefile_diff.ZoneFileDiff(old, new)
+
+        self.assertTrue(diff)
+        self.assertEqual({}, diff.missing)
+
+    def test_sources(self):
+        records = [models.ZoneFileRecord('www.example.org.', 'A',
+                                         '192.0.2.1'),
+                   models.ZoneFileRecord('example.org.', 'SOA', 'soa data')]
+        expected = {('www.example.org.', 'A'): {'192.0.2.1'}}
+
+        # A ZoneFile, through its records attribute, a plain iterable of
+        # records, even a generator, and API recordsets.
+        for source in (_zonefile(*[(r.name, r.type, r.data)
+                                   for r in records]),
+                       records, iter(records),
+                       [{'name': 'www.example.org.', 'type': 'a',
+                         'records': ['192.0.2.1']},
+                        {'name': 'example.org.', 'type': 'SOA',
+                         'records': ['soa data']}]):
+            self.assertEqual(
+                expected,
+                zonefile_diff.index_rrsets(source, ignore_types=['soa']))
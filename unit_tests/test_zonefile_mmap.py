@@ -0,0 +1,178 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import testtools
+
+from designate_tempest_plugin.common import models
+from designate_tempest_plugin.common import zonefile_mmap
+from designate_tempest_plugin.common import zonefile_parser
+from designate_tempest_plugin.services.dns.v2.json import zone_imports_client
+from unit_tests import base
+
+ZONEFILE = ('$ORIGIN example.org.\n'
+            '$TTL 300\n'
+            'example.org. IN NS ns.example.org.\n'
+            'txt IN TXT "café"\r\n'
+            'www IN A 192.0.2.1')
+
+
+def _write_file(test, data):
+    fd, path = tempfile.mkstemp()
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    test.addCleanup(os.remove, path)
+    return path
+
+
+class MappedZoneFileTest(testtools.TestCase):
+
+    def open(self, data):
+        zonefile = zonefile_mmap.MappedZoneFile(_write_file(self, data))
+        self.addCleanup(zonefile.close)
+        return zonefile
+
+    def test_view(self):
+        zonefile = self.open(ZONEFILE.encode('utf-8'))
+
+        self.assertEqual(len(ZONEFILE.encode('utf-8')), len(zonefile))
+        self.assertEqual(ZONEFILE.encode('utf-8'), bytes(zonefile.view()))
+        self.assertFalse(zonefile.closed)
+
+    def test_iter_lines(self):
+        zonefile = self.open(ZONEFILE.encode('utf-8'))
+
+        self.assertEqual(ZONEFILE.replace('\r', '').split('\n'),
+                         list(zonefile.iter_lines()))
+
+    def test_iter_lines_in_small_windows(self):
+        zonefile = self.open(ZONEFILE.encode('utf-8'))
+
+        # Windows shorter than the lines, or ending on a multi-byte UTF-8
+        # sequence, are extended to the end of the line.
+        for size in (1, 5, 16, 30):
+            with mock.patch.object(zonefile_mmap, 'WINDOW_SIZE', size):
+                self.assertEqual(ZONEFILE.replace('\r', '').split('\n'),
+                                 list(zonefile.iter_lines()))
+
+    def test_blank_lines(self):
+        zonefile = self.open(b'\n\nwww A 192.0.2.1\n\n')
+
+        self.assertEqual(['', '', 'www A 192.0.2.1', ''],
+                         list(zonefile.iter_lines()))
+
+    def test_empty_file(self):
+        zonefile = self.open(b'')
+
+        self.assertEqual(0, len(zonefile))
+        self.assertEqual(b'', bytes(zonefile.view()))
+        self.assertEqual([], list(zonefile.iter_lines()))
+        self.assertEqual([], list(zonefile_parser.ZoneFileParser(zonefile)))
+        zonefile.close()
+        self.assertTrue(zonefile.closed)
+
+    def test_close(self):
+        path = _write_file(self, ZONEFILE.encode('utf-8'))
+
+        with zonefile_mmap.MappedZoneFile(path) as zonefile:
+            pass
+
+        self.assertTrue(zonefile.closed)
+        self.assertRaises(ValueError, zonefile.view)
+        zonefile.close()
+
+    def test_close_with_referenced_view(self):
+        zonefile = self.open(ZONEFILE.encode('utf-8'))
+        view = zonefile.view()[:10]
+
+        self.assertRaises(BufferError, zonefile.close)
+        view.release()
+
+    def test_parse(self):
+        zonefile = self.open(ZONEFILE.encode('utf-8'))
+
+        parsed = models.ZoneFile.from_stream(zonefile)
+
+        self.assertEqual('example.org.', parsed.origin)
+        self.assertEqual(300, parsed.ttl)
+        self.assertEqual([
+            models.ZoneFileRecord('example.org.', 'NS', 'ns.example.org.'),
+            models.ZoneFileRecord('txt.example.org.', 'TXT', '"café"'),
+            models.ZoneFileRecord('www.example.org.', 'A', '192.0.2.1'),
+        ], parsed.records)
+
+    def test_include(self):
+        include_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, include_dir)
+        with open(os.path.join(include_dir, 'hosts.db'), 'wb') as f:
+            f.write(b'www A 192.0.2.1\n')
+
+        records = list(zonefile_parser.ZoneFileParser(
+            '$ORIGIN example.org.\n$INCLUDE hosts.db\n',
+            include_dir=include_dir))
+
+        self.assertEqual([('www.example.org.', None, 'A', '192.0.2.1')],
+                         records)
+
+
+class MappedZoneImportTest(base.TestCase):
+
+    def app(self, request):
+        return 202, {}, {'id': 'import-id', 'status': 'PENDING'}
+
+    def setUp(self):
+        super(MappedZoneImportTest, self).setUp()
+        self.client = self.make_client(zone_imports_client.ZoneImportsClient)
+        self.zonefile = zonefile_mmap.MappedZoneFile(
+            _write_file(self, ZONEFILE.encode('utf-8')))
+        self.addCleanup(self.zonefile.close)
+
+    def test_upload(self):
+        self.client.create_zone_import(self.zonefile)
+
+        request = self.server.requests[0]
+        self.assertEqual('text/dns', request.headers['Content-Type'])
+        self.assertNotIn('Transfer-Encoding', request.headers)
+        self.assertEqual(str(len(self.zonefile)),
+                         request.headers['Content-Length'])
+        self.assertEqual(ZONEFILE.encode('utf-8'), request.body)
+
+    def test_upload_with_attributes(self):
+        attributes = {'pool_id': 'pool-id'}
+
+        self.client.create_zone_import(self.zonefile, attributes=attributes)
+
+        request = self.server.requests[0]
+        self.assertEqual('application/json', request.headers['Content-Type'])
+        self.assertEqual({'zonefile': ZONEFILE, 'attributes': attributes},
+                         json.loads(request.body))
+
+    def test_upload_compressed(self):
+        self.client.create_zone_import(self.zonefile, compress=True)
+
+        request = self.server.requests[0]
+        self.assertEqual('gzip', request.headers['Content-Encoding'])
+        self.assertEqual(ZONEFILE.encode('utf-8'),
+                         gzip.decompress(request.body))
+
+    def test_upload_leaves_the_file_open(self):
+        self.client.create_zone_import(self.zonefile)
+
+        self.assertFalse(self.zonefile.closed)
+        self.zonefile.close()
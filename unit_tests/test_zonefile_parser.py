@@ -0,0 +1,211 @@
+# Copyright 2026 Red Hat
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import io
+import os
+import shutil
+import tempfile
+
+import testtools
+
+from designate_tempest_plugin.common import models
+from designate_tempest_plugin.common import zonefile_parser
+
+ZONEFILE = '''$ORIGIN example.org.
+$TTL 1h
+@ IN SOA ns1.example.org. admin.example.org. (
+        2026101901 ; serial
+        7200       ; refresh
+        3600 1209600
+        300 )
+  IN NS ns1
+www 600 IN A 192.0.2.1
+        A 192.0.2.2
+mail.example.net. IN A 192.0.2.3
+txt IN TXT "v=spf1 ; not a comment" ; a comment
+'''
+
+
+def _parse(source, **kwargs):
+    return list(zonefile_parser.ZoneFileParser(source, **kwargs))
+
+
+class ParseTTLTest(testtools.TestCase):
+
+    def test_parse_ttl(self):
+        self.assertEqual(300, zonefile_parser.parse_ttl('300'))
+        self.assertEqual(5400, zonefile_parser.parse_ttl('1h30m'))
+        self.assertEqual(691200, zonefile_parser.parse_ttl('1W1D'))
+
+    def test_invalid_ttl(self):
+        for ttl in ('', 'h', '1x', '1h 2m'):
+            self.assertRaises(ValueError, zonefile_parser.parse_ttl, ttl)
+
+
+class ZoneFileParserTest(testtools.TestCase):
+
+    def test_parse(self):
+        parser = zonefile_parser.ZoneFileParser(ZONEFILE)
+
+        self.assertEqual([
+            ('example.org.', 3600, 'SOA',
+             'ns1.example.org. admin.example.org. 2026101901 7200 3600 '
+             '1209600 300'),
+            ('example.org.', 3600, 'NS', 'ns1'),
+            ('www.example.org.', 600, 'A', '192.0.2.1'),
+            ('www.example.org.', 3600, 'A', '192.0.2.2'),
+            ('mail.example.net.', 3600, 'A', '192.0.2.3'),
+            ('txt.example.org.', 3600, 'TXT', '"v=spf1 ; not a comment"'),
+        ], list(parser))
+        self.assertEqual('example.org.', parser.zone_origin)
+        self.assertEqual(3600, parser.zone_ttl)
+
+    def test_origin_changes(self):
+        records = _parse('$ORIGIN example.org.\n'
+                         'www A 192.0.2.1\n'
+                         '$ORIGIN sub\n'
+                         'www A 192.0.2.2\n'
+                         '@ A 192.0.2.3\n')
+
+        self.assertEqual(['www.example.org.', 'www.sub.example.org.',
+                          'sub.example.org.'],
+                         [name for name, _, _, _ in records])
+
+    def test_initial_origin_and_ttl(self):
+        records = _parse('www A 192.0.2.1\n', origin='example.org', ttl=60)
+
+        self.assertEqual([('www.example.org.', 60, 'A', '192.0.2.1')],
+                         records)
+
+    def test_relative_names_without_origin(self):
+        self.assertEqual('www', _parse('www A 192.0.2.1\n')[0][0])
+        self.assertRaises(ValueError, _parse, '@ A 192.0.2.1\n')
+
+    def test_escaped_trailing_dot_is_relative(self):
+        records = _parse('$ORIGIN example.org.\nw\\. A 192.0.2.1\n')
+
+        self.assertEqual('w\\..example.org.', records[0][0])
+
+    def test_ttl_and_class_in_any_order(self):
+        records = _parse('$ORIGIN example.org.\n'
+                         'a IN 60 A 192.0.2.1\n'
+                         'b 60 IN A 192.0.2.2\n'
+                         'c A 192.0.2.3\n')
+
+        # Without $TTL, the last explicit TTL applies.
+        self.assertEqual([60, 60, 60], [ttl for _, ttl, _, _ in records])
+
+    def test_comments_and_blank_lines(self):
+        records = _parse('; a comment\n'
+                         '\n'
+                         '$ORIGIN example.org. ; the origin\n'
+                         '   \n'
+                         'www A 192.0.2.1 ; the address\n')
+
+        self.assertEqual([('www.example.org.', None, 'A', '192.0.2.1')],
+                         records)
+
+    def test_quoted_strings(self):
+        records = _parse('$ORIGIN example.org.\n'
+                         'txt TXT "a \\" ; (quote)"   "two  blanks"\n')
+
+        self.assertEqual('"a \\" ; (quote)" "two  blanks"', records[0][3])
+
+    def test_crlf_lines(self):
+        records = _parse('$ORIGIN example.org.\r\nwww A 192.0.2.1\r\n')
+
+        self.assertEqual([('www.example.org.', None, 'A', '192.0.2.1')],
+                         records)
+
+    def test_sources(self):
+        expected = _parse(ZONEFILE)
+        data = ZONEFILE.encode('utf-8')
+
+        for source in (data, io.StringIO(ZONEFILE), io.BytesIO(data),
+                       iter(ZONEFILE.splitlines(True))):
+            self.assertEqual(expected, _parse(source))
+
+    def test_bytes_chunks_split_anywhere(self):
+        zonefile = ('$ORIGIN example.org.\n'
+                    'txt TXT "café ☃"\n'
+                    'www A 192.0.2.1\n')
+        data = zonefile.encode('utf-8')
+        expected = _parse(zonefile)
+
+        # Chunks split in the middle of lines and of UTF-8 sequences.
+        for size in (1, 2, 3, 5, 7):
+            chunks = [data[i:i + size] for i in range(0, len(data), size)]
+            self.assertEqual(expected, _parse(iter(chunks)))
+
+    def test_last_line_without_newline(self):
+        records = _parse('$ORIGIN example.org.\nwww A 192.0.2.1')
+
+        self.assertEqual(1, len(records))
+
+    def test_zonefile_from_text(self):
+        zonefile = models.ZoneFile.from_text(ZONEFILE)
+
+        self.assertEqual('example.org.', zonefile.origin)
+        self.assertEqual(3600, zonefile.ttl)
+        self.assertEqual(6, len(zonefile.records))
+
+    def test_malformed(self):
+        for zonefile in (
+                # Unbalanced parentheses.
+                'www A ( 192.0.2.1\n',
+                'www A 192.0.2.1 )\n',
+                # No owner for the first record.
+                '  A 192.0.2.1\n',
+                # Missing type.
+                'www 300 IN\n',
+                # Unsupported class and directive.
+                'www CH A 192.0.2.1\n',
+                '$GENERATE 1-2 www$ A 192.0.2.$\n',
+                # Missing directive values.
+                '$ORIGIN\n',
+                '$TTL\n',
+                # Invalid TTL.
+                '$TTL 1x\n'):
+            self.assertRaises(ValueError, _parse, zonefile)
+
+
+class IncludeTest(testtools.TestCase):
+
+    def setUp(self):
+        super(IncludeTest, self).setUp()
+        self.include_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.include_dir)
+        with open(os.path.join(self.include_dir, 'hosts.db'), 'w') as f:
+            f.write('www A 192.0.2.1\n')
+
+    def test_include(self):
+        records = _parse('$ORIGIN example.org.\n'
+                         '$INCLUDE hosts.db\n'
+                         '$INCLUDE hosts.db sub\n',
+                         include_dir=self.include_dir)
+
+        self.assertEqual(['www.example.org.', 'www.sub.example.org.'],
+                         [name for name, _, _, _ in records])
+
+    def test_include_refused(self):
+        zonefile = '$INCLUDE hosts.db\n'
+        self.assertRaises(ValueError, _parse, zonefile)
+        self.assertRaises(ValueError, _parse, '$INCLUDE ../hosts.db\n',
+                          include_dir=self.include_dir)
+
+    def test_include_loop(self):
+        with open(os.path.join(self.include_dir, 'loop.db'), 'w') as f:
+            f.write('$INCLUDE loop.db\n')
+
+        self.assertRaises(ValueError, _parse, '$INCLUDE loop.db\n',
+                          include_dir=self.include_dir)